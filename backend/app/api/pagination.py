@@ -0,0 +1,95 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple, Type
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Response header carrying the cursor for the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Columns every keyset query needs, whether or not the caller asked for them
+KEYSET_COLUMNS = ("created_at", "id")
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Opaque cursor pointing just past (created_at, id)"""
+    raw = json.dumps([created_at.isoformat(), row_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def encode_offset_cursor(offset: int) -> str:
+    """Cursor for ranked results, which have no stable keyset"""
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset}).encode("utf-8")).decode("ascii")
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    try:
+        return max(0, int(json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))["offset"]))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_filter(model, cursor: str, descending: bool = True):
+    """Filter for rows that come after the cursor in (created_at, id) order"""
+    created_at, row_id = decode_cursor(cursor)
+    if descending:
+        return or_(
+            model.created_at < created_at,
+            and_(model.created_at == created_at, model.id < row_id)
+        )
+    return or_(
+        model.created_at > created_at,
+        and_(model.created_at == created_at, model.id > row_id)
+    )
+
+
+def keyset_order(model, descending: bool = True) -> Sequence[Any]:
+    if descending:
+        return (model.created_at.desc(), model.id.desc())
+    return (model.created_at.asc(), model.id.asc())
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> List[str]:
+    """Validate a comma-separated sparse field list against a response schema"""
+    allowed = list(schema.model_fields)
+    if not fields:
+        return allowed
+
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return requested
+
+
+def select_columns(model, fields: List[str]) -> List[Any]:
+    """Model columns for the requested fields plus the keyset columns"""
+    names = list(dict.fromkeys([*fields, *KEYSET_COLUMNS]))
+    return [getattr(model, name) for name in names]
+
+
+def paginated_response(rows: Sequence[Any], limit: int, fields: List[str]) -> JSONResponse:
+    """Serialize one page (fetched with limit + 1 rows) and attach the next cursor"""
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last["created_at"], last["id"])
+
+    items = [{field: row[field] for field in fields} for row in rows]
+    return JSONResponse(content=jsonable_encoder(items), headers=headers)
@@ -1,145 +1,213 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.models.database import get_db, Task, Meeting
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from fastapi.responses import FileResponse
-import tempfile
-import os
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.database import get_db, SessionLocal, Task, Meeting
+from app.services.pdf_service import pdf_service, meeting_to_report_data, task_to_report_data
+from app.services.cache_service import export_cache, export_etag, etag_matches
+from app.services.metrics_service import stage
 from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
+import json
+import zipfile
 
 router = APIRouter()
 
+STREAM_CHUNK_SIZE = 64 * 1024
 
-def generate_pdf_report(meeting: Meeting, tasks: list) -> str:
-    """Generate a PDF report for meeting tasks"""
-    # Create temporary file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-    temp_file.close()
+
+def iter_bytes(data: bytes, chunk_size: int = STREAM_CHUNK_SIZE):
+    """Yield an in-memory document in chunks"""
+    view = memoryview(data)
+    for offset in range(0, len(data), chunk_size):
+        yield bytes(view[offset:offset + chunk_size])
+
+
+class _ZipStream:
+    """Write-only sink for zipfile; drained after every member so the archive never sits in memory"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+async def iter_meeting_batches(
+    created_after: Optional[datetime],
+    created_before: Optional[datetime],
+    status: Optional[str],
+    assignee: Optional[str]
+) -> AsyncIterator[List[Tuple[Meeting, List[Task]]]]:
+    """Yield (meeting, tasks) pairs in batches, using two queries per batch"""
+    batch_size = max(1, settings.BULK_EXPORT_BATCH_SIZE)
+    last_key = None
     
-    # Create PDF document
-    doc = SimpleDocTemplate(temp_file.name, pagesize=letter)
-    story = []
-    styles = getSampleStyleSheet()
+    async with SessionLocal() as db:
+        while True:
+            query = select(Meeting)
+            if status:
+                query = query.where(Meeting.status == status)
+            if created_after:
+                query = query.where(Meeting.created_at >= created_after)
+            if created_before:
+                query = query.where(Meeting.created_at < created_before)
+            if assignee:
+                query = query.where(
+                    select(Task.id).where(Task.meeting_id == Meeting.id, Task.assignee_name == assignee).exists()
+                )
+            if last_key:
+                # Keyset continuation in (created_at, id) order
+                query = query.where(
+                    (Meeting.created_at > last_key[0]) | ((Meeting.created_at == last_key[0]) & (Meeting.id > last_key[1]))
+                )
+            
+            meetings = (await db.scalars(
+                query.order_by(Meeting.created_at, Meeting.id).limit(batch_size)
+            )).all()
+            if not meetings:
+                return
+            
+            task_query = select(Task).where(Task.meeting_id.in_([meeting.id for meeting in meetings]))
+            if assignee:
+                task_query = task_query.where(Task.assignee_name == assignee)
+            tasks_by_meeting: Dict[int, List[Task]] = {meeting.id: [] for meeting in meetings}
+            for task in (await db.scalars(task_query.order_by(Task.meeting_id, Task.id))).all():
+                tasks_by_meeting[task.meeting_id].append(task)
+            
+            yield [(meeting, tasks_by_meeting[meeting.id]) for meeting in meetings]
+            
+            last_key = (meetings[-1].created_at, meetings[-1].id)
+            # Release the batch's ORM objects before fetching the next one
+            db.expunge_all()
+
+
+async def stream_ndjson(batches: AsyncIterator[List[Tuple[Meeting, List[Task]]]]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        lines = []
+        for meeting, tasks in batch:
+            lines.append(json.dumps(jsonable_encoder({
+                "meeting_id": meeting.meeting_id,
+                "meeting_url": meeting.meeting_url,
+                "status": meeting.status,
+                "created_at": meeting.created_at,
+                "completed_at": meeting.completed_at,
+                "tasks": [
+                    {
+                        "id": task.id,
+                        **task_to_report_data(task)
+                    } for task in tasks
+                ]
+            })))
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def render_meeting_pdf(meeting: Meeting, tasks: List[Task], use_cache: bool) -> bytes:
+    etag = export_etag("pdf", meeting)
+    pdf_bytes = export_cache.get("pdf", meeting.id, etag) if use_cache else None
+    if pdf_bytes is None:
+        with stage("pdf_render", meeting.meeting_id):
+            pdf_bytes = await pdf_service.render(
+                meeting_to_report_data(meeting),
+                [task_to_report_data(task) for task in tasks]
+            )
+        if use_cache:
+            export_cache.put("pdf", meeting.id, etag, pdf_bytes)
+    return pdf_bytes
+
+
+async def stream_zip(batches: AsyncIterator[List[Tuple[Meeting, List[Task]]]], use_cache: bool) -> AsyncIterator[bytes]:
+    sink = _ZipStream()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        async for batch in batches:
+            # Render the batch concurrently (bounded by the PDF pool), write in order
+            documents = await asyncio.gather(*(
+                render_meeting_pdf(meeting, tasks, use_cache) for meeting, tasks in batch
+            ))
+            for (meeting, _), pdf_bytes in zip(batch, documents):
+                archive.writestr(f"meeting-tasks-{meeting.meeting_id}.pdf", pdf_bytes)
+                yield sink.drain()
+    # Central directory
+    yield sink.drain()
+
+
+@router.get("/bulk")
+async def bulk_export(
+    format: str = Query("ndjson", pattern="^(ndjson|zip)$"),
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    status: Optional[str] = None,
+    assignee: Optional[str] = None
+):
+    """Stream tasks for every matching meeting as NDJSON, or as a ZIP of per-meeting PDFs"""
+    batches = iter_meeting_batches(created_after, created_before, status, assignee)
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1f2937'),
-        spaceBefore=12,
-        spaceAfter=30,
-    )
+    if format == "zip":
+        # PDFs filtered to one assignee differ from the cached full reports
+        return StreamingResponse(
+            stream_zip(batches, use_cache=not assignee),
+            media_type="application/zip",
+            headers={"Content-Disposition": f'attachment; filename="meeting-tasks-{timestamp}.zip"'}
+        )
     
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#374151'),
-        spaceBefore=20,
-        spaceAfter=12,
+    return StreamingResponse(
+        stream_ndjson(batches),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="meeting-tasks-{timestamp}.ndjson"'}
     )
-    
-    # Title
-    title = Paragraph("Meeting Action Items Report", title_style)
-    story.append(title)
-    
-    # Meeting info
-    meeting_info = f"""
-    <b>Meeting ID:</b> {meeting.meeting_id}<br/>
-    <b>Meeting Date:</b> {meeting.created_at.strftime('%B %d, %Y at %I:%M %p')}<br/>
-    <b>Status:</b> {meeting.status.title()}<br/>
-    <b>Total Tasks:</b> {len(tasks)}
-    """
-    story.append(Paragraph(meeting_info, styles['Normal']))
-    story.append(Spacer(1, 20))
-    
-    # Group tasks by assignee
-    tasks_by_assignee = {}
-    for task in tasks:
-        assignee = task.assignee_name
-        if assignee not in tasks_by_assignee:
-            tasks_by_assignee[assignee] = []
-        tasks_by_assignee[assignee].append(task)
-    
-    # Add tasks for each assignee
-    for assignee, assignee_tasks in tasks_by_assignee.items():
-        # Assignee heading
-        assignee_heading = Paragraph(f"Tasks for {assignee}", heading_style)
-        story.append(assignee_heading)
-        
-        # Task table
-        task_data = [['Task Description', 'Deadline', 'Priority', 'Status']]
-        
-        for task in assignee_tasks:
-            status = "✓ Completed" if task.is_completed else "○ Pending"
-            task_data.append([
-                task.task_description[:60] + "..." if len(task.task_description) > 60 else task.task_description,
-                task.deadline or "Not specified",
-                task.priority or "Not specified",
-                status
-            ])
-        
-        task_table = Table(task_data, colWidths=[3*inch, 1.2*inch, 0.8*inch, 1*inch])
-        task_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1f2937')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb')),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')])
-        ]))
-        
-        story.append(task_table)
-        story.append(Spacer(1, 20))
-    
-    # Summary
-    completed_tasks = sum(1 for task in tasks if task.is_completed)
-    pending_tasks = len(tasks) - completed_tasks
-    
-    summary_heading = Paragraph("Summary", heading_style)
-    story.append(summary_heading)
-    
-    summary_text = f"""
-    <b>Total Tasks:</b> {len(tasks)}<br/>
-    <b>Completed Tasks:</b> {completed_tasks}<br/>
-    <b>Pending Tasks:</b> {pending_tasks}<br/>
-    <b>Completion Rate:</b> {(completed_tasks/len(tasks)*100) if len(tasks) > 0 else 0:.1f}%<br/>
-    <b>Report Generated:</b> {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
-    """
-    story.append(Paragraph(summary_text, styles['Normal']))
-    
-    # Build PDF
-    doc.build(story)
-    
-    return temp_file.name
 
 
 @router.get("/{meeting_id}/pdf")
-async def export_tasks_pdf(meeting_id: str, db: Session = Depends(get_db)):
+async def export_tasks_pdf(
+    meeting_id: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
     """Export tasks as PDF"""
-    meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
+    meeting = await db.scalar(select(Meeting).where(Meeting.meeting_id == meeting_id))
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    tasks = db.query(Task).filter(Task.meeting_id == meeting.id).all()
+    etag = export_etag("pdf", meeting)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=cache_headers)
     
-    try:
-        pdf_path = generate_pdf_report(meeting, tasks)
+    pdf_bytes = export_cache.get("pdf", meeting.id, etag)
+    if pdf_bytes is None:
+        tasks = (await db.scalars(select(Task).where(Task.meeting_id == meeting.id))).all()
         
-        return FileResponse(
-            pdf_path,
-            media_type="application/pdf",
-            filename=f"meeting-tasks-{meeting_id}.pdf",
-            background=lambda: os.unlink(pdf_path)  # Clean up temp file after response
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
\ No newline at end of file
+        try:
+            # Render in a worker process so large reports don't block the event loop
+            with stage("pdf_render", meeting.meeting_id):
+                pdf_bytes = await pdf_service.render(
+                    meeting_to_report_data(meeting),
+                    [task_to_report_data(task) for task in tasks]
+                )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
+        
+        export_cache.put("pdf", meeting.id, etag, pdf_bytes)
+    
+    return StreamingResponse(
+        iter_bytes(pdf_bytes),
+        media_type="application/pdf",
+        headers={
+            **cache_headers,
+            "Content-Disposition": f'attachment; filename="meeting-tasks-{meeting_id}.pdf"',
+            "Content-Length": str(len(pdf_bytes))
+        }
+    )
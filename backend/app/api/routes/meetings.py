@@ -1,15 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.database import get_db, Meeting
 from app.models.schemas import MeetingCreate, MeetingResponse
 from app.services.vexa_service import vexa_service
-from typing import List
+from app.services.live_ingestion_service import live_ingestion
+from app.api.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_filter, keyset_order, parse_fields, select_columns, paginated_response
+)
+from datetime import datetime
+from typing import List, Optional
 
 router = APIRouter()
 
 
 @router.post("/start", response_model=dict)
-async def start_meeting_bot(meeting_data: MeetingCreate, db: Session = Depends(get_db)):
+async def start_meeting_bot(meeting_data: MeetingCreate, db: AsyncSession = Depends(get_db)):
     """Start a bot for a Google Meet session"""
     try:
         # Start the bot using Vexa API
@@ -26,8 +32,11 @@ async def start_meeting_bot(meeting_data: MeetingCreate, db: Session = Depends(g
             status="active"
         )
         db.add(meeting)
-        db.commit()
-        db.refresh(meeting)
+        await db.commit()
+        await db.refresh(meeting)
+        
+        # Start pulling transcript segments while the meeting runs
+        live_ingestion.watch(meeting.meeting_id)
         
         return {
             "message": "Bot started successfully",
@@ -41,9 +50,9 @@ async def start_meeting_bot(meeting_data: MeetingCreate, db: Session = Depends(g
 
 
 @router.get("/{meeting_id}/status", response_model=dict)
-async def get_meeting_status(meeting_id: str, db: Session = Depends(get_db)):
+async def get_meeting_status(meeting_id: str, db: AsyncSession = Depends(get_db)):
     """Get the status of a meeting"""
-    meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
+    meeting = await db.scalar(select(Meeting).where(Meeting.meeting_id == meeting_id))
     
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
@@ -57,21 +66,21 @@ async def get_meeting_status(meeting_id: str, db: Session = Depends(get_db)):
 
 
 @router.post("/{meeting_id}/complete", response_model=dict)
-async def complete_meeting(meeting_id: str, db: Session = Depends(get_db)):
+async def complete_meeting(meeting_id: str, db: AsyncSession = Depends(get_db)):
     """Mark a meeting as completed and remove the bot"""
-    meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
+    meeting = await db.scalar(select(Meeting).where(Meeting.meeting_id == meeting_id))
     
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
     # Remove bot from meeting
     result = await vexa_service.delete_bot(meeting_id)
+    await live_ingestion.unwatch(meeting_id)
     
     # Update meeting status regardless of bot removal result
     meeting.status = "completed"
-    from datetime import datetime
     meeting.completed_at = datetime.utcnow()
-    db.commit()
+    await db.commit()
     
     return {
         "message": "Meeting completed",
@@ -81,16 +90,36 @@ async def complete_meeting(meeting_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=List[MeetingResponse])
-async def get_meetings(db: Session = Depends(get_db)):
-    """Get all meetings"""
-    meetings = db.query(Meeting).order_by(Meeting.created_at.desc()).all()
-    return meetings
+async def get_meetings(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    status: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated subset of fields to return"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get meetings, newest first, one page at a time"""
+    fields = parse_fields(fields, MeetingResponse)
+    query = select(*select_columns(Meeting, fields))
+    
+    if status:
+        query = query.where(Meeting.status == status)
+    if created_after:
+        query = query.where(Meeting.created_at >= created_after)
+    if created_before:
+        query = query.where(Meeting.created_at < created_before)
+    if cursor:
+        query = query.where(keyset_filter(Meeting, cursor))
+    
+    rows = (await db.execute(query.order_by(*keyset_order(Meeting)).limit(limit + 1))).mappings().all()
+    return paginated_response(rows, limit, fields)
 
 
 @router.get("/{meeting_id}", response_model=MeetingResponse)
-async def get_meeting(meeting_id: str, db: Session = Depends(get_db)):
+async def get_meeting(meeting_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific meeting"""
-    meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
+    meeting = await db.scalar(select(Meeting).where(Meeting.meeting_id == meeting_id))
     
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
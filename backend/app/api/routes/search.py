@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.database import get_db
+from app.models.schemas import SearchResult
+from app.services.search_service import search_service
+from app.api.pagination import MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, encode_offset_cursor, decode_offset_cursor
+from typing import List, Literal, Optional
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[SearchResult])
+async def search(
+    q: str = Query(..., min_length=1, description="Words to search for; every word must match"),
+    kind: Optional[Literal["transcript", "task"]] = None,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Search transcripts, speakers and task descriptions, best matches first"""
+    offset = decode_offset_cursor(cursor) if cursor else 0
+    results = await search_service.search(db, q, kind, limit + 1, offset)
+    
+    headers = {}
+    if len(results) > limit:
+        results = results[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_offset_cursor(offset + limit)
+    
+    return JSONResponse(content=jsonable_encoder(results), headers=headers)
@@ -1,126 +1,191 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.database import get_db, Task, Meeting
 from app.models.schemas import TaskResponse, TaskModificationRequest
 from app.services.llm_service import llm_service
-from typing import List
+from app.services.cache_service import export_cache, export_etag, etag_matches, mark_tasks_changed
+from app.services.search_service import search_service
+from app.services.dedup_service import task_dedup
+from app.services.task_service import apply_task_patch, clear_meeting_tasks, insert_tasks, task_to_patch_data
+from app.api.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_filter, keyset_order, parse_fields, select_columns, paginated_response
+)
+from typing import List, Optional
 import json
 
 router = APIRouter()
 
 
 @router.get("/{meeting_id}", response_model=List[TaskResponse])
-async def get_tasks_for_meeting(meeting_id: str, db: Session = Depends(get_db)):
-    """Get all tasks for a specific meeting"""
-    meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
-    if not meeting:
+async def get_tasks_for_meeting(
+    meeting_id: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    assignee: Optional[str] = None,
+    completed: Optional[bool] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated subset of fields to return"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get tasks for a specific meeting in creation order, one page at a time"""
+    meeting_pk = await db.scalar(select(Meeting.id).where(Meeting.meeting_id == meeting_id))
+    if meeting_pk is None:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    tasks = db.query(Task).filter(Task.meeting_id == meeting.id).all()
-    return tasks
+    fields = parse_fields(fields, TaskResponse)
+    query = select(*select_columns(Task, fields)).where(Task.meeting_id == meeting_pk)
+    
+    if assignee:
+        query = query.where(Task.assignee_name == assignee)
+    if completed is not None:
+        query = query.where(Task.is_completed == completed)
+    if cursor:
+        query = query.where(keyset_filter(Task, cursor, descending=False))
+    
+    rows = (await db.execute(query.order_by(*keyset_order(Task, descending=False)).limit(limit + 1))).mappings().all()
+    return paginated_response(rows, limit, fields)
 
 
 @router.post("/{meeting_id}/modify", response_model=dict)
 async def modify_tasks(
     meeting_id: str, 
     modification_request: TaskModificationRequest, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Modify task assignments based on user feedback"""
-    meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
+    meeting = await db.scalar(select(Meeting).where(Meeting.meeting_id == meeting_id))
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
     # Get existing tasks
-    existing_tasks = db.query(Task).filter(Task.meeting_id == meeting.id).all()
-    existing_tasks_data = [
-        {
-            "assignee_name": task.assignee_name,
-            "task_description": task.task_description,
-            "deadline": task.deadline,
-            "priority": task.priority
-        } for task in existing_tasks
-    ]
+    existing_tasks = (await db.scalars(select(Task).where(Task.meeting_id == meeting.id))).all()
     
     # Get transcript
     from app.models.database import Transcript
-    transcript = db.query(Transcript).filter(Transcript.meeting_id == meeting.id).first()
+    transcript = await db.scalar(select(Transcript).where(Transcript.meeting_id == meeting.id))
     if not transcript:
         raise HTTPException(status_code=404, detail="Transcript not found")
     
     try:
+        if modification_request.mode == "patch":
+            # Only the changes come back, so completion state and task ids survive the edit
+            llm_result = await llm_service.modify_tasks_with_patch(
+                transcript.processed_transcript,
+                [task_to_patch_data(task) for task in existing_tasks],
+                modification_request.modification_request,
+                use_cache=not modification_request.bypass_cache
+            )
+            if not llm_result["success"]:
+                raise HTTPException(status_code=500, detail=f"Failed to modify tasks: {llm_result['error']}")
+            
+            applied = await apply_task_patch(db, meeting, llm_result["patch"])
+            return {
+                "message": "Tasks modified successfully",
+                "mode": "patch",
+                "added": applied["added"],
+                "updated": applied["updated"],
+                "removed": applied["removed"],
+                "tasks_count": len(applied["tasks"]),
+                "tasks": applied["tasks"]
+            }
+        
+        existing_tasks_data = [
+            {
+                "assignee_name": task.assignee_name,
+                "task_description": task.task_description,
+                "deadline": task.deadline,
+                "priority": task.priority
+            } for task in existing_tasks
+        ]
+        
         # Use LLM to modify tasks based on user request
         llm_result = await llm_service.modify_task_assignments(
             transcript.processed_transcript,
             existing_tasks_data,
             modification_request.modification_request,
-            transcript.additional_context
+            transcript.additional_context,
+            use_cache=not modification_request.bypass_cache
         )
         
         if not llm_result["success"]:
             raise HTTPException(status_code=500, detail=f"Failed to modify tasks: {llm_result['error']}")
         
-        # Delete existing tasks
-        db.query(Task).filter(Task.meeting_id == meeting.id).delete()
+        # Delete existing tasks (unlinking other meetings' duplicates of them)
+        unlinked = await clear_meeting_tasks(db, meeting.id)
         
         # Add new modified tasks
-        for task_data in llm_result["tasks"]:
-            task = Task(
-                meeting_id=meeting.id,
-                assignee_name=task_data["assignee_name"],
-                task_description=task_data["task_description"],
-                deadline=task_data.get("deadline"),
-                priority=task_data.get("priority")
-            )
-            db.add(task)
+        rows = await insert_tasks(db, meeting.id, llm_result["tasks"])
         
-        db.commit()
+        await mark_tasks_changed(db, meeting.id)
+        await db.commit()
+        task_dedup.forget_meeting(meeting.id)
+        task_dedup.add_rows(unlinked + rows)
+        await search_service.index_meeting(db, meeting.id)
         
         return {
             "message": "Tasks modified successfully",
+            "mode": "replace",
             "tasks_count": len(llm_result["tasks"]),
             "tasks": llm_result["tasks"]
         }
     
+    except HTTPException:
+        raise
     except Exception as e:
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.patch("/{task_id}/complete", response_model=dict)
-async def mark_task_complete(task_id: int, db: Session = Depends(get_db)):
+async def mark_task_complete(task_id: int, db: AsyncSession = Depends(get_db)):
     """Mark a task as completed"""
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
     task.is_completed = True
-    db.commit()
+    await mark_tasks_changed(db, task.meeting_id)
+    await db.commit()
+    task_dedup.remove(task_id)
     
     return {"message": "Task marked as completed", "task_id": task_id}
 
 
 @router.get("/{meeting_id}/export", response_model=dict)
-async def export_tasks(meeting_id: str, db: Session = Depends(get_db)):
+async def export_tasks(
+    meeting_id: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
     """Generate export data for tasks"""
-    meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
+    meeting = await db.scalar(select(Meeting).where(Meeting.meeting_id == meeting_id))
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    tasks = db.query(Task).filter(Task.meeting_id == meeting.id).all()
+    etag = export_etag("json", meeting)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=cache_headers)
     
-    export_data = {
-        "meeting_id": meeting_id,
-        "meeting_url": meeting.meeting_url,
-        "created_at": meeting.created_at.isoformat(),
-        "tasks": [
-            {
-                "assignee_name": task.assignee_name,
-                "task_description": task.task_description,
-                "deadline": task.deadline,
-                "priority": task.priority,
-                "is_completed": task.is_completed
-            } for task in tasks
-        ]
-    }
+    body = export_cache.get("json", meeting.id, etag)
+    if body is None:
+        tasks = (await db.scalars(select(Task).where(Task.meeting_id == meeting.id))).all()
+        
+        export_data = {
+            "meeting_id": meeting_id,
+            "meeting_url": meeting.meeting_url,
+            "created_at": meeting.created_at.isoformat(),
+            "tasks": [
+                {
+                    "assignee_name": task.assignee_name,
+                    "task_description": task.task_description,
+                    "deadline": task.deadline,
+                    "priority": task.priority,
+                    "is_completed": task.is_completed
+                } for task in tasks
+            ]
+        }
+        body = json.dumps(export_data).encode("utf-8")
+        export_cache.put("json", meeting.id, etag, body)
     
-    return export_data
\ No newline at end of file
+    return Response(content=body, media_type="application/json", headers=cache_headers)
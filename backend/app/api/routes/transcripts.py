@@ -1,91 +1,116 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.models.database import get_db, Transcript, Meeting
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.database import get_db, SessionLocal, Transcript, Meeting, decode_raw_transcript
 from app.models.schemas import TranscriptCreate, TranscriptResponse
-from app.services.vexa_service import vexa_service
-from app.services.llm_service import llm_service
+from app.services.job_service import job_queue, serialize_job, TERMINAL_STATUSES
+import asyncio
+import json
 
 router = APIRouter()
 
 
-@router.post("/{meeting_id}/process", response_model=dict)
+@router.post("/{meeting_id}/process", response_model=dict, status_code=202)
 async def process_transcript(
     meeting_id: str, 
     transcript_data: TranscriptCreate, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Process transcript for a meeting and extract tasks"""
+    """Queue transcript processing for a meeting and return the job id"""
     # Get meeting from database
-    meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
+    meeting = await db.scalar(select(Meeting).where(Meeting.meeting_id == meeting_id))
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    try:
-        # Get transcript from Vexa API
-        transcript_result = await vexa_service.get_transcript(meeting_id)
-        
-        if not transcript_result["success"]:
-            raise HTTPException(status_code=400, detail=f"Failed to fetch transcript: {transcript_result['error']}")
-        
-        # Process the raw transcript
-        raw_transcript = transcript_result["transcript"]
-        processed_transcript = vexa_service.process_transcript_data(raw_transcript)
-        
-        # Save transcript to database
-        transcript = Transcript(
-            meeting_id=meeting.id,
-            raw_transcript=str(raw_transcript),
-            processed_transcript=processed_transcript,
-            additional_context=transcript_data.additional_context
-        )
-        db.add(transcript)
-        db.commit()
-        db.refresh(transcript)
-        
-        # Extract tasks using LLM
-        llm_result = await llm_service.extract_tasks_from_transcript(
-            processed_transcript, 
-            transcript_data.additional_context,
-            meeting_id
-        )
-        
-        if not llm_result["success"]:
-            raise HTTPException(status_code=500, detail=f"Failed to extract tasks: {llm_result['error']}")
-        
-        # Save extracted tasks to database
-        from app.models.database import Task
-        for task_data in llm_result["tasks"]:
-            task = Task(
-                meeting_id=meeting.id,
-                assignee_name=task_data["assignee_name"],
-                task_description=task_data["task_description"],
-                deadline=task_data.get("deadline"),
-                priority=task_data.get("priority")
-            )
-            db.add(task)
-        
-        db.commit()
-        
-        return {
-            "message": "Transcript processed successfully",
-            "transcript_id": transcript.id,
-            "tasks_extracted": len(llm_result["tasks"]),
-            "tasks": llm_result["tasks"]
-        }
+    job = await job_queue.enqueue(db, meeting, {
+        "additional_context": transcript_data.additional_context,
+        "bypass_cache": transcript_data.bypass_cache
+    })
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "message": "Transcript processing queued",
+        "job_id": job.id,
+        "status": job.status
+    }
+
+
+@router.get("/jobs/{job_id}", response_model=dict)
+async def get_job_status(job_id: str, db: AsyncSession = Depends(get_db)):
+    """Get the status (and result, once finished) of a processing job"""
+    job = await job_queue.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return serialize_job(job)
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    Stream job status changes as Server-Sent Events until the job finishes.
+    While the LLM runs, each extracted task is sent as a "task" event as soon as it is generated.
+    """
+    if not await job_queue.get_job(db, job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    async def event_stream():
+        # Subscribe before reading the current state so no transition or task is missed
+        updates = job_queue.subscribe(job_id)
+        streamed = job_queue.streamed_tasks(job_id)
+        try:
+            async with SessionLocal() as session:
+                data = serialize_job(await job_queue.get_job(session, job_id))
+            yield f"event: status\ndata: {json.dumps(data)}\n\n"
+            for task in streamed:
+                yield f"event: task\ndata: {json.dumps(task)}\n\n"
+            
+            while data["status"] not in TERMINAL_STATUSES:
+                try:
+                    event, payload = await asyncio.wait_for(updates.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    # Another process may own the job, so its events never reach this one's subscribers
+                    async with SessionLocal() as session:
+                        latest = serialize_job(await job_queue.get_job(session, job_id))
+                    if latest["status"] == data["status"]:
+                        yield ": keep-alive\n\n"
+                        continue
+                    event, payload = "status", latest
+                if event == "status":
+                    data = payload
+                yield f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+        finally:
+            job_queue.unsubscribe(job_id, updates)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/{meeting_id}", response_model=TranscriptResponse)
-async def get_transcript(meeting_id: str, db: Session = Depends(get_db)):
+async def get_transcript(meeting_id: str, db: AsyncSession = Depends(get_db)):
     """Get processed transcript for a meeting"""
-    meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
+    meeting = await db.scalar(select(Meeting).where(Meeting.meeting_id == meeting_id))
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    transcript = db.query(Transcript).filter(Transcript.meeting_id == meeting.id).first()
+    transcript = await db.scalar(select(Transcript).where(Transcript.meeting_id == meeting.id))
     if not transcript:
         raise HTTPException(status_code=404, detail="Transcript not found")
     
-    return transcript
\ No newline at end of file
+    return transcript
+
+@router.get("/{meeting_id}/raw", response_model=dict)
+async def get_raw_transcript(meeting_id: str, db: AsyncSession = Depends(get_db)):
+    """Get the raw Vexa transcript for a meeting (decompressed on demand)"""
+    meeting = await db.scalar(select(Meeting).where(Meeting.meeting_id == meeting_id))
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    data = await db.scalar(select(Transcript.raw_transcript_data).where(Transcript.meeting_id == meeting.id))
+    if data is None:
+        raise HTTPException(status_code=404, detail="Raw transcript not found")
+    
+    return {"meeting_id": meeting_id, "raw_transcript": decode_raw_transcript(data)}
@@ -11,6 +11,100 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     CORS_ORIGINS: str = "http://localhost:3000"
     
+    # Startup
+    DB_MIGRATE_ON_STARTUP: bool = True  # Turn off when `alembic upgrade head` runs as a separate deploy step
+    LLM_PRELOAD: bool = True  # Build the LLM client in the background after startup rather than on the first request
+    
+    # Observability: Prometheus metrics at /metrics, plus OpenTelemetry spans when the SDK is configured
+    TRACING_ENABLED: bool = False  # Needs opentelemetry-api; spans go wherever the installed SDK exports them
+    
+    # Long transcripts are split into chunks and extracted concurrently
+    EXTRACTION_CHUNK_CHARS: int = 12000  # Approximate size of each chunk
+    EXTRACTION_CHUNK_OVERLAP_TURNS: int = 3  # Speaker turns repeated between chunks
+    EXTRACTION_MAX_CONCURRENCY: int = 4  # Chunks sent to the LLM at once
+    
+    # LLM backend: "gemini", or "fake" for load tests (a local model answering with generated tasks)
+    LLM_BACKEND: str = "gemini"
+    FAKE_LLM_SEED: int = 0  # Same seed and prompt, same response
+    FAKE_LLM_LATENCY: str = "lognormal:1.0,0.5"  # fixed:S, uniform:LOW,HIGH, lognormal:MEDIAN,SIGMA or exponential:MEAN
+    FAKE_LLM_TOKENS_PER_SECOND: float = 0.0  # Output rate after the latency above (0 = whole response at once)
+    FAKE_LLM_MIN_TASKS: int = 2  # Tasks per extraction response
+    FAKE_LLM_MAX_TASKS: int = 8
+    FAKE_LLM_FAILURE_RATE: float = 0.0  # Share of calls failing with a server error
+    FAKE_LLM_RATE_LIMIT_RATE: float = 0.0  # Share of calls answered with a 429
+    
+    # Shared limiter around Gemini calls; set the rates to the project's quota
+    LLM_MAX_CONCURRENCY: int = 8  # Calls in flight across the process
+    LLM_REQUESTS_PER_MINUTE: int = 500
+    LLM_TOKENS_PER_MINUTE: int = 1000000  # Estimated prompt tokens plus the response allowance below
+    LLM_RESPONSE_TOKEN_ESTIMATE: int = 1000
+    LLM_MAX_RETRIES: int = 4  # Retries after 429s and server errors
+    LLM_RETRY_BACKOFF_SECONDS: float = 2.0  # Base delay when a 429 doesn't suggest one, doubled each attempt
+    LLM_MIN_RATE_SCALE: float = 0.1  # Floor for the factor 429s halve the rates and concurrency by
+    LLM_RATE_INCREASE: float = 0.05  # Added back to that factor after each successful call
+    
+    # Cache of LLM results keyed by prompt, model and inputs
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    LLM_CACHE_MAX_ENTRIES: int = 256  # In-memory LRU tier; the database tier is bounded by the TTL
+    LLM_CACHE_PURGE_INTERVAL_SECONDS: float = 3600.0  # How often expired database rows are deleted (0 = only on lookup)
+    
+    # Transcripts are compacted before they go into a prompt (the stored transcript is unchanged)
+    TRANSCRIPT_COMPACTION_ENABLED: bool = True
+    TRANSCRIPT_BACKCHANNEL_PHRASES: str = "yeah,yep,yup,mm-hmm,mhm,uh-huh,hmm,mm,um,uh,okay,ok,right,i see,got it,cool,nice,oh,ah,wow"  # Utterances made only of these are dropped
+    TRANSCRIPT_INLINE_FILLERS: str = "um,uh,erm,er"  # Removed from inside turns (not phrases like "you know", which can carry meaning)
+    TRANSCRIPT_TOKEN_BUDGET: int = 200000  # Estimated tokens; low-value turns are dropped beyond this (0 = no limit)
+
+    # Task modification sends the LLM only the transcript lines relevant to the request
+    MODIFY_EXCERPT_CHARS: int = 4000
+    
+    # Background transcript processing
+    JOB_WORKER_CONCURRENCY: int = 2  # Jobs processed at once per API process
+    JOB_HEARTBEAT_SECONDS: float = 10.0  # How often a process marks its running jobs as alive
+    JOB_STALE_SECONDS: float = 60.0  # Running jobs without a heartbeat for this long are re-run elsewhere
+    
+    # Offline re-processing (reprocess.py); its LLM calls run in the "batch" lane of that process's limiter
+    BACKFILL_CONCURRENCY: int = 8  # Meetings extracted at once
+    BACKFILL_BATCH_SIZE: int = 50  # Meetings written (and checkpointed) per transaction
+    BACKFILL_CHECKPOINT_PATH: str = "reprocess_checkpoint.json"
+    
+    # Shared Vexa HTTP client
+    VEXA_HTTP2: bool = True
+    VEXA_MAX_CONNECTIONS: int = 20
+    VEXA_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    VEXA_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    VEXA_TIMEOUT_SECONDS: float = 30.0  # Default per-call timeout
+    VEXA_MAX_RETRIES: int = 3  # Retries on 429/5xx and connection errors
+    VEXA_RETRY_BACKOFF_SECONDS: float = 0.5  # Base delay, doubled each attempt with jitter
+    
+    # Live ingestion of active meetings
+    LIVE_INGESTION_ENABLED: bool = False
+    LIVE_POLL_INTERVAL_SECONDS: float = 15.0
+    LIVE_ROLLING_EXTRACTION: bool = False  # Extract tasks from each new window while the meeting runs
+    LIVE_EXTRACTION_WINDOW_CHARS: int = 6000  # New transcript text needed before a rolling extraction
+    
+    # PDF exports are rendered in a separate process pool
+    PDF_RENDER_WORKERS: int = 2
+    PDF_RENDER_MAX_PENDING: int = 8  # Renders queued or running before callers wait
+    EXPORT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # Rendered exports kept in memory per process
+    BULK_EXPORT_BATCH_SIZE: int = 50  # Meetings fetched (and rendered) per batch in bulk exports
+    
+    # Debug artifacts (transcripts and LLM output) written in the background
+    ARTIFACTS_ENABLED: bool = True  # Turn off in environments that don't need them
+    ARTIFACTS_DIR: str = "outputs"
+    ARTIFACTS_MAX_QUEUE: int = 1000  # Artifacts beyond this are dropped rather than delaying requests
+    ARTIFACTS_RETENTION_DAYS: float = 14.0
+    ARTIFACTS_MAX_BYTES: int = 512 * 1024 * 1024  # Compressed size kept on disk
+    
+    # Full-text search: "fts5" (SQLite), "memory" (in-process index) or "auto"
+    SEARCH_BACKEND: str = "auto"
+    SEARCH_MAX_CANDIDATES: int = 2000  # Matches ranked per table; very common terms rank only the newest
+    
+    # Near-duplicate detection of newly extracted tasks against open tasks for the same assignee
+    TASK_DEDUP_MODE: str = "link"  # "link" (set duplicate_of_id), "merge" (don't insert) or "off"
+    TASK_DEDUP_THRESHOLD: float = 0.8  # Cosine similarity of hashed n-gram vectors
+    TASK_DEDUP_DIMENSIONS: int = 256  # Vector width; about 1KB of memory per open task
+    
     class Config:
         env_file = ".env"
 
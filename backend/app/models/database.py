@@ -1,12 +1,35 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, Boolean, ForeignKey
+import json
+import os
+import zlib
+from typing import Any, Optional
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, Index, LargeBinary, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 from app.core.config import settings
 
+
+def get_async_database_url(database_url: str) -> str:
+    """Map a plain DATABASE_URL onto the matching async driver"""
+    if database_url.startswith("sqlite:///"):
+        return database_url.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+    if database_url.startswith("postgresql://"):
+        return database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if database_url.startswith("mysql://"):
+        return database_url.replace("mysql://", "mysql+aiomysql://", 1)
+    # Already has an explicit driver (e.g. sqlite+aiosqlite://)
+    return database_url
+
+
 # Database setup
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_async_engine(get_async_database_url(settings.DATABASE_URL))
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 Base = declarative_base()
 
 
@@ -20,22 +43,49 @@ class Meeting(Base):
     status = Column(String, default="pending")  # pending, active, completed, failed
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
+    tasks_version = Column(Integer, default=0, server_default="0")  # Bumped on every task write; keys export caches
     
     # Relationships
     transcript = relationship("Transcript", back_populates="meeting", uselist=False)
     tasks = relationship("Task", back_populates="meeting")
+    
+    __table_args__ = (
+        # Keyset pagination (newest first), optionally filtered by status
+        Index("ix_meetings_created_at_id", "created_at", "id"),
+        Index("ix_meetings_status_created_at_id", "status", "created_at", "id"),
+    )
+
+
+def encode_raw_transcript(raw: Any) -> bytes:
+    """Compress a Vexa transcript payload as canonical JSON"""
+    canonical = json.dumps(raw, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return zlib.compress(canonical.encode("utf-8"))
+
+
+def decode_raw_transcript(data: Optional[bytes]) -> Any:
+    """Inverse of encode_raw_transcript"""
+    if data is None:
+        return None
+    return json.loads(zlib.decompress(data).decode("utf-8"))
 
 
 class Transcript(Base):
     __tablename__ = "transcripts"
     
     id = Column(Integer, primary_key=True, index=True)
-    meeting_id = Column(Integer, ForeignKey("meetings.id"))
-    raw_transcript = Column(Text)  # Raw JSON from Vexa
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), unique=True, index=True)  # One transcript per meeting
+    # Raw JSON from Vexa, zlib-compressed; deferred so it is only loaded when asked for
+    raw_transcript_data = deferred(Column(LargeBinary, nullable=True))
     processed_transcript = Column(Text)  # Cleaned text with speakers
+    speakers = Column(Text, nullable=True)  # Distinct speaker names, comma-separated (searchable)
     additional_context = Column(Text, nullable=True)  # User-provided context
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    # Live ingestion progress
+    segments_ingested = Column(Integer, default=0)  # Vexa segments already appended
+    extracted_chars = Column(Integer, default=0)  # Prefix of processed_transcript covered by rolling extraction
+    rolling_tasks = Column(Text, nullable=True)  # JSON list of tasks from rolling extraction
+    
     # Relationships
     meeting = relationship("Meeting", back_populates="transcript")
 
@@ -44,26 +94,87 @@ class Task(Base):
     __tablename__ = "tasks"
     
     id = Column(Integer, primary_key=True, index=True)
-    meeting_id = Column(Integer, ForeignKey("meetings.id"))
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), index=True)
     assignee_name = Column(String)
     task_description = Column(Text)
-    deadline = Column(String, nullable=True)  # Store as string since LLM might return various formats
+    deadline = Column(String, nullable=True, index=True)  # Store as string since LLM might return various formats
     priority = Column(String, nullable=True)
     is_completed = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    duplicate_of_id = Column(Integer, nullable=True, index=True)  # Earlier open task this one repeats
     
     # Relationships
     meeting = relationship("Meeting", back_populates="tasks")
+    
+    __table_args__ = (
+        # "Open tasks for a person" lookups
+        Index("ix_tasks_assignee_name_is_completed", "assignee_name", "is_completed"),
+        # Keyset pagination of a meeting's tasks
+        Index("ix_tasks_meeting_id_created_at_id", "meeting_id", "created_at", "id"),
+    )
+
+
+class LLMCacheEntry(Base):
+    __tablename__ = "llm_cache"
+    
+    key = Column(String(64), primary_key=True)  # SHA-256 of prompt, model and inputs
+    value = Column(Text)  # JSON-encoded result
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class ProcessingJob(Base):
+    __tablename__ = "processing_jobs"
+    
+    id = Column(String(32), primary_key=True)  # uuid4 hex
+    job_type = Column(String, default="process_transcript")
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), index=True)
+    status = Column(String, default="queued", index=True)  # queued, running, completed, failed
+    payload = Column(Text, nullable=True)  # JSON-encoded job arguments
+    result = Column(Text, nullable=True)  # JSON-encoded result
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    owner = Column(String, nullable=True)  # Worker process running the job
+    heartbeat_at = Column(DateTime, nullable=True)  # Refreshed by the owner while the job runs
+
+    __table_args__ = (
+        # At most one unfinished job per meeting and type, so concurrent enqueues can't both insert
+        Index(
+            "uq_processing_jobs_unfinished", "meeting_id", "job_type", unique=True,
+            sqlite_where=text("status IN ('queued', 'running')"),
+            postgresql_where=text("status IN ('queued', 'running')")
+        ),
+    )
+
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "alembic.ini")
+
+
+def get_alembic_config():
+    """Alembic config that works regardless of the current working directory"""
+    from alembic.config import Config
+    
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI), "migrations"))
+    return config
+
+
+def _run_migrations(connection):
+    from alembic import command
+    
+    config = get_alembic_config()
+    config.attributes["connection"] = connection
+    command.upgrade(config, "head")
 
 
-# Create all tables
-Base.metadata.create_all(bind=engine)
+async def init_db():
+    """Bring the schema up to date with Alembic (called once at application startup)"""
+    async with engine.begin() as conn:
+        await conn.run_sync(_run_migrations)
 
 
 # Database dependency
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 
 
@@ -31,6 +31,7 @@ class TaskResponse(BaseModel):
     priority: Optional[str]
     is_completed: bool
     created_at: datetime
+    duplicate_of_id: Optional[int] = None
 
     class Config:
         from_attributes = True
@@ -46,6 +47,7 @@ class TaskCreate(BaseModel):
 # Transcript schemas
 class TranscriptCreate(BaseModel):
     additional_context: Optional[str] = None
+    bypass_cache: bool = False  # Force a fresh LLM call even for an identical transcript
 
 
 class TranscriptResponse(BaseModel):
@@ -59,7 +61,17 @@ class TranscriptResponse(BaseModel):
         from_attributes = True
 
 
+class SearchResult(BaseModel):
+    kind: str  # "transcript" or "task"
+    id: int  # Transcript or task id
+    meeting_id: str
+    score: float
+    snippet: str  # HTML-escaped text with matched terms wrapped in <mark></mark>
+
+
 # Task modification request
 class TaskModificationRequest(BaseModel):
     modification_request: str
-    meeting_id: int
\ No newline at end of file
+    meeting_id: int
+    bypass_cache: bool = False
+    mode: Literal["patch", "replace"] = "patch"  # "replace" regenerates the whole task list
\ No newline at end of file
@@ -16,4 +16,28 @@ class TaskModel(BaseModel):
 
 class TaskExtractionResponse(BaseModel):
     """Pydantic model for the complete task extraction response"""
-    tasks: List[TaskModel] = Field(description="List of extracted tasks from the meeting transcript")
\ No newline at end of file
+    tasks: List[TaskModel] = Field(description="List of extracted tasks from the meeting transcript")
+
+
+class TaskAddition(BaseModel):
+    """Pydantic model for a task a modification adds"""
+    description: str = Field(description="Detailed, actionable description of what needs to be done")
+    assignee: str = Field(description="Name of the person assigned to the task, or 'Unassigned' if no one is specified")
+    priority: str = Field(description="Task priority: 'High', 'Medium', or 'Low'")
+    deadline: Optional[str] = Field(None, description="Deadline in YYYY-MM-DD format, or null if not specified")
+
+
+class TaskUpdate(BaseModel):
+    """Pydantic model for changes to one existing task; omitted fields stay as they are"""
+    id: int = Field(description="Id of the existing task to change")
+    description: Optional[str] = Field(None, description="New description, or null to keep the current one")
+    assignee: Optional[str] = Field(None, description="New assignee, or null to keep the current one")
+    priority: Optional[str] = Field(None, description="New priority, or null to keep the current one")
+    deadline: Optional[str] = Field(None, description="New deadline in YYYY-MM-DD format, or null to keep the current one")
+
+
+class TaskPatchResponse(BaseModel):
+    """Pydantic model for the changes a modification request makes to a task list"""
+    add: List[TaskAddition] = Field(default_factory=list, description="New tasks to create")
+    update: List[TaskUpdate] = Field(default_factory=list, description="Existing tasks to change, by id")
+    remove: List[int] = Field(default_factory=list, description="Ids of existing tasks to delete")
\ No newline at end of file
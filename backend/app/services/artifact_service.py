@@ -0,0 +1,235 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from app.core.config import settings
+
+# Share of the size cap the manifest may use before it's compacted
+MANIFEST_SHARE = 0.1
+
+
+class ArtifactSink:
+    """
+    Non-blocking store for debug artifacts (transcripts, LLM responses).
+
+    submit() only hashes and enqueues; a background task writes batches to
+    disk in a worker thread. Blobs are gzip-compressed and named by the
+    SHA-256 of their content, so the same transcript is stored once. A
+    manifest (manifest.ndjson) records what was written and when, and
+    retention trims blobs by age and total size (manifest included).
+
+    Blob sizes and ages are read from disk once, on the first write, and
+    tracked in memory after that, so a write costs the same however many
+    artifacts are stored. The manifest is compacted when it outgrows its
+    share of the cap, so it may briefly list blobs evicted since.
+    """
+
+    def __init__(self, directory: str, enabled: bool, max_queue: int, retention_days: float, max_bytes: int):
+        self.directory = directory
+        self.enabled = enabled
+        self.max_queue = max_queue
+        self.retention_days = retention_days
+        self.max_bytes = max_bytes
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._blobs: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()  # digest -> (mtime, size), oldest first
+        self._blob_bytes = 0
+        self._manifest_bytes = 0
+        self._scanned = False
+        self.written = 0
+        self.deduplicated = 0
+        self.dropped = 0
+
+    @property
+    def blob_dir(self) -> str:
+        return os.path.join(self.directory, "blobs")
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.directory, "manifest.ndjson")
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], f"{digest}.gz")
+
+    async def start(self):
+        if self.enabled and self._writer is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._writer = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Flush queued artifacts and stop the writer"""
+        if self._writer is None:
+            return
+        await self._queue.put(None)
+        await self._writer
+        self._writer = None
+        self._queue = None
+
+    def submit(self, kind: str, content: str, meeting_id: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Queue an artifact for writing; returns its content hash without touching disk"""
+        if not self.enabled:
+            return None
+
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+
+        if self._writer is None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return digest
+            # Used outside the app lifespan (scripts): start the writer on first use
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._writer = asyncio.create_task(self._run())
+
+        entry = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "kind": kind,
+            "meeting_id": meeting_id,
+            "sha256": digest,
+            "size": len(data),
+            **({"metadata": metadata} if metadata else {})
+        }
+        try:
+            self._queue.put_nowait((entry, data))
+        except asyncio.QueueFull:
+            # Debug artifacts are never worth slowing extraction down for
+            self.dropped += 1
+        return digest
+
+    async def _run(self):
+        while True:
+            item = await self._queue.get()
+            batch = [item]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            stop = None in batch
+            items = [entry for entry in batch if entry is not None]
+            if items:
+                try:
+                    await asyncio.to_thread(self._write_batch, items)
+                except Exception as e:
+                    print(f"Error writing artifacts: {e}")
+            if stop:
+                return
+
+    def _scan(self):
+        """Load blob sizes and ages from disk (once per process)"""
+        blobs = []
+        for root, _, files in os.walk(self.blob_dir):
+            for name in files:
+                if name.endswith(".gz"):
+                    stat = os.stat(os.path.join(root, name))
+                    blobs.append((stat.st_mtime, name[:-len(".gz")], stat.st_size))
+        self._blobs = OrderedDict((digest, (mtime, size)) for mtime, digest, size in sorted(blobs))
+        self._blob_bytes = sum(size for _, _, size in blobs)
+        self._manifest_bytes = os.path.getsize(self.manifest_path) if os.path.exists(self.manifest_path) else 0
+        self._scanned = True
+
+    def _write_batch(self, items: List[Tuple[Dict[str, Any], bytes]]):
+        os.makedirs(self.blob_dir, exist_ok=True)
+        if not self._scanned:
+            self._scan()
+
+        manifest_lines = []
+        for entry, data in items:
+            digest = entry["sha256"]
+            path = self._blob_path(digest)
+            known = self._blobs.pop(digest, None)
+            if known is not None and os.path.exists(path):
+                self.deduplicated += 1
+                os.utime(path)  # Keep recently referenced blobs alive under retention
+                size = known[1]
+            else:
+                if known is not None:
+                    self._blob_bytes -= known[1]  # Deleted behind our back
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.tmp"
+                with gzip.open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+                size = os.path.getsize(path)
+                self._blob_bytes += size
+                self.written += 1
+            self._blobs[digest] = (time.time(), size)
+            manifest_lines.append(json.dumps(entry))
+
+        text = "\n".join(manifest_lines) + "\n"
+        with open(self.manifest_path, "a", encoding="utf-8") as f:
+            f.write(text)
+        self._manifest_bytes += len(text.encode("utf-8"))
+
+        self._enforce_retention()
+
+    def _enforce_retention(self):
+        """Delete blobs older than the retention window, then the oldest until the blobs and manifest fit the cap"""
+        if self._manifest_bytes > self.max_bytes * MANIFEST_SHARE:
+            self._compact_manifest()
+
+        cutoff = time.time() - self.retention_days * 86400
+        while self._blobs:
+            digest, (mtime, size) = next(iter(self._blobs.items()))
+            if mtime >= cutoff and self._blob_bytes + self._manifest_bytes <= self.max_bytes:
+                break
+            del self._blobs[digest]
+            self._blob_bytes -= size
+            try:
+                os.remove(self._blob_path(digest))
+            except FileNotFoundError:
+                pass
+
+    def _compact_manifest(self):
+        """Rewrite the manifest without entries for evicted blobs, keeping the newest within half its share"""
+        budget = self.max_bytes * MANIFEST_SHARE / 2
+        kept: List[str] = []
+        kept_bytes = 0
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            lines = [line for line in f if line.strip()]
+        for line in reversed(lines):
+            if json.loads(line)["sha256"] not in self._blobs:
+                continue
+            line_bytes = len(line.encode("utf-8"))
+            if kept_bytes + line_bytes > budget:
+                break
+            kept.append(line)
+            kept_bytes += line_bytes
+
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(reversed(kept))
+        os.replace(tmp_path, self.manifest_path)
+        self._manifest_bytes = kept_bytes
+
+    def read(self, digest: str) -> Optional[str]:
+        """Load an artifact by hash (blocking; for debugging tools)"""
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            return None
+        with gzip.open(path, "rb") as f:
+            return f.read().decode("utf-8")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "written": self.written,
+            "deduplicated": self.deduplicated,
+            "dropped": self.dropped,
+            "stored_bytes": self._blob_bytes + self._manifest_bytes
+        }
+
+
+# Global instance
+artifact_sink = ArtifactSink(
+    directory=settings.ARTIFACTS_DIR,
+    enabled=settings.ARTIFACTS_ENABLED,
+    max_queue=settings.ARTIFACTS_MAX_QUEUE,
+    retention_days=settings.ARTIFACTS_RETENTION_DAYS,
+    max_bytes=settings.ARTIFACTS_MAX_BYTES
+)
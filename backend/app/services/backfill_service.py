@@ -0,0 +1,312 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+from prometheus_client import REGISTRY
+from sqlalchemy import select
+from app.models.database import SessionLocal, Meeting, Task, Transcript
+from app.services.cache_service import mark_tasks_changed
+from app.services.llm_service import llm_service
+from app.services.dedup_service import task_dedup
+from app.services.task_service import insert_tasks, carry_over_completion, clear_meeting_tasks, task_key
+
+# Transcripts read from the database per query
+PAGE_SIZE = 200
+
+
+@dataclass
+class Checkpoint:
+    """Progress of a backfill: every meeting pk <= watermark is done, plus the ones listed above it"""
+    prompt_hash: str
+    watermark: int = 0
+    completed: Set[int] = field(default_factory=set)
+    failed: Dict[int, str] = field(default_factory=dict)
+
+    def is_done(self, meeting_pk: int) -> bool:
+        return meeting_pk <= self.watermark or meeting_pk in self.completed
+
+    def mark_done(self, meeting_pks: List[int], pending: List[int]):
+        """Record finished meetings and advance the watermark over the contiguous prefix of pending pks"""
+        self.completed.update(meeting_pks)
+        while pending and pending[0] in self.completed:
+            meeting_pk = pending.pop(0)
+            self.completed.discard(meeting_pk)
+            self.watermark = max(self.watermark, meeting_pk)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "prompt_hash": self.prompt_hash,
+            "watermark": self.watermark,
+            "completed": sorted(self.completed),
+            "failed": {str(pk): error for pk, error in self.failed.items()}
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Checkpoint":
+        return cls(
+            prompt_hash=data["prompt_hash"],
+            watermark=data.get("watermark", 0),
+            completed=set(data.get("completed", [])),
+            failed={int(pk): error for pk, error in data.get("failed", {}).items()}
+        )
+
+
+def load_checkpoint(path: str) -> Optional[Checkpoint]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return Checkpoint.from_json(json.load(f))
+
+
+def save_checkpoint(path: str, checkpoint: Checkpoint):
+    """Write atomically, so an interrupted run never leaves a truncated checkpoint"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint.to_json(), f)
+    os.replace(tmp_path, path)
+
+
+def extraction_prompt_hash() -> str:
+    """Identifies the prompt a checkpoint was made with; a changed prompt means starting over"""
+    return hashlib.sha256(llm_service.create_task_extraction_prompt().template.encode("utf-8")).hexdigest()[:16]
+
+
+def diff_tasks(stored: List[Dict[str, Any]], extracted: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Compare stored and newly extracted tasks by normalized assignee and description"""
+    stored_keys = {task_key(task) for task in stored}
+    extracted_keys = {task_key(task) for task in extracted}
+    return {
+        "added": [task for task in extracted if task_key(task) not in stored_keys],
+        "removed": [task for task in stored if task_key(task) not in extracted_keys],
+        "unchanged": [task for task in extracted if task_key(task) in stored_keys]
+    }
+
+
+class Backfill:
+    """Re-runs task extraction over stored transcripts with bounded concurrency, writing results in batches"""
+
+    def __init__(
+        self,
+        checkpoint_path: str,
+        concurrency: int = 8,
+        batch_size: int = 50,
+        flush_seconds: float = 30.0,
+        dry_run: bool = False,
+        use_cache: bool = True,
+        meeting_ids: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        report_seconds: float = 10.0,
+        on_diff=None
+    ):
+        self.checkpoint_path = checkpoint_path
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.dry_run = dry_run
+        self.use_cache = use_cache
+        self.meeting_ids = meeting_ids
+        self.limit = limit
+        self.report_seconds = report_seconds
+        self.on_diff = on_diff
+        self.checkpoint: Optional[Checkpoint] = None
+        self.meeting_pks_to_retry: Optional[Set[int]] = None
+        self._pending: List[int] = []  # Meeting pks handed to workers and not yet written, in pk order
+        self._counters = {"meetings": 0, "failed": 0, "tasks": 0, "added": 0, "removed": 0, "unchanged": 0}
+        self._started = 0.0
+        self._tokens_at_start = 0.0
+
+    def resume(self, restart: bool = False, retry_failed: bool = False):
+        """Load the checkpoint (unless restarting); refuses one made with a different extraction prompt"""
+        prompt_hash = extraction_prompt_hash()
+        checkpoint = None if restart or self.dry_run else load_checkpoint(self.checkpoint_path)
+        if checkpoint is not None and checkpoint.prompt_hash != prompt_hash:
+            raise ValueError(
+                f"{self.checkpoint_path} was written for a different extraction prompt; pass --restart to start over"
+            )
+        self.checkpoint = checkpoint or Checkpoint(prompt_hash=prompt_hash)
+        if retry_failed:
+            self.meeting_pks_to_retry = set(self.checkpoint.failed)
+            self.checkpoint.failed.clear()
+
+    def _query(self, after_pk: int):
+        query = (
+            select(Transcript.meeting_id, Meeting.meeting_id, Transcript.processed_transcript, Transcript.additional_context)
+            .join(Meeting, Meeting.id == Transcript.meeting_id)
+            .where(Transcript.meeting_id > after_pk, Transcript.processed_transcript.is_not(None))
+            .order_by(Transcript.meeting_id)
+            .limit(PAGE_SIZE)
+        )
+        if self.meeting_ids:
+            query = query.where(Meeting.meeting_id.in_(self.meeting_ids))
+        if self.meeting_pks_to_retry is not None:
+            query = query.where(Transcript.meeting_id.in_(self.meeting_pks_to_retry))
+        return query
+
+    async def _produce(self, queue: asyncio.Queue):
+        """Page through transcripts in meeting order, skipping ones the checkpoint has covered"""
+        after_pk = 0 if self.meeting_pks_to_retry is not None else self.checkpoint.watermark
+        queued = 0
+        while self.limit is None or queued < self.limit:
+            async with SessionLocal() as db:
+                rows = (await db.execute(self._query(after_pk))).all()
+            if not rows:
+                break
+            for meeting_pk, meeting_id, transcript, additional_context in rows:
+                after_pk = meeting_pk
+                if self.meeting_pks_to_retry is None and self.checkpoint.is_done(meeting_pk):
+                    continue
+                if self.limit is not None and queued >= self.limit:
+                    break
+                self._pending.append(meeting_pk)
+                await queue.put((meeting_pk, meeting_id, transcript, additional_context))
+                queued += 1
+        for _ in range(self.concurrency):
+            await queue.put(None)
+
+    async def _work(self, queue: asyncio.Queue, results: asyncio.Queue):
+        while True:
+            item = await queue.get()
+            if item is None:
+                await results.put(None)
+                return
+            meeting_pk, meeting_id, transcript, additional_context = item
+            try:
+                llm_result = await llm_service.extract_tasks_from_transcript(
+                    transcript,
+                    additional_context,
+                    meeting_id,
+                    use_cache=self.use_cache,
+                    priority="batch"
+                )
+            except Exception as e:
+                llm_result = {"success": False, "error": str(e)}
+            await results.put((meeting_pk, meeting_id, llm_result))
+
+    async def _write(self, batch: List[tuple]):
+        """Replace each meeting's tasks in one transaction (or only diff them in a dry run), then checkpoint"""
+        async with SessionLocal() as db:
+            meeting_pks = [meeting_pk for meeting_pk, _, result in batch if result["success"]]
+            stored_rows = (await db.scalars(select(Task).where(Task.meeting_id.in_(meeting_pks)))).all() if meeting_pks else []
+            stored: Dict[int, List[Task]] = {}
+            for task in stored_rows:
+                stored.setdefault(task.meeting_id, []).append(task)
+
+            for meeting_pk, meeting_id, result in batch:
+                self._counters["meetings"] += 1
+                if not result["success"]:
+                    self._counters["failed"] += 1
+                    self.checkpoint.failed[meeting_pk] = result["error"]
+                    continue
+
+                old_tasks = stored.get(meeting_pk, [])
+                old_data = [
+                    {"assignee_name": task.assignee_name, "task_description": task.task_description}
+                    for task in old_tasks
+                ]
+                diff = diff_tasks(old_data, result["tasks"])
+                self._counters["tasks"] += len(result["tasks"])
+                for kind in ("added", "removed", "unchanged"):
+                    self._counters[kind] += len(diff[kind])
+                if self.on_diff is not None:
+                    self.on_diff(meeting_id, diff)
+                if self.dry_run:
+                    continue
+
+                # Completion carries over to re-extracted tasks that match a stored one; duplicate links are
+                # found afresh, since replacing tasks gives them new ids (links are set even in merge mode,
+                # so a backfill never edits other meetings' tasks)
+                new_tasks = carry_over_completion(old_tasks, result["tasks"])
+                duplicates = await task_dedup.find_duplicates(db, new_tasks, exclude_meeting=meeting_pk)
+                new_tasks = [
+                    {**task_data, "duplicate_of_id": duplicate_of}
+                    for task_data, duplicate_of in zip(new_tasks, duplicates)
+                ]
+
+                unlinked = await clear_meeting_tasks(db, meeting_pk)
+                rows = await insert_tasks(db, meeting_pk, new_tasks)
+                await mark_tasks_changed(db, meeting_pk)
+                # Updated before the batch commits, so later meetings in it never link to the deleted tasks
+                task_dedup.forget_meeting(meeting_pk)
+                task_dedup.add_rows(unlinked + rows)
+
+            if not self.dry_run:
+                await db.commit()
+
+        if not self.dry_run:
+            self.checkpoint.mark_done([meeting_pk for meeting_pk, _, _ in batch], self._pending)
+            save_checkpoint(self.checkpoint_path, self.checkpoint)
+
+    async def _collect(self, results: asyncio.Queue, producer: asyncio.Task, workers: List[asyncio.Task]):
+        """Gather results into batches, flushing when a batch fills or flush_seconds pass"""
+        batch: List[tuple] = []
+        finished_workers = 0
+        last_flush = time.monotonic()
+        last_report = time.monotonic()
+        while finished_workers < len(workers):
+            try:
+                item = await asyncio.wait_for(results.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                if producer.done() and producer.exception() is not None:
+                    # Reading transcripts failed; the workers would wait for work forever
+                    raise producer.exception()
+            else:
+                if item is None:
+                    finished_workers += 1
+                else:
+                    batch.append(item)
+            if batch and (len(batch) >= self.batch_size or time.monotonic() - last_flush >= self.flush_seconds):
+                await self._write(batch)
+                batch = []
+                last_flush = time.monotonic()
+            if time.monotonic() - last_report >= self.report_seconds:
+                print(self.format_report())
+                last_report = time.monotonic()
+        if batch:
+            await self._write(batch)
+
+    async def run(self) -> Dict[str, Any]:
+        if self.checkpoint is None:
+            self.resume()
+        self._started = time.monotonic()
+        self._tokens_at_start = self._tokens_used()
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        results: asyncio.Queue = asyncio.Queue()
+        producer = asyncio.create_task(self._produce(queue))
+        workers = [asyncio.create_task(self._work(queue, results)) for _ in range(self.concurrency)]
+        try:
+            await self._collect(results, producer, workers)
+            await asyncio.gather(producer, *workers)
+        finally:
+            for task in (producer, *workers):
+                task.cancel()
+        return self.stats()
+
+    def _tokens_used(self) -> float:
+        return sum(
+            REGISTRY.get_sample_value("llm_tokens_total", {"direction": direction}) or 0.0
+            for direction in ("input", "output")
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        minutes = max(time.monotonic() - self._started, 1e-9) / 60
+        tokens = self._tokens_used() - self._tokens_at_start
+        return {
+            **self._counters,
+            "elapsed_seconds": round(minutes * 60, 1),
+            "meetings_per_minute": round(self._counters["meetings"] / minutes, 1),
+            "tokens": int(tokens),
+            "tokens_per_minute": round(tokens / minutes),
+            "watermark": self.checkpoint.watermark if self.checkpoint else 0
+        }
+
+    def format_report(self) -> str:
+        stats = self.stats()
+        return (
+            f"{stats['meetings']} meetings ({stats['failed']} failed), {stats['tasks']} tasks "
+            f"(+{stats['added']} / -{stats['removed']} / ={stats['unchanged']}) in {stats['elapsed_seconds']}s: "
+            f"{stats['meetings_per_minute']} meetings/min, {stats['tokens_per_minute']} tokens/min"
+        )
@@ -0,0 +1,230 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.database import SessionLocal, LLMCacheEntry, Meeting
+from app.services.metrics_service import record_cache_lookup
+
+
+class ExtractionCache:
+    """Two-tier (memory LRU + database) cache for LLM results"""
+
+    def __init__(self, max_entries: int, ttl_seconds: int, enabled: bool = True, purge_interval_seconds: float = 0.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.purge_interval_seconds = purge_interval_seconds
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._purger: Optional[asyncio.Task] = None
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def make_key(self, template: str, model: str, temperature: float, transcript: str, extra: Optional[Dict[str, Any]] = None) -> str:
+        """Content-addressed key for a prompt, model and its inputs"""
+        payload = json.dumps({
+            "template": template,
+            "model": model,
+            "temperature": temperature,
+            "transcript": transcript,
+            "extra": extra or {}
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, value: Any, stored_at: float):
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return a cached value, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            if now - stored_at < self.ttl_seconds:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                record_cache_lookup("llm", hit=True)
+                return value
+            del self._memory[key]
+
+        try:
+            async with SessionLocal() as db:
+                row = await db.get(LLMCacheEntry, key)
+                if row is not None:
+                    if datetime.utcnow() - row.created_at < timedelta(seconds=self.ttl_seconds):
+                        value = json.loads(row.value)
+                        self._remember(key, value, now)
+                        self.db_hits += 1
+                        record_cache_lookup("llm", hit=True)
+                        return value
+                    # Expired
+                    await db.delete(row)
+                    await db.commit()
+        except Exception as e:
+            print(f"Error reading LLM cache: {e}")
+
+        self.misses += 1
+        record_cache_lookup("llm", hit=False)
+        return None
+
+    async def set(self, key: str, value: Any):
+        """Store a value in both tiers"""
+        if not self.enabled:
+            return
+
+        self._remember(key, value, time.time())
+        try:
+            async with SessionLocal() as db:
+                await db.merge(LLMCacheEntry(
+                    key=key,
+                    value=json.dumps(value, default=str),
+                    created_at=datetime.utcnow()
+                ))
+                await db.commit()
+        except Exception as e:
+            print(f"Error writing LLM cache: {e}")
+
+    async def start(self):
+        """Purge expired database rows periodically (rows are otherwise only removed when a lookup finds them)"""
+        if self.enabled and self.purge_interval_seconds > 0 and self._purger is None:
+            self._purger = asyncio.create_task(self._purge_periodically())
+
+    async def stop(self):
+        if self._purger is not None:
+            self._purger.cancel()
+            await asyncio.gather(self._purger, return_exceptions=True)
+            self._purger = None
+
+    async def _purge_periodically(self):
+        while True:
+            try:
+                purged = await self.purge_expired()
+                if purged:
+                    print(f"✅ Purged {purged} expired LLM cache entries")
+            except Exception as e:
+                print(f"Error purging LLM cache: {e}")
+            await asyncio.sleep(self.purge_interval_seconds)
+
+    async def purge_expired(self, batch_size: int = 1000) -> int:
+        """Delete expired rows from the database tier, one short transaction per batch"""
+        cutoff = datetime.utcnow() - timedelta(seconds=self.ttl_seconds)
+        purged = 0
+        while True:
+            async with SessionLocal() as db:
+                expired = select(LLMCacheEntry.key).where(LLMCacheEntry.created_at < cutoff).limit(batch_size)
+                result = await db.execute(delete(LLMCacheEntry).where(LLMCacheEntry.key.in_(expired)))
+                await db.commit()
+            deleted = result.rowcount or 0
+            purged += deleted
+            if deleted < batch_size:
+                return purged
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.db_hits
+        lookups = hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0
+        }
+
+
+class ExportCache:
+    """Size-bounded LRU of rendered exports, keyed by (kind, meeting) and validated by ETag"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[str, bytes]]" = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, meeting_pk: int, etag: str) -> Optional[bytes]:
+        entry = self._entries.get((kind, meeting_pk))
+        if entry is None or entry[0] != etag:
+            self.misses += 1
+            record_cache_lookup(f"export_{kind}", hit=False)
+            return None
+        self._entries.move_to_end((kind, meeting_pk))
+        self.hits += 1
+        record_cache_lookup(f"export_{kind}", hit=True)
+        return entry[1]
+
+    def put(self, kind: str, meeting_pk: int, etag: str, body: bytes):
+        if len(body) > self.max_bytes:
+            return
+        self._discard((kind, meeting_pk))
+        self._entries[(kind, meeting_pk)] = (etag, body)
+        self._size += len(body)
+        while self._size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def invalidate(self, meeting_pk: int):
+        """Drop every rendered export of a meeting"""
+        for key in [key for key in self._entries if key[1] == meeting_pk]:
+            self._discard(key)
+
+    def _discard(self, key: Tuple[str, int]):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+def export_etag(kind: str, meeting: Meeting) -> str:
+    """ETag for an export; changes whenever the meeting's tasks or status change"""
+    return f'"{kind}-{meeting.id}-{meeting.tasks_version or 0}-{meeting.status}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against an ETag (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any((candidate[2:] if candidate.startswith("W/") else candidate) == etag for candidate in candidates)
+
+
+async def mark_tasks_changed(db: AsyncSession, meeting_pk: int):
+    """Bump a meeting's task-set version (committed with the caller's transaction) and drop cached exports"""
+    await db.execute(
+        update(Meeting)
+        .where(Meeting.id == meeting_pk)
+        .values(tasks_version=Meeting.tasks_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    export_cache.invalidate(meeting_pk)
+
+
+# Global instances
+export_cache = ExportCache(settings.EXPORT_CACHE_MAX_BYTES)
+extraction_cache = ExtractionCache(
+    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+    enabled=settings.LLM_CACHE_ENABLED,
+    purge_interval_seconds=settings.LLM_CACHE_PURGE_INTERVAL_SECONDS
+)
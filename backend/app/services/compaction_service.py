@@ -0,0 +1,165 @@
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+from app.core.config import settings
+
+
+# Word pieces and punctuation, roughly how subword tokenizers split English text
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+# Turns that mention these are the last to go when a transcript is over budget
+ACTION_CUES = re.compile(
+    r"\b(i'll|i will|we'll|we will|you'll|will you|can you|could you|need to|needs to|have to|has to|should|must|"
+    r"let's|action item|follow up|take care|assign|deadline|due|by (monday|tuesday|wednesday|thursday|friday|"
+    r"tomorrow|next week|end of|eod|eow))\b",
+    re.IGNORECASE
+)
+# Stutters: the same word three or more times in a row ("the the the"); doubled words can be legitimate ("that that")
+REPEATED_WORD = re.compile(r"\b(\w+)(\s+\1\b){2,}", re.IGNORECASE)
+# Turns that ask something of someone; a bare "yeah" or "okay" right after one is how a task gets accepted
+REQUEST_CUES = re.compile(r"\?\s*$|\bplease\b", re.IGNORECASE)
+
+
+def estimate_tokens(text: str) -> int:
+    """Local token estimate: one per word piece of up to four characters, one per punctuation mark"""
+    return sum((len(piece) + 3) // 4 for piece in TOKEN_PATTERN.findall(text or ""))
+
+
+def _phrases(value: str) -> List[str]:
+    return [phrase.strip().lower() for phrase in value.split(",") if phrase.strip()]
+
+
+class TranscriptCompactor:
+    """
+    Shrinks a processed transcript ("speaker: text" lines) before it goes into a prompt.
+
+    Back-channel utterances ("yeah", "mm-hmm") are dropped unless they answer
+    another speaker's question or request, inline fillers and stuttered
+    repeats are removed, whitespace is normalized and consecutive turns
+    by the same speaker are merged. If the result is still over the token budget,
+    the turns least likely to carry an action item are dropped until it fits.
+    The stored transcript is never changed.
+    """
+
+    def __init__(self, enabled: bool, backchannel: str, inline_fillers: str, token_budget: int):
+        self.enabled = enabled
+        # Longest first so "mm-hmm" is matched before "mm"
+        phrases = sorted(_phrases(backchannel), key=len, reverse=True)
+        self._backchannel = re.compile(
+            r"(?<![\w'-])(" + "|".join(re.escape(phrase) for phrase in phrases) + r")(?![\w'-])"
+        ) if phrases else None
+        fillers = _phrases(inline_fillers)
+        self._inline = re.compile(
+            r",?\s*(?<!\w)(" + "|".join(re.escape(filler) for filler in fillers) + r")(?!\w),?",
+            re.IGNORECASE
+        ) if fillers else None
+        self.token_budget = token_budget
+        self._totals = {"transcripts": 0, "original_tokens": 0, "compacted_tokens": 0, "dropped_turns": 0, "over_budget": 0}
+
+    def _split_turn(self, line: str) -> Tuple[Optional[str], str]:
+        speaker, separator, text = line.partition(": ")
+        return (speaker, text) if separator and speaker and len(speaker) <= 80 else (None, line)
+
+    def _is_backchannel(self, text: str) -> bool:
+        remaining = " ".join(re.sub(r"[^\w\s'-]", " ", text.lower()).split())
+        # Every word belongs to a back-channel phrase ("yeah yeah okay", "mm-hmm, right")
+        if remaining and self._backchannel is not None:
+            remaining = self._backchannel.sub(" ", remaining)
+        return not remaining.strip()
+
+    def _clean(self, text: str) -> str:
+        if self._inline is not None:
+            text = self._inline.sub(" ", text)
+        text = REPEATED_WORD.sub(r"\1", text)
+        text = re.sub(r"\s+", " ", text).strip()
+        return re.sub(r"\s+([,.?!])", r"\1", text).lstrip(",. ")
+
+    def _is_request(self, text: str) -> bool:
+        return bool(REQUEST_CUES.search(text) or ACTION_CUES.search(text))
+
+    def _fit_budget(self, turns: List[List[str]], answers: Set[int]) -> Tuple[List[List[str]], int]:
+        """Drop the lowest-value turns until the estimate is within budget"""
+        lines = [f"{speaker}: {text}" if speaker else text for speaker, text in turns]
+        sizes = [estimate_tokens(line) for line in lines]
+        total = sum(sizes)
+        if self.token_budget <= 0 or total <= self.token_budget:
+            return turns, 0
+
+        def value(index: int) -> Tuple[int, int, int]:
+            text = turns[index][1]
+            # An answer to a request counts as an action cue, so "Sure." outlives small talk
+            return (len(ACTION_CUES.findall(text)) + (index in answers), bool(re.search(r"\d", text)), sizes[index])
+
+        dropped = set()
+        for index in sorted(range(len(turns)), key=value):
+            if total <= self.token_budget:
+                break
+            dropped.add(index)
+            total -= sizes[index]
+        return [turn for index, turn in enumerate(turns) if index not in dropped], len(dropped)
+
+    def compact(self, transcript: str) -> Dict[str, Any]:
+        """Compacted transcript plus token counts before and after"""
+        original_tokens = estimate_tokens(transcript)
+        if not self.enabled:
+            return {"transcript": transcript, "original_tokens": original_tokens, "compacted_tokens": original_tokens,
+                    "ratio": 1.0, "dropped_turns": 0, "budget_dropped_turns": 0}
+
+        turns: List[List[str]] = []
+        answers: Set[int] = set()  # Indexes of turns that reply to another speaker's request
+        dropped = 0
+        previous: Tuple[Optional[str], str] = (None, "")
+        for line in transcript.split("\n"):
+            speaker, text = self._split_turn(line.strip())
+            if not text.strip():
+                continue
+            answers_request = speaker is not None and previous[0] not in (None, speaker) and self._is_request(previous[1])
+            previous = (speaker, text)
+            if self._is_backchannel(text) and not answers_request:
+                dropped += 1
+                continue
+            text = self._clean(text)
+            if not text:
+                dropped += 1
+                continue
+            if turns and speaker is not None and turns[-1][0] == speaker:
+                turns[-1][1] = f"{turns[-1][1]} {text}"
+            else:
+                turns.append([speaker, text])
+            if answers_request:
+                answers.add(len(turns) - 1)
+
+        turns, budget_dropped = self._fit_budget(turns, answers)
+        compacted = "\n".join(f"{speaker}: {text}" if speaker else text for speaker, text in turns)
+        if not compacted:
+            # Nothing but back-channel; let the LLM see the original rather than an empty prompt
+            compacted = transcript
+        compacted_tokens = estimate_tokens(compacted)
+
+        self._totals["transcripts"] += 1
+        self._totals["original_tokens"] += original_tokens
+        self._totals["compacted_tokens"] += compacted_tokens
+        self._totals["dropped_turns"] += dropped + budget_dropped
+        self._totals["over_budget"] += bool(budget_dropped)
+        return {
+            "transcript": compacted,
+            "original_tokens": original_tokens,
+            "compacted_tokens": compacted_tokens,
+            "ratio": round(compacted_tokens / original_tokens, 3) if original_tokens else 1.0,
+            "dropped_turns": dropped,
+            "budget_dropped_turns": budget_dropped
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        original = self._totals["original_tokens"]
+        return {
+            **self._totals,
+            "ratio": round(self._totals["compacted_tokens"] / original, 3) if original else 1.0
+        }
+
+
+# Global instance
+transcript_compactor = TranscriptCompactor(
+    enabled=settings.TRANSCRIPT_COMPACTION_ENABLED,
+    backchannel=settings.TRANSCRIPT_BACKCHANNEL_PHRASES,
+    inline_fillers=settings.TRANSCRIPT_INLINE_FILLERS,
+    token_budget=settings.TRANSCRIPT_TOKEN_BUDGET
+)
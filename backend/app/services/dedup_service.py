@@ -0,0 +1,271 @@
+import asyncio
+import re
+import zlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.database import SessionLocal, Task
+
+
+# Tasks vectorized at once while building the index
+BUILD_BATCH_SIZE = 10000
+# Distinct words whose hashed features are kept; the cache is cleared when full
+WORD_CACHE_SIZE = 50000
+
+
+def normalize_text(value: Optional[str]) -> str:
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s]", " ", (value or "").lower())).strip()
+
+
+class HashingVectorizer:
+    """Signed feature hashing of words, word bigrams and character trigrams into unit vectors"""
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+        self._words: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _hash(self, features: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        # crc32 is stable across processes, unlike hash()
+        digests = np.array([zlib.crc32(feature.encode("utf-8")) for feature in features], dtype=np.int64)
+        return digests % self.dimensions, np.where(digests & 0x80000000, 1.0, -1.0)
+
+    def _word_features(self, word: str) -> Tuple[np.ndarray, np.ndarray]:
+        """The word itself plus its padded character trigrams, cached per word"""
+        cached = self._words.get(word)
+        if cached is None:
+            if len(self._words) >= WORD_CACHE_SIZE:
+                self._words.clear()
+            padded = f" {word} "
+            cached = self._words[word] = self._hash([word] + [padded[i:i + 3] for i in range(len(padded) - 2)])
+        return cached
+
+    def transform(self, values: Sequence[str]) -> np.ndarray:
+        cols, signs, counts = [], [], []
+        for value in values:
+            words = normalize_text(value).split()
+            features = [self._word_features(word) for word in words]
+            if len(words) > 1:
+                features.append(self._hash([f"{a} {b}" for a, b in zip(words, words[1:])]))
+            cols.extend(feature_cols for feature_cols, _ in features)
+            signs.extend(feature_signs for _, feature_signs in features)
+            counts.append(sum(len(feature_cols) for feature_cols, _ in features))
+
+        size = len(values) * self.dimensions
+        if cols:
+            rows = np.repeat(np.arange(len(values), dtype=np.int64), counts)
+            cells = rows * self.dimensions + np.concatenate(cols)
+            matrix = np.bincount(cells, weights=np.concatenate(signs), minlength=size)
+        else:
+            matrix = np.zeros(size)
+        matrix = matrix.astype(np.float32).reshape(len(values), self.dimensions)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+
+class _Partition:
+    """Growable matrix of one assignee's open task vectors"""
+
+    def __init__(self, dimensions: int):
+        self.vectors = np.zeros((16, dimensions), dtype=np.float32)
+        self.task_ids = np.zeros(16, dtype=np.int64)
+        self.meeting_pks = np.zeros(16, dtype=np.int64)
+        self.size = 0
+
+    def append(self, task_id: int, meeting_pk: int, vector: np.ndarray) -> int:
+        if self.size == len(self.task_ids):
+            self.vectors = np.concatenate([self.vectors, np.zeros_like(self.vectors)])
+            self.task_ids = np.concatenate([self.task_ids, np.zeros_like(self.task_ids)])
+            self.meeting_pks = np.concatenate([self.meeting_pks, np.zeros_like(self.meeting_pks)])
+        self.vectors[self.size] = vector
+        self.task_ids[self.size] = task_id
+        self.meeting_pks[self.size] = meeting_pk
+        self.size += 1
+        return self.size - 1
+
+    def remove_at(self, position: int) -> Optional[int]:
+        """Swap the last row into position; returns the task id that moved, if any"""
+        self.size -= 1
+        if position == self.size:
+            return None
+        self.vectors[position] = self.vectors[self.size]
+        self.task_ids[position] = self.task_ids[self.size]
+        self.meeting_pks[position] = self.meeting_pks[self.size]
+        return int(self.task_ids[position])
+
+
+class TaskDedupIndex:
+    """
+    Nearest-neighbour index of open tasks, partitioned by assignee.
+
+    Built from the database on first use (in a worker thread) and kept up to
+    date as tasks are added, completed or replaced in this process. New tasks
+    for a meeting are vectorized together and compared against their
+    assignee's partition with one matrix product per assignee.
+    """
+
+    def __init__(self, mode: str, threshold: float, dimensions: int):
+        self.mode = mode
+        self.threshold = threshold
+        self.vectorizer = HashingVectorizer(dimensions)
+        self._partitions: Dict[str, _Partition] = {}
+        self._positions: Dict[int, Tuple[str, int, int]] = {}  # task id -> (assignee key, row, meeting pk)
+        self._meetings: Dict[int, Set[int]] = {}
+        self._built = False
+        self._pending: Optional[List[Tuple[Callable, Tuple]]] = None  # Changes made while the index is being built
+        self._lock = asyncio.Lock()
+        self._warmup: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode in ("link", "merge")
+
+    def add(self, rows: Iterable[Tuple[int, int, str, str]]):
+        """Index (task id, meeting pk, assignee, description) rows"""
+        rows = [row for row in rows if row[0] not in self._positions]
+        for offset in range(0, len(rows), BUILD_BATCH_SIZE):
+            batch = rows[offset:offset + BUILD_BATCH_SIZE]
+            vectors = self.vectorizer.transform([description or "" for _, _, _, description in batch])
+            for (task_id, meeting_pk, assignee, _), vector in zip(batch, vectors):
+                key = normalize_text(assignee)
+                partition = self._partitions.get(key)
+                if partition is None:
+                    partition = self._partitions[key] = _Partition(self.vectorizer.dimensions)
+                self._positions[task_id] = (key, partition.append(task_id, meeting_pk, vector), meeting_pk)
+                self._meetings.setdefault(meeting_pk, set()).add(task_id)
+
+    def _apply(self, change: Callable, *args):
+        """Make a change now, replay it after the build if one is running, or drop it if the index isn't built"""
+        if self._pending is not None:
+            self._pending.append((change, args))
+        elif self._built:
+            change(*args)
+
+    def add_tasks(self, tasks: Iterable[Task]):
+        """Index newly committed open tasks that aren't themselves duplicates"""
+        self._apply(self.add, [
+            (task.id, task.meeting_id, task.assignee_name, task.task_description)
+            for task in tasks if not task.is_completed and task.duplicate_of_id is None
+        ])
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]]):
+        """add_tasks for rows written with a bulk insert rather than as Task objects"""
+        self._apply(self.add, [
+            (row["id"], row["meeting_id"], row["assignee_name"], row["task_description"])
+            for row in rows if not row["is_completed"] and row["duplicate_of_id"] is None
+        ])
+
+    def remove(self, task_id: int):
+        self._apply(self._remove, task_id)
+
+    def forget_meeting(self, meeting_pk: int):
+        self._apply(self._forget_meeting, meeting_pk)
+
+    def _remove(self, task_id: int):
+        entry = self._positions.pop(task_id, None)
+        if entry is None:
+            return
+        key, position, meeting_pk = entry
+        moved = self._partitions[key].remove_at(position)
+        if moved is not None:
+            moved_key, _, moved_meeting = self._positions[moved]
+            self._positions[moved] = (moved_key, position, moved_meeting)
+        self._meetings.get(meeting_pk, set()).discard(task_id)
+
+    def _forget_meeting(self, meeting_pk: int):
+        for task_id in list(self._meetings.pop(meeting_pk, ())):
+            self._remove(task_id)
+
+    def find(
+        self,
+        assignees: Sequence[str],
+        descriptions: Sequence[str],
+        exclude_meeting: Optional[int] = None
+    ) -> List[Optional[int]]:
+        """Closest open task id above the threshold for each (assignee, description), or None; exclude_meeting's own tasks never match"""
+        matches: List[Optional[int]] = [None] * len(descriptions)
+        if not descriptions:
+            return matches
+
+        vectors = self.vectorizer.transform(descriptions)
+        by_assignee: Dict[str, List[int]] = {}
+        for index, assignee in enumerate(assignees):
+            by_assignee.setdefault(normalize_text(assignee), []).append(index)
+
+        for key, indexes in by_assignee.items():
+            partition = self._partitions.get(key)
+            if partition is None or partition.size == 0:
+                continue
+            # (open tasks x new tasks) cosine similarities; vectors are unit length
+            similarities = partition.vectors[:partition.size] @ vectors[indexes].T
+            if exclude_meeting is not None:
+                similarities[partition.meeting_pks[:partition.size] == exclude_meeting] = -np.inf
+            best_rows = similarities.argmax(axis=0)
+            best_scores = similarities[best_rows, np.arange(len(indexes))]
+            for index, row, score in zip(indexes, best_rows, best_scores):
+                if score >= self.threshold:
+                    matches[index] = int(partition.task_ids[row])
+        return matches
+
+    async def start(self):
+        """Build the index in the background so the first extraction doesn't wait for it"""
+        if self.enabled and self._warmup is None:
+            self._warmup = asyncio.create_task(self._build_in_background())
+
+    async def stop(self):
+        if self._warmup is not None:
+            self._warmup.cancel()
+            await asyncio.gather(self._warmup, return_exceptions=True)
+            self._warmup = None
+
+    async def _build_in_background(self):
+        try:
+            async with SessionLocal() as db:
+                await self.ensure_built(db)
+        except Exception as e:
+            print(f"❌ Task dedup index build failed: {e}")
+
+    async def ensure_built(self, db: AsyncSession):
+        async with self._lock:
+            if self._built:
+                return
+            # Changes committed while the snapshot is read and indexed are replayed on top of it
+            self._pending = []
+            try:
+                rows = (await db.execute(
+                    select(Task.id, Task.meeting_id, Task.assignee_name, Task.task_description)
+                    .where(Task.is_completed.is_(False), Task.duplicate_of_id.is_(None))
+                )).all()
+                await asyncio.to_thread(self.add, rows)
+                for change, args in self._pending:
+                    change(*args)
+                self._built = True
+            finally:
+                self._pending = None
+            print(f"✅ Task dedup index built with {len(rows)} open tasks")
+
+    async def find_duplicates(
+        self,
+        db: AsyncSession,
+        tasks: List[Dict[str, Any]],
+        exclude_meeting: Optional[int] = None
+    ) -> List[Optional[int]]:
+        """Near-duplicate open task for each extracted task dict (never one of exclude_meeting's own tasks)"""
+        if not self.enabled or not tasks:
+            return [None] * len(tasks)
+        await self.ensure_built(db)
+        return self.find(
+            [task["assignee_name"] for task in tasks],
+            [task["task_description"] for task in tasks],
+            exclude_meeting
+        )
+
+
+# Global instance
+task_dedup = TaskDedupIndex(
+    mode=settings.TASK_DEDUP_MODE,
+    threshold=settings.TASK_DEDUP_THRESHOLD,
+    dimensions=settings.TASK_DEDUP_DIMENSIONS
+)
@@ -0,0 +1,215 @@
+"""
+Local stand-in for the Gemini chat model, for load tests and benchmarks.
+
+Answers the extraction, modification and patch prompts with parsable JSON
+built from the transcript in the prompt, after a latency drawn from a
+configurable distribution, and fails a configurable share of calls with
+429s or server errors. Output depends only on the prompt and seed, so the
+same transcript gives the same tasks (and cache keys behave as with Gemini);
+latency and failures are drawn per attempt, so retries can succeed.
+"""
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.exceptions import ModelAPIError, ModelRateLimitError
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+SPEAKER_LINE = re.compile(r"^([A-Z][\w'.-]*(?: [A-Z][\w'.-]*){0,2}): (.+)$", re.MULTILINE)
+TASK_ID = re.compile(r'"id": (\d+)')
+# Where the transcript (or excerpts) start in each prompt, and the headings that follow it
+TRANSCRIPT_MARKERS = ("Relevant Transcript Excerpts:", "Original Meeting Transcript:", "Meeting Transcript:")
+SECTION_ENDS = ("Current Task", "User's Modification Request", "Based on the user's request", "The output should be")
+PRIORITIES = ["High", "Medium", "Low"]
+# Prompts whose attempt counts are remembered (least recently called are forgotten), so long runs don't grow memory
+ATTEMPT_HISTORY = 4096
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Sampler for "fixed:S", "uniform:LOW,HIGH", "lognormal:MEDIAN,SIGMA" or "exponential:MEAN" (seconds)"""
+    kind, _, args = spec.partition(":")
+    try:
+        values = [float(value) for value in args.split(",")] if args else []
+    except ValueError:
+        raise ValueError(f"Invalid latency distribution {spec!r}")
+    samplers = {
+        ("fixed", 1): lambda rng: values[0],
+        ("uniform", 2): lambda rng: rng.uniform(values[0], values[1]),
+        ("lognormal", 2): lambda rng: values[0] * rng.lognormvariate(0.0, values[1]),
+        ("exponential", 1): lambda rng: rng.expovariate(1.0 / values[0]) if values[0] > 0 else 0.0,
+    }
+    sampler = samplers.get((kind.strip().lower(), len(values)))
+    if sampler is None:
+        raise ValueError(f"Invalid latency distribution {spec!r}; expected fixed:S, uniform:LOW,HIGH, lognormal:MEDIAN,SIGMA or exponential:MEAN")
+    return sampler
+
+
+def _transcript_section(prompt: str) -> str:
+    for marker in TRANSCRIPT_MARKERS:
+        start = prompt.find(marker)
+        if start != -1:
+            lines = []
+            for line in prompt[start + len(marker):].splitlines():
+                if line.startswith(SECTION_ENDS):
+                    break
+                lines.append(line)
+            return "\n".join(lines)
+    return prompt
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class FakeChatModel(BaseChatModel):
+    """Deterministic chat model returning task JSON after a simulated delay"""
+
+    seed: int = 0
+    latency: str = "lognormal:1.0,0.5"
+    tokens_per_second: float = 0.0  # Streaming rate after the first chunk; 0 sends the response in one chunk
+    min_tasks: int = 2
+    max_tasks: int = 8
+    failure_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+
+    def model_post_init(self, __context: Any):
+        super().model_post_init(__context)
+        self._sample_latency = parse_latency(self.latency)
+        self._attempts: "OrderedDict[str, int]" = OrderedDict()
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def _prompt_text(self, messages: List[BaseMessage]) -> str:
+        return "\n".join(message.text for message in messages)
+
+    def _attempt_rng(self, prompt: str) -> random.Random:
+        """Randomness for this attempt's latency and failures; differs per retry of the same prompt"""
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        attempt = self._attempts.pop(digest, 0) + 1
+        self._attempts[digest] = attempt
+        if len(self._attempts) > ATTEMPT_HISTORY:
+            self._attempts.popitem(last=False)
+        return random.Random(f"{self.seed}:{digest}:{attempt}")
+
+    def _check_failure(self, rng: random.Random):
+        draw = rng.random()
+        if draw < self.rate_limit_rate:
+            raise ModelRateLimitError("429 RESOURCE_EXHAUSTED: fake backend rate limit")
+        if draw < self.rate_limit_rate + self.failure_rate:
+            raise ModelAPIError("503 UNAVAILABLE: fake backend failure")
+
+    def respond(self, prompt: str) -> str:
+        """The response text for a prompt (depends only on the prompt and seed)"""
+        rng = random.Random(f"{self.seed}:{hashlib.sha256(prompt.encode('utf-8')).hexdigest()}")
+        lines = [(speaker, text.strip()) for speaker, text in SPEAKER_LINE.findall(_transcript_section(prompt))]
+        if not lines:
+            lines = [("Unassigned", "Follow up on the meeting")]
+
+        def make_task() -> Dict[str, Any]:
+            speaker, text = rng.choice(lines)
+            return {
+                "title": " ".join(text.split()[:6]),
+                "description": f"Follow up: {text[:160]}",
+                "assignee": speaker,
+                "priority": rng.choice(PRIORITIES),
+                "deadline": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" if rng.random() < 0.4 else None
+            }
+
+        if "Relevant Transcript Excerpts:" in prompt:
+            ids = [int(task_id) for task_id in TASK_ID.findall(prompt)]
+            patch = {"add": [make_task()], "update": [], "remove": []}
+            if ids:
+                patch["update"].append({"id": ids[0], "priority": rng.choice(PRIORITIES)})
+            if len(ids) > 2:
+                patch["remove"].append(ids[-1])
+            return json.dumps(patch, indent=2)
+
+        count = rng.randint(self.min_tasks, max(self.min_tasks, self.max_tasks))
+        return json.dumps({"tasks": [make_task() for _ in range(count)]}, indent=2)
+
+    def _usage(self, prompt: str, response: str) -> Dict[str, int]:
+        input_tokens, output_tokens = _estimate_tokens(prompt), _estimate_tokens(response)
+        return {"input_tokens": input_tokens, "output_tokens": output_tokens, "total_tokens": input_tokens + output_tokens}
+
+    def _chunks(self, response: str) -> List[str]:
+        if self.tokens_per_second <= 0:
+            return [response]
+        step = 4 * 8  # Eight tokens of about four characters per chunk
+        return [response[offset:offset + step] for offset in range(0, len(response), step)]
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        prompt = self._prompt_text(messages)
+        rng = self._attempt_rng(prompt)
+        time.sleep(self._sample_latency(rng))
+        self._check_failure(rng)
+        response = self.respond(prompt)
+        message = AIMessage(content=response, usage_metadata=self._usage(prompt, response))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        prompt = self._prompt_text(messages)
+        rng = self._attempt_rng(prompt)
+        response = self.respond(prompt)
+        delay = self._sample_latency(rng)
+        if self.tokens_per_second > 0:
+            delay += _estimate_tokens(response) / self.tokens_per_second
+        await asyncio.sleep(delay)
+        self._check_failure(rng)
+        message = AIMessage(content=response, usage_metadata=self._usage(prompt, response))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> Iterator[ChatGenerationChunk]:
+        result = self._generate(messages, stop, run_manager, **kwargs)
+        yield ChatGenerationChunk(message=AIMessageChunk(
+            content=result.generations[0].message.content,
+            usage_metadata=result.generations[0].message.usage_metadata
+        ))
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        prompt = self._prompt_text(messages)
+        rng = self._attempt_rng(prompt)
+        await asyncio.sleep(self._sample_latency(rng))  # Time to first token
+        self._check_failure(rng)
+        response = self.respond(prompt)
+        chunks = self._chunks(response)
+        for index, chunk in enumerate(chunks):
+            if index and self.tokens_per_second > 0:
+                await asyncio.sleep(_estimate_tokens(chunk) / self.tokens_per_second)
+            last = index == len(chunks) - 1
+            yield ChatGenerationChunk(message=AIMessageChunk(
+                content=chunk,
+                usage_metadata=self._usage(prompt, response) if last else None
+            ))
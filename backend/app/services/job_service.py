@@ -0,0 +1,265 @@
+import asyncio
+import json
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.database import SessionLocal, ProcessingJob, Meeting
+from app.services.transcript_service import process_meeting_transcript
+
+TERMINAL_STATUSES = ("completed", "failed")
+UNFINISHED_STATUSES = ("queued", "running")
+
+
+def serialize_job(job: ProcessingJob) -> Dict[str, Any]:
+    """Convert a job row into an API response"""
+    payload = json.loads(job.payload) if job.payload else {}
+    return {
+        "job_id": job.id,
+        "job_type": job.job_type,
+        "meeting_id": payload.get("meeting_id"),
+        "status": job.status,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "result": json.loads(job.result) if job.result else None,
+        "error": job.error
+    }
+
+
+class JobQueue:
+    """
+    In-process worker pool for jobs persisted in the processing_jobs table.
+
+    Each unfinished job is owned by the process that enqueued (or adopted) it,
+    which refreshes the job's heartbeat while it lives. Several API processes
+    can share the table: a job is only run by its owner, claimed with a
+    conditional UPDATE, and jobs whose owner stopped heartbeating are adopted
+    by another process and start over.
+    """
+
+    def __init__(self, concurrency: int, heartbeat_seconds: float, stale_seconds: float):
+        self.concurrency = max(1, concurrency)
+        self.heartbeat_seconds = heartbeat_seconds
+        self.stale_seconds = stale_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._monitor: Optional[asyncio.Task] = None
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._streamed_tasks: Dict[str, List[Dict[str, Any]]] = {}  # Tasks generated so far by running jobs
+
+    async def start(self):
+        """Adopt abandoned jobs and start the workers"""
+        self._queue = asyncio.Queue()
+        await self._adopt_abandoned()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        self._monitor = asyncio.create_task(self._heartbeat())
+
+    async def stop(self):
+        tasks = self._workers + ([self._monitor] if self._monitor else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._monitor = None
+
+        # Hand our unfinished jobs back right away rather than after they go stale
+        try:
+            async with SessionLocal() as db:
+                await db.execute(
+                    update(ProcessingJob)
+                    .where(ProcessingJob.owner == self.owner, ProcessingJob.status.in_(UNFINISHED_STATUSES))
+                    .values(status="queued", started_at=None, heartbeat_at=None)
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+        except Exception as e:
+            print(f"❌ Failed to release unfinished jobs: {e}")
+
+    async def _adopt_abandoned(self) -> int:
+        """Take over unfinished jobs whose owner stopped heartbeating; they start over in this process"""
+        now = datetime.utcnow()
+        stale = now - timedelta(seconds=self.stale_seconds)
+        async with SessionLocal() as db:
+            # The heartbeat condition is re-checked as each row is updated, so two processes never adopt the same job
+            result = await db.execute(
+                update(ProcessingJob)
+                .where(
+                    ProcessingJob.status.in_(UNFINISHED_STATUSES),
+                    or_(ProcessingJob.heartbeat_at.is_(None), ProcessingJob.heartbeat_at < stale)
+                )
+                .values(status="queued", owner=self.owner, started_at=None, heartbeat_at=now)
+                .returning(ProcessingJob.id, ProcessingJob.created_at)
+                .execution_options(synchronize_session=False)
+            )
+            adopted = sorted(result.all(), key=lambda row: (row.created_at or now, row.id))
+            await db.commit()
+
+        for job_id, _ in adopted:
+            self._queue.put_nowait(job_id)
+        if adopted:
+            print(f"Recovered {len(adopted)} unfinished job(s)")
+        return len(adopted)
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                async with SessionLocal() as db:
+                    await db.execute(
+                        update(ProcessingJob)
+                        .where(ProcessingJob.owner == self.owner, ProcessingJob.status.in_(UNFINISHED_STATUSES))
+                        .values(heartbeat_at=datetime.utcnow())
+                        .execution_options(synchronize_session=False)
+                    )
+                    await db.commit()
+                await self._adopt_abandoned()
+            except Exception as e:
+                print(f"❌ Job heartbeat failed: {e}")
+
+    async def enqueue(self, db: AsyncSession, meeting: Meeting, payload: Dict[str, Any], job_type: str = "process_transcript") -> ProcessingJob:
+        """Persist a job and hand it to the workers, reusing an unfinished job for the same meeting"""
+        unfinished = select(ProcessingJob).where(
+            ProcessingJob.meeting_id == meeting.id,
+            ProcessingJob.job_type == job_type,
+            ProcessingJob.status.in_(UNFINISHED_STATUSES)
+        )
+        existing = await db.scalar(unfinished)
+        if existing:
+            return existing
+
+        job = ProcessingJob(
+            id=uuid.uuid4().hex,
+            job_type=job_type,
+            meeting_id=meeting.id,
+            status="queued",
+            payload=json.dumps({"meeting_id": meeting.meeting_id, **payload}),
+            owner=self.owner,
+            heartbeat_at=datetime.utcnow()
+        )
+        db.add(job)
+        try:
+            await db.commit()
+        except IntegrityError:
+            # A concurrent request enqueued one first (uq_processing_jobs_unfinished)
+            await db.rollback()
+            existing = await db.scalar(unfinished)
+            if existing:
+                return existing
+            raise
+
+        self._queue.put_nowait(job.id)
+        return job
+
+    async def get_job(self, db: AsyncSession, job_id: str) -> Optional[ProcessingJob]:
+        return await db.get(ProcessingJob, job_id)
+
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        """Receive every (event, data) for a job: status changes, and tasks as the LLM generates them"""
+        updates = asyncio.Queue()
+        self._subscribers.setdefault(job_id, set()).add(updates)
+        return updates
+
+    def streamed_tasks(self, job_id: str) -> List[Dict[str, Any]]:
+        """Tasks a running job has generated so far, for subscribers that join late"""
+        return list(self._streamed_tasks.get(job_id, ()))
+
+    def unsubscribe(self, job_id: str, updates: asyncio.Queue):
+        listeners = self._subscribers.get(job_id)
+        if listeners:
+            listeners.discard(updates)
+            if not listeners:
+                del self._subscribers[job_id]
+
+    def _publish(self, job_id: str, event: str, data: Dict[str, Any]):
+        for updates in self._subscribers.get(job_id, ()):
+            updates.put_nowait((event, data))
+
+    def _publish_status(self, job: ProcessingJob):
+        self._publish(job.id, "status", serialize_job(job))
+
+    def _publish_task(self, job_id: str, task: Dict[str, Any]):
+        self._streamed_tasks.setdefault(job_id, []).append(task)
+        self._publish(job_id, "task", task)
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                print(f"❌ Job {job_id} crashed: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str):
+        async with SessionLocal() as db:
+            # Claim the job; another process may have adopted it (or it may have finished) since it was queued here
+            now = datetime.utcnow()
+            claimed = await db.execute(
+                update(ProcessingJob)
+                .where(ProcessingJob.id == job_id, ProcessingJob.status == "queued", ProcessingJob.owner == self.owner)
+                .values(status="running", started_at=now, heartbeat_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            if claimed.rowcount != 1:
+                return
+
+            job = await db.get(ProcessingJob, job_id)
+            self._publish_status(job)
+
+            payload = json.loads(job.payload) if job.payload else {}
+            try:
+                meeting = await db.get(Meeting, job.meeting_id)
+                if not meeting:
+                    result = {"success": False, "error": "Meeting not found"}
+                else:
+                    result = await process_meeting_transcript(
+                        db,
+                        meeting,
+                        payload.get("additional_context"),
+                        payload.get("bypass_cache", False),
+                        payload.get("llm_priority", "default"),
+                        on_task=lambda task: self._publish_task(job_id, task)
+                    )
+            except Exception as e:
+                await db.rollback()
+                result = {"success": False, "error": str(e)}
+            finally:
+                self._streamed_tasks.pop(job_id, None)
+
+            if result["success"]:
+                outcome = {"status": "completed", "result": json.dumps(result, default=str)}
+            else:
+                outcome = {"status": "failed", "error": result["error"]}
+            finished = await db.execute(
+                update(ProcessingJob)
+                .where(ProcessingJob.id == job_id, ProcessingJob.owner == self.owner, ProcessingJob.status == "running")
+                .values(finished_at=datetime.utcnow(), **outcome)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            if finished.rowcount != 1:
+                # Our heartbeat lapsed and another process adopted the job; its run is the one that counts
+                print(f"❌ Job {job_id} was taken over by another process; discarding this run's result")
+                return
+
+            job = await db.get(ProcessingJob, job_id, populate_existing=True)
+            self._publish_status(job)
+
+            print(f"Job {job_id} {job.status}")
+
+
+# Global instance
+job_queue = JobQueue(
+    settings.JOB_WORKER_CONCURRENCY,
+    heartbeat_seconds=settings.JOB_HEARTBEAT_SECONDS,
+    stale_seconds=settings.JOB_STALE_SECONDS
+)
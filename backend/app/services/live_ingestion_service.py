@@ -0,0 +1,137 @@
+import asyncio
+import json
+from typing import Dict, List, Any
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.database import SessionLocal, Meeting, Transcript, encode_raw_transcript
+from app.services.vexa_service import vexa_service
+from app.services.llm_service import llm_service
+from app.services.search_service import search_service
+
+
+class LiveIngestionService:
+    """Polls Vexa while a meeting is active and appends new segments to its transcript"""
+
+    def __init__(self):
+        self._pollers: Dict[str, asyncio.Task] = {}
+
+    async def start(self):
+        """Resume polling for meetings that were active when the process stopped"""
+        if not settings.LIVE_INGESTION_ENABLED:
+            return
+
+        async with SessionLocal() as db:
+            result = await db.scalars(select(Meeting.meeting_id).where(Meeting.status == "active"))
+            for meeting_id in result.all():
+                self.watch(meeting_id)
+
+    async def stop(self):
+        pollers = list(self._pollers.values())
+        for poller in pollers:
+            poller.cancel()
+        await asyncio.gather(*pollers, return_exceptions=True)
+        self._pollers = {}
+
+    def watch(self, meeting_id: str):
+        """Start polling a meeting (no-op if disabled or already polling)"""
+        if not settings.LIVE_INGESTION_ENABLED or meeting_id in self._pollers:
+            return
+        self._pollers[meeting_id] = asyncio.create_task(self._poll(meeting_id))
+
+    async def unwatch(self, meeting_id: str):
+        poller = self._pollers.pop(meeting_id, None)
+        if poller:
+            poller.cancel()
+            await asyncio.gather(poller, return_exceptions=True)
+
+    async def _poll(self, meeting_id: str):
+        try:
+            while True:
+                async with SessionLocal() as db:
+                    meeting = await db.scalar(select(Meeting).where(Meeting.meeting_id == meeting_id))
+                    if not meeting or meeting.status != "active":
+                        break
+                    try:
+                        await self.ingest_new_segments(db, meeting, extract=settings.LIVE_ROLLING_EXTRACTION)
+                    except Exception as e:
+                        await db.rollback()
+                        print(f"Error ingesting live transcript for {meeting_id}: {e}")
+                await asyncio.sleep(settings.LIVE_POLL_INTERVAL_SECONDS)
+        finally:
+            if self._pollers.get(meeting_id) is asyncio.current_task():
+                del self._pollers[meeting_id]
+
+    async def ingest_new_segments(self, db: AsyncSession, meeting: Meeting, extract: bool = False) -> int:
+        """Append segments Vexa has produced since the last poll; returns how many were new"""
+        transcript_result = await vexa_service.get_transcript(meeting.meeting_id)
+        if not transcript_result["success"]:
+            print(f"Live ingestion fetch failed for {meeting.meeting_id}: {transcript_result['error']}")
+            return 0
+
+        raw_transcript = transcript_result["transcript"]
+        segments = vexa_service.get_segments(raw_transcript) or []
+
+        transcript = await db.scalar(select(Transcript).where(Transcript.meeting_id == meeting.id))
+        if transcript is None:
+            transcript = Transcript(
+                meeting_id=meeting.id,
+                processed_transcript="",
+                segments_ingested=0,
+                extracted_chars=0
+            )
+            db.add(transcript)
+
+        # Vexa returns the full segment list; only the part past our cursor is processed
+        new_segments = segments[transcript.segments_ingested or 0:]
+        if not new_segments:
+            return 0
+
+        if any(str(segment.get("text", "")).strip() for segment in new_segments):
+            delta_text = vexa_service.process_transcript_data({"segments": new_segments})
+            transcript.processed_transcript = (
+                f"{transcript.processed_transcript}\n{delta_text}" if transcript.processed_transcript else delta_text
+            )
+        transcript.raw_transcript_data = encode_raw_transcript(raw_transcript)
+        transcript.speakers = ", ".join(vexa_service.get_speakers(segments))
+        transcript.segments_ingested = len(segments)
+        await db.commit()
+        await search_service.index_meeting(db, meeting.id)
+
+        if extract and len(transcript.processed_transcript) - (transcript.extracted_chars or 0) >= settings.LIVE_EXTRACTION_WINDOW_CHARS:
+            await self.extract_pending_window(db, transcript, meeting.meeting_id)
+
+        return len(new_segments)
+
+    def pending_window(self, transcript: Transcript) -> str:
+        """Transcript text not yet covered by rolling extraction, plus a few turns of leading context"""
+        extracted_chars = transcript.extracted_chars or 0
+        text = transcript.processed_transcript or ""
+        if extracted_chars <= 0:
+            return text
+
+        context_turns = text[:extracted_chars].split("\n")[-settings.EXTRACTION_CHUNK_OVERLAP_TURNS:]
+        return "\n".join(context_turns + [text[extracted_chars:].lstrip("\n")])
+
+    def rolling_tasks(self, transcript: Transcript) -> List[Dict[str, Any]]:
+        return json.loads(transcript.rolling_tasks) if transcript.rolling_tasks else []
+
+    async def extract_pending_window(self, db: AsyncSession, transcript: Transcript, meeting_id: str):
+        """Run extraction on the newest window and fold the result into the rolling task list"""
+        covered = len(transcript.processed_transcript)
+        llm_result = await llm_service.extract_tasks_from_transcript(
+            self.pending_window(transcript), meeting_id=meeting_id, priority="batch"
+        )
+        if not llm_result["success"]:
+            print(f"Rolling extraction failed for {meeting_id}: {llm_result['error']}")
+            return
+
+        merged = llm_service.merge_task_data([self.rolling_tasks(transcript), llm_result["tasks"]])
+        transcript.rolling_tasks = json.dumps(merged)
+        transcript.extracted_chars = covered
+        await db.commit()
+        print(f"Rolling extraction for {meeting_id}: {len(merged)} tasks so far")
+
+
+# Global instance
+live_ingestion = LiveIngestionService()
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class LLMBackend:
+    """A chat model LLMService can run its prompts on"""
+    model_name: str  # Part of LLM cache keys, so results from different backends never mix
+    create: Callable[[float], Any]  # temperature -> LangChain chat model (imports its SDK lazily)
+
+
+LLM_BACKENDS: Dict[str, LLMBackend] = {}
+
+
+def register_backend(name: str, model_name: str, create: Callable[[float], Any]):
+    LLM_BACKENDS[name] = LLMBackend(model_name, create)
+
+
+def get_backend(name: str) -> LLMBackend:
+    backend = LLM_BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown LLM_BACKEND {name!r}; available: {', '.join(sorted(LLM_BACKENDS))}")
+    return backend
+
+
+def _create_gemini(temperature: float):
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash",
+        google_api_key=settings.GEMINI_API_KEY,
+        temperature=temperature,
+        max_retries=1  # No SDK retries; llm_limiter retries with backoff that adapts to 429s
+    )
+
+
+def _create_fake(temperature: float):
+    from app.services.fake_llm import FakeChatModel
+
+    return FakeChatModel(
+        seed=settings.FAKE_LLM_SEED,
+        latency=settings.FAKE_LLM_LATENCY,
+        tokens_per_second=settings.FAKE_LLM_TOKENS_PER_SECOND,
+        min_tasks=settings.FAKE_LLM_MIN_TASKS,
+        max_tasks=settings.FAKE_LLM_MAX_TASKS,
+        failure_rate=settings.FAKE_LLM_FAILURE_RATE,
+        rate_limit_rate=settings.FAKE_LLM_RATE_LIMIT_RATE
+    )
+
+
+register_backend("gemini", "gemini-2.5-flash", _create_gemini)
+register_backend("fake", "fake", _create_fake)
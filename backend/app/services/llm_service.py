@@ -1,131 +1,209 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
+import asyncio
+import difflib
 import json
 import re
-import os
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable, List, Dict, Any, Optional
 from app.core.config import settings
-from app.models.task_models import TaskExtractionResponse, TaskModel
+from app.models.task_models import TaskExtractionResponse, TaskModel, TaskPatchResponse
+from app.services.cache_service import extraction_cache
+from app.services.artifact_service import artifact_sink
+from app.services.compaction_service import transcript_compactor, estimate_tokens
+from app.services.rate_limit_service import llm_limiter
+from app.services.metrics_service import record_llm_call, stage
+from app.services.llm_backends import get_backend
 
+if TYPE_CHECKING:
+    # LangChain and the Gemini SDK take about a second to import; they load on first use
+    from langchain_core.prompts import PromptTemplate
+
+# Tasks from overlapping chunks are the same task only when their descriptions are this similar
+DUPLICATE_TASK_RATIO = 0.95
+# Numbers, weekdays and months in a normalized description; tasks that differ in these are different work
+TASK_MARKERS = re.compile(
+    r"\d+|\b(?:mon|tues|wednes|thurs|fri|satur|sun)day\b|\b(?:today|tomorrow|tonight)\b|"
+    r"\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sept?(?:ember)?|"
+    r"oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b"
+)
+
+
+def _message_text(message) -> str:
+    """Text of a chat model message or chunk (or of a plain string from a non-chat runnable)"""
+    return message if isinstance(message, str) else message.text
+
+
+class IncrementalTaskParser:
+    """Pulls complete task objects out of a JSON response's "tasks" array while it is still being generated"""
 
-class LLMService:
     def __init__(self):
-        # Initialize LangChain's Gemini model with 2.5-flash
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.5-flash",
-            google_api_key=settings.GEMINI_API_KEY,
-            temperature=0.0
-        )
+        self._buffer = ""
+        self._position = None  # Next character to scan, once the array has started
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._object_start = 0
+        self._done = False
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        self._buffer += text
+        if self._position is None:
+            match = re.search(r'"tasks"\s*:\s*\[', self._buffer)
+            if not match:
+                return []
+            self._position = match.end()
         
-        # Create output parser for structured response
-        self.output_parser = PydanticOutputParser(pydantic_object=TaskExtractionResponse)
+        objects = []
+        buffer = self._buffer
+        index = self._position
+        while index < len(buffer) and not self._done:
+            char = buffer[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if self._depth == 0:
+                    self._object_start = index
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 0:
+                    self._done = True  # End of the tasks array
+                else:
+                    self._depth -= 1
+                    if self._depth == 0 and char == "}":
+                        try:
+                            objects.append(json.loads(buffer[self._object_start:index + 1]))
+                        except ValueError:
+                            pass  # The full parse at the end reports malformed output
+            index += 1
+        self._position = index
+        return objects
 
-    def _save_raw_transcript(self, transcript: str, meeting_id: str = None):
-        """Save raw transcript before any processing"""
-        try:
-            output_dir = "outputs"
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-                print(f"Created output directory: {output_dir}")
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"raw_transcript_{meeting_id}_{timestamp}.txt" if meeting_id else f"raw_transcript_{timestamp}.txt"
-            filepath = os.path.join(output_dir, filename)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write("="*80 + "\n")
-                f.write(f"RAW TRANSCRIPT\n")
-                f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                if meeting_id:
-                    f.write(f"Meeting ID: {meeting_id}\n")
-                f.write("="*80 + "\n\n")
-                f.write(transcript)
-                f.write("\n\n" + "="*80 + "\n")
-            
-            print(f"Raw transcript saved to: {filepath}")
-            return filepath
-            
-        except Exception as e:
-            print(f"Error saving raw transcript: {e}")
-            return None
 
-    def _save_llm_response(self, llm_response: str, meeting_id: str = None):
-        """Save LLM response before parsing"""
-        try:
-            output_dir = "outputs"
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"llm_response_{meeting_id}_{timestamp}.txt" if meeting_id else f"llm_response_{timestamp}.txt"
-            filepath = os.path.join(output_dir, filename)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write("="*80 + "\n")
-                f.write(f"LLM RAW RESPONSE\n")
-                f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                if meeting_id:
-                    f.write(f"Meeting ID: {meeting_id}\n")
-                f.write("="*80 + "\n\n")
-                f.write(llm_response)
-                f.write("\n\n" + "="*80 + "\n")
-            
-            print(f"LLM response saved to: {filepath}")
-            return filepath
-            
-        except Exception as e:
-            print(f"Error saving LLM response: {e}")
-            return None
+class LLMService:
+    def __init__(self, backend: str = settings.LLM_BACKEND):
+        self.backend = get_backend(backend)
+        self.model_name = self.backend.model_name
+        self.temperature = 0.0
+        self._llm = None
+        self._prompts: Dict[str, "PromptTemplate"] = {}
 
-    def _save_to_output_file(self, transcript: str, llm_response: str, tasks: list, meeting_id: str = None):
-        """Save transcript and LLM output to output.txt file"""
-        try:
-            output_dir = "outputs"
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"output_{meeting_id}_{timestamp}.txt" if meeting_id else f"output_{timestamp}.txt"
-            filepath = os.path.join(output_dir, filename)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write("="*80 + "\n")
-                f.write(f"MEETING TRANSCRIPT AND TASK EXTRACTION\n")
-                f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                if meeting_id:
-                    f.write(f"Meeting ID: {meeting_id}\n")
-                f.write("="*80 + "\n\n")
-                
-                f.write("ORIGINAL TRANSCRIPT:\n")
-                f.write("-"*40 + "\n")
-                f.write(transcript)
-                f.write("\n\n" + "-"*40 + "\n\n")
-                
-                f.write("LLM RAW RESPONSE:\n")
-                f.write("-"*40 + "\n")
-                f.write(llm_response)
-                f.write("\n\n" + "-"*40 + "\n\n")
-                
-                f.write("EXTRACTED TASKS:\n")
-                f.write("-"*40 + "\n")
-                for i, task in enumerate(tasks, 1):
-                    f.write(f"Task {i}:\n")
-                    f.write(f"  Assignee: {task.get('assignee_name', 'Unknown')}\n")
-                    f.write(f"  Description: {task.get('task_description', 'No description')}\n")
-                    f.write(f"  Deadline: {task.get('deadline', 'Not specified')}\n")
-                    f.write(f"  Priority: {task.get('priority', 'Not specified')}\n")
-                    f.write("\n")
-                
-                f.write("="*80 + "\n")
-            
-            print(f"Output saved to: {filepath}")
+    @property
+    def llm(self):
+        """The configured backend's chat model (Gemini 2.5 Flash by default), created on first use"""
+        if self._llm is None:
+            self._llm = self.backend.create(self.temperature)
+        return self._llm
+
+    @llm.setter
+    def llm(self, value):
+        self._llm = value
+
+    @cached_property
+    def output_parser(self):
+        """Output parser for structured extraction responses"""
+        from langchain_core.output_parsers import PydanticOutputParser
+        return PydanticOutputParser(pydantic_object=TaskExtractionResponse)
+
+    @cached_property
+    def patch_parser(self):
+        """Output parser for patch-style modification responses"""
+        from langchain_core.output_parsers import PydanticOutputParser
+        return PydanticOutputParser(pydantic_object=TaskPatchResponse)
+
+    def warm_up(self):
+        """Import and build the client, parsers and prompts ahead of the first request"""
+        self.llm
+        self.create_task_extraction_prompt()
+        self.create_task_modification_prompt()
+        self.create_task_patch_prompt()
+
+    def _prompt(self, name: str, template: str, input_variables: List[str], parser) -> "PromptTemplate":
+        """Build a prompt template once and reuse it"""
+        prompt = self._prompts.get(name)
+        if prompt is None:
+            from langchain_core.prompts import PromptTemplate
             
-        except Exception as e:
-            print(f"Error saving output file: {e}")
+            prompt = self._prompts[name] = PromptTemplate(
+                template=template,
+                input_variables=input_variables,
+                partial_variables={"format_instructions": parser.get_format_instructions()}
+            )
+        return prompt
+
+    async def _invoke(self, prompt_template: "PromptTemplate", parser, inputs: Dict[str, str], priority: str):
+        """Run prompt -> LLM -> parser through the shared rate limiter"""
+        chain = prompt_template | self.llm
+        prompt_tokens = estimate_tokens(prompt_template.format(**inputs))
+        
+        async def call():
+            with stage("llm_chain"):
+                try:
+                    message = await chain.ainvoke(inputs)
+                except Exception:
+                    record_llm_call(False, None, prompt_tokens, 0)
+                    raise
+            record_llm_call(True, getattr(message, "usage_metadata", None), prompt_tokens, estimate_tokens(_message_text(message)))
+            return await parser.ainvoke(message)
+        
+        return await llm_limiter.run(call, prompt_tokens + settings.LLM_RESPONSE_TOKEN_ESTIMATE, priority)
+
+    async def _invoke_streaming(self, prompt_template: "PromptTemplate", inputs: Dict[str, str], priority: str, on_task: Callable[[int, Dict[str, Any]], None]) -> TaskExtractionResponse:
+        """Like _invoke for extraction, but streams the response and reports (position, task object) as soon as each is complete"""
+        chain = prompt_template | self.llm
+        prompt_tokens = estimate_tokens(prompt_template.format(**inputs))
+        
+        async def call() -> TaskExtractionResponse:
+            parser = IncrementalTaskParser()
+            text = []
+            usage = {}
+            position = 0
+            with stage("llm_chain"):
+                try:
+                    async for chunk in chain.astream(inputs):
+                        delta = _message_text(chunk)
+                        text.append(delta)
+                        # Usage arrives on the final chunk (or is split across chunks); sum whatever is reported
+                        for key, value in (getattr(chunk, "usage_metadata", None) or {}).items():
+                            if isinstance(value, int):
+                                usage[key] = usage.get(key, 0) + value
+                        for task in parser.feed(delta):
+                            on_task(position, task)
+                            position += 1
+                except Exception:
+                    record_llm_call(False, None, prompt_tokens, 0)
+                    raise
+            response = "".join(text)
+            record_llm_call(True, usage, prompt_tokens, estimate_tokens(response))
+            return self.output_parser.parse(response)
+        
+        return await llm_limiter.run(call, prompt_tokens + settings.LLM_RESPONSE_TOKEN_ESTIMATE, priority)
+
+    def compact_transcript(self, transcript: str) -> str:
+        """Compact a transcript for a prompt and log how much smaller it got"""
+        compaction = transcript_compactor.compact(transcript)
+        if compaction["compacted_tokens"] < compaction["original_tokens"]:
+            print(
+                f"✅ Compacted transcript from ~{compaction['original_tokens']} to ~{compaction['compacted_tokens']} tokens "
+                f"(ratio {compaction['ratio']}, {compaction['dropped_turns'] + compaction['budget_dropped_turns']} turns dropped)"
+            )
+        return compaction["transcript"]
 
-    def create_task_extraction_prompt(self) -> PromptTemplate:
+    def _save_artifacts(self, transcript: str, llm_response: str, tasks: list, meeting_id: str = None):
+        """Queue the transcript and LLM output for the artifact sink (never blocks on disk)"""
+        transcript_sha = artifact_sink.submit("transcript", transcript, meeting_id)
+        artifact_sink.submit(
+            "llm_output",
+            json.dumps({"transcript_sha256": transcript_sha, "response": llm_response, "tasks": tasks}),
+            meeting_id
+        )
+
+    def create_task_extraction_prompt(self) -> "PromptTemplate":
         """Create a LangChain prompt template for task extraction"""
         template = """
 You are an expert AI assistant specialized in analyzing meeting transcripts to extract actionable tasks.
@@ -151,13 +229,9 @@ Meeting Transcript:
 {format_instructions}
 """
         
-        return PromptTemplate(
-            template=template,
-            input_variables=["transcript"],
-            partial_variables={"format_instructions": self.output_parser.get_format_instructions()}
-        )
+        return self._prompt("extraction", template, ["transcript"], self.output_parser)
 
-    def create_task_modification_prompt(self) -> PromptTemplate:
+    def create_task_modification_prompt(self) -> "PromptTemplate":
         """Create a LangChain prompt template for task modification"""
         template = """
 You are an AI assistant helping to modify task assignments from a meeting transcript based on user feedback.
@@ -176,49 +250,242 @@ Based on the user's request, please provide updated task assignments. Incorporat
 {format_instructions}
 """
         
-        return PromptTemplate(
-            template=template,
-            input_variables=["transcript", "existing_tasks", "modification_request"],
-            partial_variables={"format_instructions": self.output_parser.get_format_instructions()}
-        )
+        return self._prompt("modification", template, ["transcript", "existing_tasks", "modification_request"], self.output_parser)
+
+    def create_task_patch_prompt(self) -> "PromptTemplate":
+        """Create a LangChain prompt template for patch-style task modification"""
+        template = """
+You are an AI assistant editing the task list of a meeting based on a user's request.
+
+Current Tasks (one per line, with their ids):
+{existing_tasks}
+
+Relevant Transcript Excerpts:
+{excerpts}
 
-    async def extract_tasks_from_transcript(self, transcript: str, additional_context: Optional[str] = None, meeting_id: str = None) -> Dict[str, Any]:
-        """Extract tasks from meeting transcript using LangChain structured output with Gemini 2.5 Flash"""
+User's Modification Request:
+{modification_request}
+
+Return only the changes the request calls for: tasks to add, tasks to update (by id, with only the fields that change) and ids of tasks to remove. Do not repeat tasks the request does not affect.
+
+{format_instructions}
+"""
+        
+        return self._prompt("patch", template, ["existing_tasks", "excerpts", "modification_request"], self.patch_parser)
+
+    def select_transcript_excerpts(self, transcript: str, modification_request: str, max_chars: Optional[int] = None) -> str:
+        """Transcript lines sharing words with the request (plus a line of context each side), in transcript order"""
+        max_chars = max_chars or settings.MODIFY_EXCERPT_CHARS
+        lines = [line for line in transcript.split("\n") if line.strip()]
+        terms = {word for word in self._normalize_task_text(modification_request).split() if len(word) > 2}
+        scores = [len(terms & set(self._normalize_task_text(line).split())) for line in lines]
+        
+        selected = set()
+        used = 0
+        for index in sorted(range(len(lines)), key=lambda i: (-scores[i], i)):
+            if scores[index] == 0:
+                break
+            for neighbour in (index - 1, index, index + 1):
+                if 0 <= neighbour < len(lines) and neighbour not in selected and used + len(lines[neighbour]) + 1 <= max_chars:
+                    selected.add(neighbour)
+                    used += len(lines[neighbour]) + 1
+        
+        if not selected:
+            return "(No transcript lines match the request)"
+        return "\n".join(lines[index] for index in sorted(selected))
+
+    def split_transcript_into_chunks(self, transcript: str) -> List[str]:
+        """Split a transcript on speaker-turn boundaries into overlapping chunks"""
+        turns = [line for line in transcript.split("\n") if line.strip()]
+        max_chars = settings.EXTRACTION_CHUNK_CHARS
+        overlap = settings.EXTRACTION_CHUNK_OVERLAP_TURNS
+        
+        if len(transcript) <= max_chars or len(turns) <= 1:
+            return [transcript]
+        
+        chunks = []
+        current = []
+        current_len = 0
+        new_turns = 0  # Turns in the current chunk not carried over from the previous one
+        for turn in turns:
+            if current and new_turns and current_len + len(turn) + 1 > max_chars:
+                chunks.append("\n".join(current))
+                # Carry the tail of this chunk into the next one so tasks spanning the boundary are seen whole
+                current = current[-overlap:] if overlap > 0 else []
+                current_len = sum(len(line) + 1 for line in current)
+                new_turns = 0
+            current.append(turn)
+            current_len += len(turn) + 1
+            new_turns += 1
+        
+        if new_turns:
+            chunks.append("\n".join(current))
+        
+        return chunks
+
+    def _normalize_task_text(self, text: str) -> str:
+        """Normalize task text for duplicate detection"""
+        return re.sub(r"\s+", " ", re.sub(r"[^\w\s]", " ", (text or "").lower())).strip()
+
+    def _task_key(self, task: TaskModel) -> tuple:
+        return (self._normalize_task_text(task.assignee), self._normalize_task_text(task.description))
+
+    def _find_duplicate(self, keys: List[tuple], task: TaskModel) -> Optional[int]:
+        """
+        Index of the key in keys that task repeats, if any: same assignee and a near-identical description.
+        Descriptions naming different numbers or dates ("Q3 report" / "Q4 report", "by Friday" / "by Monday")
+        are different tasks however similar the rest is.
+        """
+        assignee, description = self._task_key(task)
+        markers = set(TASK_MARKERS.findall(description))
+        for index, (seen_assignee, seen_description) in enumerate(keys):
+            if seen_assignee != assignee:
+                continue
+            if seen_description == description:
+                return index
+            if set(TASK_MARKERS.findall(seen_description)) == markers and difflib.SequenceMatcher(
+                None, seen_description, description
+            ).ratio() >= DUPLICATE_TASK_RATIO:
+                return index
+        return None
+
+    def merge_task_results(self, results: List[TaskExtractionResponse]) -> TaskExtractionResponse:
+        """
+        Merge per-chunk results, dropping duplicates picked up from overlapping chunks.
+        Tasks are only compared with those from earlier results, never with others from the same one.
+        """
+        merged: List[TaskModel] = []
+        keys: List[tuple] = []
+        
+        for result in results:
+            earlier = len(keys)
+            for task in result.tasks:
+                duplicate_index = self._find_duplicate(keys[:earlier], task)
+                
+                if duplicate_index is None:
+                    merged.append(task)
+                    keys.append(self._task_key(task))
+                elif merged[duplicate_index].deadline is None and task.deadline:
+                    # Keep the first occurrence but fill in a deadline the later chunk picked up
+                    merged[duplicate_index] = merged[duplicate_index].model_copy(update={"deadline": task.deadline})
+        
+        return TaskExtractionResponse(tasks=merged)
+
+    def _task_to_data(self, task: TaskModel) -> Dict[str, Any]:
+        """Convert a parsed LLM task into the task dict used by the API"""
+        return {
+            "title": task.title,
+            "task_description": task.description,  # Map to existing field name
+            "assignee_name": task.assignee,        # Map to existing field name
+            "priority": task.priority,
+            "status": task.status,
+            "deadline": task.deadline,
+            "category": task.category
+        }
+
+    def _to_task_data(self, result: TaskExtractionResponse) -> List[Dict[str, Any]]:
+        """Convert a parsed LLM result into the task dicts used by the API"""
+        return [self._task_to_data(task) for task in result.tasks]
+
+    def merge_task_data(self, task_lists: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Merge several lists of API task dicts, dropping near-duplicates"""
+        results = [
+            TaskExtractionResponse(tasks=[
+                TaskModel(
+                    title=task.get("title") or task["task_description"][:60],
+                    description=task["task_description"],
+                    assignee=task["assignee_name"],
+                    priority=task.get("priority") or "Medium",
+                    status=task.get("status") or "pending",
+                    deadline=task.get("deadline"),
+                    category=task.get("category") or "action_item"
+                ) for task in tasks
+            ]) for tasks in task_lists
+        ]
+        return self._to_task_data(self.merge_task_results(results))
+
+    async def extract_tasks_from_transcript(self, transcript: str, additional_context: Optional[str] = None, meeting_id: str = None, use_cache: bool = True, priority: str = "default", on_task: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Extract tasks from meeting transcript using LangChain structured output with Gemini 2.5 Flash.
+        With on_task, the response is streamed and each task is passed to it as soon as it is generated.
+        """
         try:
-            # Save the transcript before processing as requested
-            self._save_raw_transcript(transcript, meeting_id)
-            
             # Create the prompt template
             prompt_template = self.create_task_extraction_prompt()
+            transcript = self.compact_transcript(transcript)
+            
+            # The chain runs at temperature 0.0, so an identical prompt and transcript gives the same tasks
+            cache_key = extraction_cache.make_key(
+                prompt_template.template,
+                self.model_name,
+                self.temperature,
+                transcript,
+                {
+                    "chunk_chars": settings.EXTRACTION_CHUNK_CHARS,
+                    "chunk_overlap_turns": settings.EXTRACTION_CHUNK_OVERLAP_TURNS
+                }
+            )
+            if use_cache:
+                cached_tasks = await extraction_cache.get(cache_key)
+                if cached_tasks is not None:
+                    print(f"✅ Loaded {len(cached_tasks)} tasks from extraction cache")
+                    if on_task is not None:
+                        for task in cached_tasks:
+                            on_task(task)
+                    return {
+                        "success": True,
+                        "tasks": cached_tasks,
+                        "cached": True
+                    }
+            
+            # Map: extract from each chunk with bounded fan-out
+            chunks = self.split_transcript_into_chunks(transcript)
+            semaphore = asyncio.Semaphore(max(1, settings.EXTRACTION_MAX_CONCURRENCY))
+            
+            # Keys of the tasks streamed from each chunk, so a retried chunk doesn't report its tasks again
+            # and a task picked up by two overlapping chunks is reported once
+            streamed_keys: List[List[Optional[tuple]]] = [[] for _ in chunks]
+            
+            def emit(chunk_index: int, position: int, raw_task: Dict[str, Any]):
+                if position < len(streamed_keys[chunk_index]):
+                    return
+                try:
+                    task = TaskModel.model_validate(raw_task)
+                except ValueError:
+                    streamed_keys[chunk_index].append(None)
+                    return
+                other_keys = [
+                    key for index, keys in enumerate(streamed_keys) if index != chunk_index for key in keys if key
+                ]
+                streamed_keys[chunk_index].append(self._task_key(task))
+                if self._find_duplicate(other_keys, task) is None:
+                    on_task(self._task_to_data(task))
+            
+            async def extract_chunk(chunk_index: int, chunk: str) -> TaskExtractionResponse:
+                async with semaphore:
+                    if on_task is not None:
+                        return await self._invoke_streaming(
+                            prompt_template,
+                            {"transcript": chunk},
+                            priority,
+                            lambda position, raw_task: emit(chunk_index, position, raw_task)
+                        )
+                    return await self._invoke(prompt_template, self.output_parser, {"transcript": chunk}, priority)
             
-            # Create the chain: prompt -> LLM -> parser
-            chain = prompt_template | self.llm | self.output_parser
+            chunk_results = await asyncio.gather(*(extract_chunk(index, chunk) for index, chunk in enumerate(chunks)))
             
-            # Execute the chain
-            result = await chain.ainvoke({"transcript": transcript})
+            # Reduce: merge and deduplicate tasks found in overlapping chunks
+            result = self.merge_task_results(chunk_results) if len(chunk_results) > 1 else chunk_results[0]
             
             # Convert Pydantic model to dict for compatibility with existing API
-            tasks_data = []
-            for task in result.tasks:
-                tasks_data.append({
-                    "title": task.title,
-                    "task_description": task.description,  # Map to existing field name
-                    "assignee_name": task.assignee,        # Map to existing field name
-                    "priority": task.priority,
-                    "status": task.status,
-                    "deadline": task.deadline,
-                    "category": task.category
-                })
+            tasks_data = self._to_task_data(result)
             
             # Save successful result
-            self._save_to_output_file(
-                transcript, 
-                f"LANGCHAIN STRUCTURED OUTPUT SUCCESS:\n{json.dumps(tasks_data, indent=2)}", 
-                tasks_data, 
-                meeting_id
-            )
+            self._save_artifacts(transcript, "LANGCHAIN STRUCTURED OUTPUT SUCCESS", tasks_data, meeting_id)
             
-            print(f"✅ Successfully extracted {len(tasks_data)} tasks using LangChain structured output")
+            print(f"✅ Successfully extracted {len(tasks_data)} tasks from {len(chunks)} chunk(s) using LangChain structured output")
+            
+            await extraction_cache.set(cache_key, tasks_data)
             
             return {
                 "success": True,
@@ -229,54 +496,53 @@ Based on the user's request, please provide updated task assignments. Incorporat
             print(f"❌ LangChain Gemini API Error: {str(e)}")
             
             # Save error details
-            self._save_to_output_file(
-                transcript, 
-                f"LANGCHAIN ERROR:\n{str(e)}", 
-                [], 
-                meeting_id
-            )
+            self._save_artifacts(transcript, f"LANGCHAIN ERROR:\n{str(e)}", [], meeting_id)
             
             return {
                 "success": False,
                 "error": f"Error processing with LangChain Gemini: {str(e)}"
             }
 
-    async def modify_task_assignments(self, transcript: str, existing_tasks: List[Dict], modification_request: str, additional_context: Optional[str] = None) -> Dict[str, Any]:
+    async def modify_task_assignments(self, transcript: str, existing_tasks: List[Dict], modification_request: str, additional_context: Optional[str] = None, use_cache: bool = True, priority: str = "interactive") -> Dict[str, Any]:
         """Modify existing task assignments based on user request using LangChain structured output"""
         try:
             # Create the prompt template
             prompt_template = self.create_task_modification_prompt()
+            transcript = self.compact_transcript(transcript)
             
-            # Create the chain: prompt -> LLM -> parser
-            chain = prompt_template | self.llm | self.output_parser
+            cache_key = extraction_cache.make_key(
+                prompt_template.template,
+                self.model_name,
+                self.temperature,
+                transcript,
+                {
+                    "existing_tasks": existing_tasks,
+                    "modification_request": modification_request
+                }
+            )
+            if use_cache:
+                cached_tasks = await extraction_cache.get(cache_key)
+                if cached_tasks is not None:
+                    return {
+                        "success": True,
+                        "tasks": cached_tasks,
+                        "cached": True
+                    }
             
-            # Execute the chain
-            result = await chain.ainvoke({
+            # Execute the chain: prompt -> LLM -> parser
+            result = await self._invoke(prompt_template, self.output_parser, {
                 "transcript": transcript,
                 "existing_tasks": json.dumps(existing_tasks, indent=2),
                 "modification_request": modification_request
-            })
+            }, priority)
             
             # Convert Pydantic model to dict for compatibility with existing API
-            tasks_data = []
-            for task in result.tasks:
-                tasks_data.append({
-                    "title": task.title,
-                    "task_description": task.description,  # Map to existing field name
-                    "assignee_name": task.assignee,        # Map to existing field name
-                    "priority": task.priority,
-                    "status": task.status,
-                    "deadline": task.deadline,
-                    "category": task.category
-                })
+            tasks_data = self._to_task_data(result)
             
             # Save to output file for modification requests
-            self._save_to_output_file(
-                transcript, 
-                f"MODIFICATION REQUEST: {modification_request}\n\nLangChain RESPONSE:\n{json.dumps(tasks_data, indent=2)}", 
-                tasks_data, 
-                "modification"
-            )
+            self._save_artifacts(transcript, f"MODIFICATION REQUEST: {modification_request}", tasks_data, "modification")
+            
+            await extraction_cache.set(cache_key, tasks_data)
             
             return {
                 "success": True,
@@ -290,6 +556,80 @@ Based on the user's request, please provide updated task assignments. Incorporat
                 "error": f"Error processing modification with LangChain Gemini: {str(e)}"
             }
 
+    async def modify_tasks_with_patch(self, transcript: str, existing_tasks: List[Dict], modification_request: str, use_cache: bool = True, priority: str = "interactive") -> Dict[str, Any]:
+        """Ask the LLM for the add/update/remove changes a modification request makes to existing tasks (which carry ids)"""
+        try:
+            prompt_template = self.create_task_patch_prompt()
+            excerpts = self.select_transcript_excerpts(self.compact_transcript(transcript), modification_request)
+            task_lines = "\n".join(json.dumps(task) for task in existing_tasks)
+            
+            cache_key = extraction_cache.make_key(
+                prompt_template.template,
+                self.model_name,
+                self.temperature,
+                excerpts,
+                {
+                    "existing_tasks": existing_tasks,
+                    "modification_request": modification_request
+                }
+            )
+            if use_cache:
+                cached_patch = await extraction_cache.get(cache_key)
+                if cached_patch is not None:
+                    return {
+                        "success": True,
+                        "patch": cached_patch,
+                        "cached": True
+                    }
+            
+            result = await self._invoke(prompt_template, self.patch_parser, {
+                "existing_tasks": task_lines,
+                "excerpts": excerpts,
+                "modification_request": modification_request
+            }, priority)
+            
+            # Map onto the field names used by the API
+            patch = {
+                "add": [
+                    {
+                        "task_description": task.description,
+                        "assignee_name": task.assignee,
+                        "priority": task.priority,
+                        "deadline": task.deadline
+                    } for task in result.add
+                ],
+                "update": [
+                    {
+                        "id": change.id,
+                        **{
+                            field: value for field, value in (
+                                ("task_description", change.description),
+                                ("assignee_name", change.assignee),
+                                ("priority", change.priority),
+                                ("deadline", change.deadline)
+                            ) if value is not None
+                        }
+                    } for change in result.update
+                ],
+                "remove": list(result.remove)
+            }
+            
+            self._save_artifacts(excerpts, f"MODIFICATION PATCH: {modification_request}", [patch], "modification")
+            
+            await extraction_cache.set(cache_key, patch)
+            
+            return {
+                "success": True,
+                "patch": patch
+            }
+            
+        except Exception as e:
+            print(f"❌ LangChain patch modification error: {str(e)}")
+            return {
+                "success": False,
+                "error": f"Error processing modification with LangChain Gemini: {str(e)}"
+            }
+
 
 # Global instance
 llm_service = LLMService()
\ No newline at end of file
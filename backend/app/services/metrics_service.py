@@ -0,0 +1,153 @@
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, Optional
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from app.core.config import settings
+from app.models.database import engine
+from app.services.rate_limit_service import llm_limiter
+
+# Request latencies run from milliseconds (cached reads) to a minute (synchronous processing)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time to the end of the response body, by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS
+)
+STAGE_LATENCY = Histogram(
+    "pipeline_stage_duration_seconds",
+    "Time spent in each stage of transcript processing and export",
+    ["stage"],
+    buckets=LATENCY_BUCKETS
+)
+LLM_CALLS = Counter("llm_calls_total", "LLM chain invocations", ["outcome"])
+LLM_TOKENS = Counter(
+    "llm_tokens_total",
+    "LLM tokens, as reported by the model or estimated when it reports none",
+    ["direction"]
+)
+CACHE_LOOKUPS = Counter("cache_lookups_total", "Cache lookups by cache and result", ["cache", "result"])
+
+
+class RuntimeCollector(Collector):
+    """Reads database pool and LLM limiter state at scrape time"""
+
+    def collect(self):
+        pool = engine.pool
+        connections = GaugeMetricFamily("db_pool_connections", "Database connection pool state", labels=["state"])
+        for state in ("size", "checkedin", "checkedout", "overflow"):
+            # Not every pool class (e.g. StaticPool for in-memory SQLite) tracks these
+            method = getattr(pool, state, None)
+            if callable(method):
+                connections.add_metric([state], method())
+        yield connections
+
+        stats = llm_limiter.stats()
+        depth = GaugeMetricFamily("llm_queue_depth", "LLM calls waiting for the rate limiter", labels=["priority"])
+        for lane, waiting in stats["queue_depth"].items():
+            depth.add_metric([lane], waiting)
+        yield depth
+        yield GaugeMetricFamily("llm_in_flight", "LLM calls holding a limiter slot", value=stats["in_flight"])
+        yield GaugeMetricFamily("llm_rate_scale", "Factor the limiter's rates are scaled by after 429s", value=stats["scale"])
+        rate_limited = CounterMetricFamily("llm_rate_limited", "429 responses from the LLM API")
+        rate_limited.add_metric([], stats["rate_limited"])
+        yield rate_limited
+
+
+REGISTRY.register(RuntimeCollector())
+
+
+def _tracer():
+    """OpenTelemetry tracer when tracing is enabled and the API is installed, otherwise None"""
+    if not settings.TRACING_ENABLED:
+        return None
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return None
+    return trace.get_tracer("meeting-notes")
+
+
+def span(name: str, meeting_id: Optional[str] = None):
+    """An OpenTelemetry span tagged with the meeting id, or a no-op when tracing is off"""
+    tracer = _tracer()
+    if tracer is None:
+        return nullcontext()
+    return tracer.start_as_current_span(name, attributes={"meeting.id": meeting_id} if meeting_id else None)
+
+
+@contextmanager
+def stage(name: str, meeting_id: Optional[str] = None) -> Iterator[None]:
+    """Time a pipeline stage into STAGE_LATENCY (and a span of the same name)"""
+    started = time.perf_counter()
+    try:
+        with span(name, meeting_id):
+            yield
+    finally:
+        STAGE_LATENCY.labels(name).observe(time.perf_counter() - started)
+
+
+def record_llm_call(success: bool, usage: Optional[Dict[str, Any]], estimated_input: int, estimated_output: int):
+    """Count an LLM call and its tokens, preferring the model's usage metadata over our estimate"""
+    LLM_CALLS.labels("success" if success else "error").inc()
+    usage = usage or {}
+    LLM_TOKENS.labels("input").inc(usage.get("input_tokens") or estimated_input)
+    if success:
+        LLM_TOKENS.labels("output").inc(usage.get("output_tokens") or estimated_output)
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def route_template(scope) -> str:
+    """The matched route's full path template, e.g. /api/meetings/{meeting_id}, or "unmatched" """
+    route = scope.get("route")
+    template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if template is None:
+        return "unmatched"
+    # Routes of an included router may only know their path below the router's prefix; recover the prefix
+    # by matching the concrete path against the request path
+    try:
+        concrete = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    path = scope["path"]
+    return path[:len(path) - len(concrete)] + template if path.endswith(concrete) else template
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording REQUEST_LATENCY by route template (not raw path, to keep label cardinality bounded)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with span(f"{scope['method']} {scope['path']}") as request_span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                template = route_template(scope)
+                REQUEST_LATENCY.labels(scope["method"], template, str(status)).observe(time.perf_counter() - started)
+                if request_span is not None:
+                    request_span.update_name(f"{scope['method']} {template}")
+                    meeting_id = scope.get("path_params", {}).get("meeting_id")
+                    if meeting_id is not None:
+                        request_span.set_attribute("meeting.id", str(meeting_id))
+
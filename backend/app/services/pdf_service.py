@@ -0,0 +1,179 @@
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+
+
+def generate_pdf_report(meeting: Dict[str, Any], tasks: List[Dict[str, Any]]) -> bytes:
+    """Generate a PDF report for meeting tasks (runs in a worker process)"""
+    # ReportLab is only needed in the render workers, so the API process never imports it
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+
+    buffer = io.BytesIO()
+
+    # Create PDF document
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    story = []
+    styles = getSampleStyleSheet()
+
+    # Custom styles
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1f2937'),
+        spaceBefore=12,
+        spaceAfter=30,
+    )
+
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=colors.HexColor('#374151'),
+        spaceBefore=20,
+        spaceAfter=12,
+    )
+
+    # Title
+    title = Paragraph("Meeting Action Items Report", title_style)
+    story.append(title)
+
+    # Meeting info
+    meeting_info = f"""
+    <b>Meeting ID:</b> {meeting['meeting_id']}<br/>
+    <b>Meeting Date:</b> {meeting['created_at'].strftime('%B %d, %Y at %I:%M %p')}<br/>
+    <b>Status:</b> {meeting['status'].title()}<br/>
+    <b>Total Tasks:</b> {len(tasks)}
+    """
+    story.append(Paragraph(meeting_info, styles['Normal']))
+    story.append(Spacer(1, 20))
+
+    # Group tasks by assignee
+    tasks_by_assignee = {}
+    for task in tasks:
+        assignee = task['assignee_name']
+        if assignee not in tasks_by_assignee:
+            tasks_by_assignee[assignee] = []
+        tasks_by_assignee[assignee].append(task)
+
+    # Add tasks for each assignee
+    for assignee, assignee_tasks in tasks_by_assignee.items():
+        # Assignee heading
+        assignee_heading = Paragraph(f"Tasks for {assignee}", heading_style)
+        story.append(assignee_heading)
+
+        # Task table
+        task_data = [['Task Description', 'Deadline', 'Priority', 'Status']]
+
+        for task in assignee_tasks:
+            status = "✓ Completed" if task['is_completed'] else "○ Pending"
+            description = task['task_description']
+            task_data.append([
+                description[:60] + "..." if len(description) > 60 else description,
+                task['deadline'] or "Not specified",
+                task['priority'] or "Not specified",
+                status
+            ])
+
+        task_table = Table(task_data, colWidths=[3*inch, 1.2*inch, 0.8*inch, 1*inch])
+        task_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1f2937')),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb')),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')])
+        ]))
+
+        story.append(task_table)
+        story.append(Spacer(1, 20))
+
+    # Summary
+    completed_tasks = sum(1 for task in tasks if task['is_completed'])
+    pending_tasks = len(tasks) - completed_tasks
+
+    summary_heading = Paragraph("Summary", heading_style)
+    story.append(summary_heading)
+
+    summary_text = f"""
+    <b>Total Tasks:</b> {len(tasks)}<br/>
+    <b>Completed Tasks:</b> {completed_tasks}<br/>
+    <b>Pending Tasks:</b> {pending_tasks}<br/>
+    <b>Completion Rate:</b> {(completed_tasks/len(tasks)*100) if len(tasks) > 0 else 0:.1f}%<br/>
+    <b>Report Generated:</b> {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
+    """
+    story.append(Paragraph(summary_text, styles['Normal']))
+
+    # Build PDF
+    doc.build(story)
+
+    return buffer.getvalue()
+
+
+class PDFService:
+    """Renders PDF reports in a bounded process pool, off the event loop"""
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn avoids forking a process that holds event-loop threads and DB connections
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def render(self, meeting: Dict[str, Any], tasks: List[Dict[str, Any]]) -> bytes:
+        """Render a report; waits for a free slot once max_pending renders are queued"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), generate_pdf_report, meeting, tasks)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def meeting_to_report_data(meeting) -> Dict[str, Any]:
+    """Plain, picklable view of a Meeting row for the render worker"""
+    return {
+        "meeting_id": meeting.meeting_id,
+        "created_at": meeting.created_at,
+        "status": meeting.status
+    }
+
+
+def task_to_report_data(task) -> Dict[str, Any]:
+    """Plain, picklable view of a Task row for the render worker"""
+    return {
+        "assignee_name": task.assignee_name,
+        "task_description": task.task_description,
+        "deadline": task.deadline,
+        "priority": task.priority,
+        "is_completed": task.is_completed
+    }
+
+
+# Global instance
+pdf_service = PDFService(settings.PDF_RENDER_WORKERS, settings.PDF_RENDER_MAX_PENDING)
@@ -0,0 +1,257 @@
+import asyncio
+import heapq
+import itertools
+import random
+import re
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from app.core.config import settings
+
+
+# Lower value wins: interactive edits go before extraction of finished meetings, which goes before backfills
+PRIORITIES = {"interactive": 0, "default": 1, "batch": 2}
+# Recent waits kept per lane for the percentiles in stats()
+WAIT_SAMPLES = 1000
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """HTTP status an SDK error carries (status_code, code or response.status_code), if any"""
+    for value in (getattr(error, "status_code", None), getattr(error, "code", None),
+                  getattr(getattr(error, "response", None), "status_code", None)):
+        if isinstance(value, int) and not isinstance(value, bool):
+            return int(value)
+    return None
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """True for 429s, judged by error type or status code (not digits in the message), including wrapped SDK errors"""
+    from langchain_core.exceptions import ModelRateLimitError
+    
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, ModelRateLimitError) or _status_code(current) == 429:
+            return True
+        if getattr(current, "status", None) == "RESOURCE_EXHAUSTED" or "RESOURCE_EXHAUSTED" in str(current):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def is_transient(error: Exception) -> bool:
+    from langchain_core.exceptions import ModelAPIError
+    
+    return isinstance(error, (ModelAPIError, asyncio.TimeoutError))
+
+
+def retry_delay_hint(error: Exception) -> Optional[float]:
+    """Delay the API suggested in a 429, if it gave one"""
+    match = re.search(r"retry_delay\s*\{\s*seconds:\s*(\d+)|retryDelay['\"]?:\s*['\"]?(\d+(?:\.\d+)?)s", str(error))
+    if match:
+        return float(match.group(1) or match.group(2))
+    return None
+
+
+class LLMRateLimiter:
+    """
+    Shared admission control for LLM calls.
+
+    A call waits for a concurrency slot, one request and its estimated tokens
+    from per-minute token buckets, and for any cool-down after a 429. Waiting
+    calls are admitted strictly by priority lane, first come first served
+    within a lane. Rates and the concurrency limit are scaled by an AIMD
+    factor: halved when the API rate-limits us, and grown back a little with
+    every successful call.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_retries: int,
+        backoff_seconds: float,
+        min_scale: float,
+        scale_increase: float
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_minute = max(1, requests_per_minute)
+        self.tokens_per_minute = max(1, tokens_per_minute)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.min_scale = min_scale
+        self.scale_increase = scale_increase
+
+        self.scale = 1.0
+        self._in_flight = 0
+        self._request_level = float(self.requests_per_minute)
+        self._token_level = float(self.tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Future, int, float]] = []  # (priority, seq, future, tokens, queued at)
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._waits: Dict[str, Deque[float]] = {lane: deque(maxlen=WAIT_SAMPLES) for lane in PRIORITIES}
+        self._counters = {"calls": 0, "rate_limited": 0, "retries": 0, "failures": 0}
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(1, round(self.max_concurrency * self.scale))
+
+    def _refill(self, now: float):
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._request_level = min(
+            self.requests_per_minute * self.scale,
+            self._request_level + elapsed * self.requests_per_minute * self.scale / 60
+        )
+        self._token_level = min(
+            self.tokens_per_minute * self.scale,
+            self._token_level + elapsed * self.tokens_per_minute * self.scale / 60
+        )
+
+    def _time_until(self, level: float, needed: float, per_minute: int) -> float:
+        return 0.0 if level >= needed else (needed - level) * 60 / (per_minute * self.scale)
+
+    def _schedule(self, delay: float):
+        loop = asyncio.get_running_loop()
+        if self._timer is not None and self._timer_loop is loop and not self._timer.cancelled():
+            if self._timer.when() <= loop.time() + delay:
+                return
+            self._timer.cancel()
+        self._timer_loop = loop
+        self._timer = loop.call_later(delay, self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        self._dispatch()
+
+    def _dispatch(self):
+        """Admit waiting calls in priority order while capacity allows"""
+        now = time.monotonic()
+        self._refill(now)
+        while self._waiters:
+            priority, _, future, tokens, _ = self._waiters[0]
+            if future.done():  # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            if now < self._paused_until:
+                self._schedule(self._paused_until - now)
+                return
+            if self._in_flight >= self.concurrency_limit:
+                return  # The next release dispatches again
+            # A call larger than the whole bucket goes through once the bucket is full
+            tokens = min(tokens, self.tokens_per_minute * self.scale)
+            wait = max(
+                self._time_until(self._request_level, 1, self.requests_per_minute),
+                self._time_until(self._token_level, tokens, self.tokens_per_minute)
+            )
+            if wait > 0:
+                self._schedule(wait)
+                return
+            heapq.heappop(self._waiters)
+            self._request_level -= 1
+            self._token_level -= tokens
+            self._in_flight += 1
+            future.set_result(None)
+
+    async def _acquire(self, tokens: int, lane: str, seq: int):
+        future = asyncio.get_running_loop().create_future()
+        queued_at = time.monotonic()
+        heapq.heappush(self._waiters, (PRIORITIES[lane], seq, future, tokens, queued_at))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()  # Admitted just as the caller gave up
+            raise
+        self._waits[lane].append(time.monotonic() - queued_at)
+
+    def _release(self):
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _on_success(self):
+        self.scale = min(1.0, self.scale + self.scale_increase)
+
+    def _on_rate_limited(self, error: Exception, attempt: int):
+        now = time.monotonic()
+        self._counters["rate_limited"] += 1
+        # Calls that were already in flight when the limit hit count as one signal
+        if now - self._last_decrease > 1.0:
+            self.scale = max(self.min_scale, self.scale / 2)
+            self._last_decrease = now
+        delay = retry_delay_hint(error) or self.backoff_seconds * 2 ** attempt * (1 + random.random())
+        self._paused_until = max(self._paused_until, now + delay)
+        print(f"❌ LLM rate limited; pausing {delay:.1f}s at {self.scale:.2f}x rate")
+
+    async def run(self, call: Callable[[], Awaitable[Any]], tokens: int, priority: str = "default") -> Any:
+        """Run an LLM call once admitted, retrying 429s and server errors"""
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown LLM priority: {priority}")
+        seq = next(self._seq)  # Retries keep their place in the lane
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(tokens, priority, seq)
+            try:
+                result = await call()
+            except asyncio.CancelledError:
+                self._release()
+                raise
+            except Exception as e:
+                self._release()
+                if attempt < self.max_retries and is_rate_limited(e):
+                    self._counters["retries"] += 1
+                    self._on_rate_limited(e, attempt)
+                    continue
+                if attempt < self.max_retries and is_transient(e):
+                    self._counters["retries"] += 1
+                    await asyncio.sleep(self.backoff_seconds * 2 ** attempt * (1 + random.random()))
+                    continue
+                self._counters["failures"] += 1
+                raise
+            self._release()
+            self._counters["calls"] += 1
+            self._on_success()
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        depth = {lane: 0 for lane in PRIORITIES}
+        lanes = {value: lane for lane, value in PRIORITIES.items()}
+        for priority, _, future, _, _ in self._waiters:
+            if not future.done():
+                depth[lanes[priority]] += 1
+
+        waits = {}
+        for lane, samples in self._waits.items():
+            ordered = sorted(samples)
+            waits[lane] = {
+                "samples": len(ordered),
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1) if ordered else 0.0,
+                "p95_ms": round(ordered[int(len(ordered) * 0.95)] * 1000, 1) if ordered else 0.0,
+                "max_ms": round(ordered[-1] * 1000, 1) if ordered else 0.0
+            }
+        return {
+            **self._counters,
+            "in_flight": self._in_flight,
+            "concurrency_limit": self.concurrency_limit,
+            "scale": round(self.scale, 3),
+            "queue_depth": depth,
+            "wait": waits
+        }
+
+
+# Global instance
+llm_limiter = LLMRateLimiter(
+    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+    requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+    tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+    max_retries=settings.LLM_MAX_RETRIES,
+    backoff_seconds=settings.LLM_RETRY_BACKOFF_SECONDS,
+    min_scale=settings.LLM_MIN_RATE_SCALE,
+    scale_increase=settings.LLM_RATE_INCREASE
+)
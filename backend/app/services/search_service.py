@@ -0,0 +1,269 @@
+import asyncio
+import html
+import math
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.database import engine, Meeting, Transcript, Task
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Highlight markers around matched terms in snippets
+MARK_START = "<mark>"
+MARK_END = "</mark>"
+# Matches are delimited with these control characters first, so the text can be HTML-escaped before the tags go in
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+SNIPPET_TOKENS = 16
+
+# Search kinds and the FTS5 table behind each (see migration 0007_search_index)
+SEARCH_KINDS = ("transcript", "task")
+
+# Ranking runs on the FTS5 tables alone; snippets and meeting ids are only fetched for the returned page
+FTS_TABLES = {"transcript": "transcripts_fts", "task": "tasks_fts"}
+FTS_CONTENT = {"transcript": "transcripts", "task": "tasks"}
+
+# Names (speakers, assignee) weigh double relative to the text column. BM25 is only computed for the
+# newest :candidates matches per table, which keeps very common terms from scoring every row.
+FTS_RANK = """
+    SELECT '{kind}' AS kind, rowid AS id, -bm25({fts}, 1.0, 2.0) AS score
+    FROM {fts}
+    WHERE {fts} MATCH :query AND rowid >= COALESCE(
+        (SELECT rowid FROM {fts} WHERE {fts} MATCH :query ORDER BY rowid DESC LIMIT 1 OFFSET :candidates - 1), 0
+    )
+"""
+
+FTS_PAGE = f"""
+    SELECT {{fts}}.rowid AS id, m.meeting_id AS meeting_id,
+           snippet({{fts}}, -1, '{MATCH_START}', '{MATCH_END}', '…', {SNIPPET_TOKENS}) AS snippet
+    FROM {{fts}}
+    JOIN {{content}} c ON c.id = {{fts}}.rowid
+    JOIN meetings m ON m.id = c.meeting_id
+    WHERE {{fts}} MATCH :query AND {{fts}}.rowid IN :ids
+"""
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    return [token.lower() for token in TOKEN_RE.findall(value or "")]
+
+
+def highlight(snippet: str) -> str:
+    """HTML-escape a snippet and turn its match delimiters into highlight tags"""
+    return html.escape(snippet, quote=False).replace(MATCH_START, MARK_START).replace(MATCH_END, MARK_END)
+
+
+def make_snippet(value: str, terms: Iterable[str], width: int = 120) -> str:
+    """Window of text around the first matched term, with matches highlighted"""
+    pattern = re.compile(r"\b(" + "|".join(re.escape(term) for term in terms) + r")\b", re.IGNORECASE)
+    value = value.replace(MATCH_START, "").replace(MATCH_END, "")
+    match = pattern.search(value)
+    start = max(0, match.start() - width // 3) if match else 0
+    window = value[start:start + width]
+    delimited = pattern.sub(lambda m: f"{MATCH_START}{m.group(0)}{MATCH_END}", window)
+    return highlight(("…" if start > 0 else "") + delimited + ("…" if start + width < len(value) else ""))
+
+
+class InMemorySearchIndex:
+    """
+    Inverted index with BM25 ranking, for databases without FTS5.
+
+    Built from the database on first use and refreshed per meeting by
+    index_meeting(). Only postings and document lengths are held in memory;
+    snippet text is read back for the returned page.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, max_candidates: int):
+        self.max_candidates = max_candidates
+        self._postings: Dict[str, Dict[Tuple[str, int], int]] = defaultdict(dict)
+        self._docs: Dict[Tuple[str, int], Tuple[int, int, Tuple[str, ...]]] = {}  # (kind, id) -> (meeting pk, length, terms)
+        self._by_meeting: Dict[int, Set[Tuple[str, int]]] = defaultdict(set)
+        self._total_length = 0
+        self._built = False
+        self._lock = asyncio.Lock()
+
+    def _remove_meeting(self, meeting_pk: int):
+        for key in self._by_meeting.pop(meeting_pk, set()):
+            _, length, terms = self._docs.pop(key)
+            self._total_length -= length
+            for term in terms:
+                postings = self._postings[term]
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+
+    def _add(self, key: Tuple[str, int], meeting_pk: int, body: Optional[str], names: Optional[str]):
+        # Speaker and assignee names count double, mirroring the FTS5 column weights
+        tokens = tokenize(body) + tokenize(names) * 2
+        counts: Dict[str, int] = defaultdict(int)
+        for token in tokens:
+            counts[token] += 1
+        for token, count in counts.items():
+            self._postings[token][key] = count
+        self._docs[key] = (meeting_pk, len(tokens), tuple(counts))
+        self._by_meeting[meeting_pk].add(key)
+        self._total_length += len(tokens)
+
+    async def _load(self, db: AsyncSession, meeting_pk: Optional[int] = None):
+        transcripts = select(Transcript.id, Transcript.meeting_id, Transcript.processed_transcript, Transcript.speakers)
+        tasks = select(Task.id, Task.meeting_id, Task.task_description, Task.assignee_name)
+        if meeting_pk is not None:
+            transcripts = transcripts.where(Transcript.meeting_id == meeting_pk)
+            tasks = tasks.where(Task.meeting_id == meeting_pk)
+
+        for kind, query in (("transcript", transcripts), ("task", tasks)):
+            async for row_id, row_meeting_pk, body, names in await db.stream(query.execution_options(yield_per=1000)):
+                self._add((kind, row_id), row_meeting_pk, body, names)
+
+    async def ensure_built(self, db: AsyncSession):
+        async with self._lock:
+            if not self._built:
+                await self._load(db)
+                self._built = True
+
+    async def index_meeting(self, db: AsyncSession, meeting_pk: int):
+        if not self._built:
+            return  # Picked up by the full build on first search
+        async with self._lock:
+            self._remove_meeting(meeting_pk)
+            await self._load(db, meeting_pk)
+
+    def _rank(self, terms: List[str], kind: Optional[str]) -> List[Tuple[float, Tuple[str, int]]]:
+        postings = sorted((self._postings.get(term, {}) for term in terms), key=len)
+        if not postings or not postings[0]:
+            return []
+
+        # Every term must match; start from the rarest term's postings
+        candidates = [
+            key for key in postings[0]
+            if (kind is None or key[0] == kind) and all(key in p for p in postings[1:])
+        ]
+        if len(candidates) > self.max_candidates:
+            # Same cut-off as the FTS5 query: only the newest matches of very common terms are ranked
+            candidates = sorted(candidates, key=lambda key: key[1], reverse=True)[:self.max_candidates]
+        doc_count = len(self._docs)
+        avg_length = self._total_length / doc_count if doc_count else 1.0
+        idf = {}
+        for term in terms:
+            df = len(self._postings.get(term, {}))
+            idf[term] = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+
+        scored = []
+        for key in candidates:
+            length = self._docs[key][1]
+            norm = self.K1 * (1 - self.B + self.B * length / avg_length)
+            score = 0.0
+            for term in terms:
+                tf = self._postings[term][key]
+                score += idf[term] * tf * (self.K1 + 1) / (tf + norm)
+            scored.append((score, key))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return scored
+
+    async def search(self, db: AsyncSession, terms: List[str], kind: Optional[str], limit: int, offset: int) -> List[Dict[str, Any]]:
+        await self.ensure_built(db)
+        page = self._rank(terms, kind)[offset:offset + limit]
+        if not page:
+            return []
+
+        ids = {k: [key[1] for _, key in page if key[0] == k] for k in SEARCH_KINDS}
+        texts: Dict[Tuple[str, int], Tuple[str, str]] = {}
+        if ids["transcript"]:
+            rows = await db.execute(
+                select(Transcript.id, Transcript.processed_transcript, Meeting.meeting_id)
+                .join(Meeting, Meeting.id == Transcript.meeting_id)
+                .where(Transcript.id.in_(ids["transcript"]))
+            )
+            texts.update({("transcript", row_id): (body or "", meeting_id) for row_id, body, meeting_id in rows})
+        if ids["task"]:
+            rows = await db.execute(
+                select(Task.id, Task.task_description, Task.assignee_name, Meeting.meeting_id)
+                .join(Meeting, Meeting.id == Task.meeting_id)
+                .where(Task.id.in_(ids["task"]))
+            )
+            texts.update({
+                ("task", row_id): (f"{assignee}: {body}", meeting_id) for row_id, body, assignee, meeting_id in rows
+            })
+
+        return [
+            {
+                "kind": key[0],
+                "id": key[1],
+                "meeting_id": texts[key][1],
+                "score": score,
+                "snippet": make_snippet(texts[key][0], terms)
+            }
+            for score, key in page if key in texts
+        ]
+
+
+class SearchService:
+    """Full-text search over transcripts, speakers and tasks"""
+
+    def __init__(self, backend: str, max_candidates: int):
+        self.max_candidates = max(1, max_candidates)
+        self.use_fts = backend == "fts5" or (backend == "auto" and engine.dialect.name == "sqlite")
+        self.memory_index = None if self.use_fts else InMemorySearchIndex(self.max_candidates)
+
+    async def search(
+        self,
+        db: AsyncSession,
+        query: str,
+        kind: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Ranked matches for every term in query, best first"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        if self.memory_index is not None:
+            return await self.memory_index.search(db, terms, kind, limit, offset)
+
+        # Quote each term so user input can't be parsed as FTS5 query syntax
+        match = " ".join(f'"{term}"' for term in terms)
+        kinds = [kind] if kind else SEARCH_KINDS
+        ranked = (await db.execute(
+            text(
+                " UNION ALL ".join(FTS_RANK.format(kind=k, fts=FTS_TABLES[k]) for k in kinds)
+                + " ORDER BY score DESC, id LIMIT :limit OFFSET :offset"
+            ),
+            {"query": match, "limit": limit, "offset": offset, "candidates": self.max_candidates}
+        )).all()
+
+        details = {}
+        for k in kinds:
+            ids = [row_id for row_kind, row_id, _ in ranked if row_kind == k]
+            if ids:
+                rows = await db.execute(
+                    text(FTS_PAGE.format(fts=FTS_TABLES[k], content=FTS_CONTENT[k]))
+                    .bindparams(bindparam("ids", expanding=True)),
+                    {"query": match, "ids": ids}
+                )
+                details.update({(k, row_id): (meeting_id, snippet) for row_id, meeting_id, snippet in rows})
+
+        return [
+            {
+                "kind": row_kind,
+                "id": row_id,
+                "meeting_id": details[(row_kind, row_id)][0],
+                "score": score,
+                "snippet": highlight(details[(row_kind, row_id)][1])
+            }
+            for row_kind, row_id, score in ranked if (row_kind, row_id) in details
+        ]
+
+    async def index_meeting(self, db: AsyncSession, meeting_pk: int):
+        """Refresh a meeting's transcript and tasks after they were committed (FTS5 tables update via triggers)"""
+        if self.memory_index is not None:
+            await self.memory_index.index_meeting(db, meeting_pk)
+
+
+# Global instance
+search_service = SearchService(settings.SEARCH_BACKEND, settings.SEARCH_MAX_CANDIDATES)
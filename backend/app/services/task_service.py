@@ -0,0 +1,156 @@
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+from sqlalchemy import select, delete, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.database import Meeting, Task
+from app.services.cache_service import mark_tasks_changed
+from app.services.search_service import search_service
+from app.services.dedup_service import task_dedup
+from app.services.llm_service import llm_service
+
+# Task fields a patch may change
+PATCHABLE_FIELDS = ("assignee_name", "task_description", "deadline", "priority")
+
+
+def task_to_patch_data(task: Task) -> Dict[str, Any]:
+    """The view of a task the LLM sees when asked for a patch"""
+    return {
+        "id": task.id,
+        "assignee_name": task.assignee_name,
+        "task_description": task.task_description,
+        "deadline": task.deadline,
+        "priority": task.priority,
+        "is_completed": task.is_completed
+    }
+
+
+def task_row_to_patch_data(row: Dict[str, Any]) -> Dict[str, Any]:
+    """task_to_patch_data for a row written by insert_tasks"""
+    return {field: row[field] for field in ("id", "assignee_name", "task_description", "deadline", "priority", "is_completed")}
+
+
+async def insert_tasks(db: AsyncSession, meeting_pk: int, tasks_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Insert a meeting's tasks with one batched INSERT ... RETURNING (in the caller's transaction); returns the inserted rows in id order"""
+    if not tasks_data:
+        return []
+
+    created_at = datetime.utcnow()
+    rows = [
+        {
+            "meeting_id": meeting_pk,
+            "assignee_name": task_data["assignee_name"],
+            "task_description": task_data["task_description"],
+            "deadline": task_data.get("deadline"),
+            "priority": task_data.get("priority"),
+            "is_completed": bool(task_data.get("is_completed")),
+            "created_at": created_at,
+            "duplicate_of_id": task_data.get("duplicate_of_id")
+        } for task_data in tasks_data
+    ]
+    # Sent as multi-row VALUES batches rather than an INSERT (and ORM flush bookkeeping) per task. This goes to
+    # the Core table because ORM bulk inserts start a new batch whenever the set of NULL columns changes, and
+    # the whole row comes back because asking for RETURNING rows in parameter order also makes SQLite insert
+    # one row at a time
+    table = Task.__table__
+    result = await db.execute(insert(table).returning(*table.columns), rows)
+    return sorted((dict(row) for row in result.mappings()), key=lambda row: row["id"])
+
+
+def task_key(task: Dict[str, Any]) -> tuple:
+    """Normalized (assignee, description), for matching re-extracted tasks to stored ones"""
+    return (
+        llm_service._normalize_task_text(task.get("assignee_name") or ""),
+        llm_service._normalize_task_text(task.get("task_description") or "")
+    )
+
+
+def carry_over_completion(old_tasks: List[Task], tasks_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Mark re-extracted tasks completed when they match a completed task they replace"""
+    completed = {
+        task_key({"assignee_name": task.assignee_name, "task_description": task.task_description})
+        for task in old_tasks if task.is_completed
+    }
+    return [{**task_data, "is_completed": task_key(task_data) in completed} for task_data in tasks_data]
+
+
+async def unlink_duplicates_of(
+    db: AsyncSession, meeting_pk: int, task_ids: Optional[List[int]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Unlink other meetings' tasks marked as duplicates of a meeting's tasks (or just the given
+    ones) before those are deleted, in the caller's transaction.
+
+    The unlinked rows are returned so callers can add them to the dedup index once committed.
+    """
+    table = Task.__table__
+    doomed = select(table.c.id).where(table.c.meeting_id == meeting_pk)
+    if task_ids is not None:
+        doomed = doomed.where(table.c.id.in_(task_ids))
+    result = await db.execute(
+        update(table)
+        .where(table.c.duplicate_of_id.in_(doomed), table.c.meeting_id != meeting_pk)
+        .values(duplicate_of_id=None)
+        .returning(*table.columns)
+    )
+    unlinked = [dict(row) for row in result.mappings()]
+    for other_meeting in {row["meeting_id"] for row in unlinked}:
+        await mark_tasks_changed(db, other_meeting)
+    return unlinked
+
+
+async def clear_meeting_tasks(db: AsyncSession, meeting_pk: int) -> List[Dict[str, Any]]:
+    """
+    Delete a meeting's tasks (in the caller's transaction) before they're replaced.
+
+    Tasks elsewhere marked as duplicates of them are unlinked first, since the ids
+    they point at are going away (see unlink_duplicates_of).
+    """
+    unlinked = await unlink_duplicates_of(db, meeting_pk)
+    await db.execute(delete(Task).where(Task.meeting_id == meeting_pk))
+    return unlinked
+
+
+async def apply_task_patch(db: AsyncSession, meeting: Meeting, patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply add/update/remove changes to a meeting's tasks in one transaction"""
+    tasks = {task.id: task for task in (await db.scalars(select(Task).where(Task.meeting_id == meeting.id))).all()}
+
+    # Ids the LLM made up (or that belong to other meetings) are ignored
+    removed = [task_id for task_id in dict.fromkeys(patch.get("remove", [])) if task_id in tasks]
+    unlinked: List[Dict[str, Any]] = []
+    if removed:
+        unlinked = await unlink_duplicates_of(db, meeting.id, removed)
+        await db.execute(delete(Task).where(Task.id.in_(removed)))
+        for task_id in removed:
+            db.expunge(tasks.pop(task_id))
+
+    updated: List[Task] = []
+    for change in patch.get("update", []):
+        task = tasks.get(change.get("id"))
+        if task is None:
+            continue
+        for field in PATCHABLE_FIELDS:
+            if change.get(field) is not None:
+                setattr(task, field, change[field])
+        updated.append(task)
+
+    added = await insert_tasks(db, meeting.id, patch.get("add", []))
+
+    await mark_tasks_changed(db, meeting.id)
+    await db.commit()
+
+    for task_id in removed:
+        task_dedup.remove(task_id)
+    for task in updated:
+        task_dedup.remove(task.id)
+    task_dedup.add_tasks(updated)
+    task_dedup.add_rows(unlinked + added)
+    await search_service.index_meeting(db, meeting.id)
+
+    # Added tasks are the newest, so they follow the existing ones
+    current = sorted(tasks.values(), key=lambda task: (task.created_at, task.id))
+    return {
+        "added": len(added),
+        "updated": len(updated),
+        "removed": len(removed),
+        "tasks": [task_to_patch_data(task) for task in current] + [task_row_to_patch_data(row) for row in added]
+    }
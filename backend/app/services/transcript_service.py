@@ -0,0 +1,178 @@
+from typing import Callable, Dict, Any, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.database import Meeting, Transcript, Task, encode_raw_transcript
+from app.services.vexa_service import vexa_service
+from app.services.llm_service import llm_service
+from app.services.live_ingestion_service import live_ingestion
+from app.services.cache_service import mark_tasks_changed
+from app.services.search_service import search_service
+from app.services.dedup_service import task_dedup
+from app.services.metrics_service import stage
+from app.services.task_service import insert_tasks, carry_over_completion, clear_meeting_tasks
+
+
+async def _finish_live_transcript(
+    db: AsyncSession,
+    meeting: Meeting,
+    transcript: Transcript,
+    additional_context: Optional[str],
+    bypass_cache: bool,
+    llm_priority: str,
+    on_task: Optional[Callable[[Dict[str, Any]], None]]
+) -> Dict[str, Any]:
+    """Fetch the tail of a live-ingested transcript and extract only what rolling extraction hasn't covered"""
+    await live_ingestion.ingest_new_segments(db, meeting)
+
+    transcript.additional_context = additional_context
+    await db.commit()
+
+    rolling_tasks = live_ingestion.rolling_tasks(transcript)
+    if on_task is not None:
+        for task in rolling_tasks:
+            on_task(task)
+    if len(transcript.processed_transcript or "") <= (transcript.extracted_chars or 0):
+        return {"success": True, "tasks": rolling_tasks}
+
+    llm_result = await llm_service.extract_tasks_from_transcript(
+        live_ingestion.pending_window(transcript),
+        additional_context,
+        meeting.meeting_id,
+        use_cache=not bypass_cache,
+        priority=llm_priority,
+        on_task=on_task
+    )
+    if not llm_result["success"]:
+        return llm_result
+
+    return {
+        "success": True,
+        "tasks": llm_service.merge_task_data([rolling_tasks, llm_result["tasks"]])
+    }
+
+
+async def _merge_into_existing(db: AsyncSession, task_id: int, task_data: Dict[str, Any]):
+    """Fill in details the open task is missing instead of inserting a duplicate"""
+    existing = await db.get(Task, task_id)
+    if existing is None:
+        return
+    existing.deadline = existing.deadline or task_data.get("deadline")
+    existing.priority = existing.priority or task_data.get("priority")
+    await mark_tasks_changed(db, existing.meeting_id)
+
+
+async def process_meeting_transcript(
+    db: AsyncSession,
+    meeting: Meeting,
+    additional_context: Optional[str] = None,
+    bypass_cache: bool = False,
+    llm_priority: str = "default",
+    on_task: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """Fetch a meeting's transcript from Vexa, store it and extract tasks (reporting each to on_task as it's generated)"""
+    # The span is the parent of every stage below, so LLM calls are traced under the meeting too
+    with stage("process_meeting", meeting.meeting_id):
+        return await _process_meeting_transcript(db, meeting, additional_context, bypass_cache, llm_priority, on_task)
+
+
+async def _process_meeting_transcript(
+    db: AsyncSession,
+    meeting: Meeting,
+    additional_context: Optional[str],
+    bypass_cache: bool,
+    llm_priority: str,
+    on_task: Optional[Callable[[Dict[str, Any]], None]]
+) -> Dict[str, Any]:
+    transcript = await db.scalar(select(Transcript).where(Transcript.meeting_id == meeting.id))
+    # Re-processing replaces the meeting's tasks rather than adding a second copy. That includes live-ingested
+    # meetings: their result is every rolling task plus the tail, i.e. the whole meeting's tasks again
+    replace_tasks = transcript is not None
+
+    if transcript is not None and transcript.segments_ingested:
+        # Most of the transcript (and possibly its tasks) arrived while the meeting was live
+        llm_result = await _finish_live_transcript(
+            db, meeting, transcript, additional_context, bypass_cache, llm_priority, on_task
+        )
+    else:
+        # Get transcript from Vexa API
+        with stage("vexa_fetch", meeting.meeting_id):
+            transcript_result = await vexa_service.get_transcript(meeting.meeting_id)
+
+        if not transcript_result["success"]:
+            return {
+                "success": False,
+                "error": f"Failed to fetch transcript: {transcript_result['error']}"
+            }
+
+        # Process the raw transcript
+        raw_transcript = transcript_result["transcript"]
+        with stage("process_transcript_data", meeting.meeting_id):
+            processed_transcript = vexa_service.process_transcript_data(raw_transcript)
+
+        # Stage the transcript (one row per meeting; re-processing replaces it). It's committed with the
+        # tasks below, so no write transaction is held open while the LLM runs
+        if transcript is None:
+            transcript = Transcript(meeting_id=meeting.id)
+            db.add(transcript)
+        transcript.raw_transcript_data = encode_raw_transcript(raw_transcript)
+        transcript.processed_transcript = processed_transcript
+        transcript.speakers = ", ".join(vexa_service.get_speakers(vexa_service.get_segments(raw_transcript) or []))
+        transcript.additional_context = additional_context
+
+        # Extract tasks using LLM
+        llm_result = await llm_service.extract_tasks_from_transcript(
+            processed_transcript,
+            additional_context,
+            meeting.meeting_id,
+            use_cache=not bypass_cache,
+            priority=llm_priority,
+            on_task=on_task
+        )
+
+    if not llm_result["success"]:
+        # Keep the fetched transcript even though extraction failed
+        await db.commit()
+        return {
+            "success": False,
+            "error": f"Failed to extract tasks: {llm_result['error']}"
+        }
+
+    tasks_data = llm_result["tasks"]
+    if replace_tasks:
+        # Tasks completed before still are, as with the reprocess CLI
+        old_tasks = (await db.scalars(select(Task).where(Task.meeting_id == meeting.id))).all()
+        tasks_data = carry_over_completion(old_tasks, tasks_data)
+
+    # Link (or merge) tasks that repeat an open task for the same person, e.g. from last week's standup.
+    # The meeting's own tasks are excluded: on re-process they're about to be replaced
+    duplicates = await task_dedup.find_duplicates(db, tasks_data, exclude_meeting=meeting.id)
+    tasks_data = [
+        {**task_data, "duplicate_of_id": duplicate_of}
+        for task_data, duplicate_of in zip(tasks_data, duplicates)
+    ]
+
+    # Save the transcript and extracted tasks in one transaction
+    new_tasks = []
+    for task_data in tasks_data:
+        if task_data["duplicate_of_id"] is not None and task_dedup.mode == "merge":
+            await _merge_into_existing(db, task_data["duplicate_of_id"], task_data)
+            continue
+        new_tasks.append(task_data)
+
+    with stage("db_commit", meeting.meeting_id):
+        unlinked = await clear_meeting_tasks(db, meeting.id) if replace_tasks else []
+        rows = await insert_tasks(db, meeting.id, new_tasks)
+        await mark_tasks_changed(db, meeting.id)
+        await db.commit()
+    if replace_tasks:
+        task_dedup.forget_meeting(meeting.id)
+    task_dedup.add_rows(unlinked + rows)
+    await search_service.index_meeting(db, meeting.id)
+
+    return {
+        "success": True,
+        "transcript_id": transcript.id,
+        "tasks_extracted": len(new_tasks),
+        "tasks_merged": len(tasks_data) - len(new_tasks),
+        "tasks": tasks_data
+    }
@@ -1,8 +1,14 @@
+import asyncio
 import httpx
 import json
-from typing import Dict, Any, Optional
+import random
+import time
+from typing import Dict, Any, List, Optional
 from app.core.config import settings
 
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
 
 class VexaService:
     def __init__(self):
@@ -12,6 +18,95 @@ class VexaService:
             'Content-Type': 'application/json',
             'X-API-Key': self.api_key
         }
+        self._client: Optional[httpx.AsyncClient] = None
+        self._metrics: Dict[str, Dict[str, float]] = {}
+
+    async def start(self):
+        """Create the shared HTTP client (called at application startup)"""
+        if self._client is None:
+            self._client = self._create_client()
+
+    async def close(self):
+        """Close the shared HTTP client (called at application shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            http2=settings.VEXA_HTTP2,
+            timeout=settings.VEXA_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.VEXA_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.VEXA_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.VEXA_KEEPALIVE_EXPIRY_SECONDS
+            )
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Fall back to a lazily created client when used outside the app lifespan (scripts, workers)
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Exponential backoff with full jitter, honouring Retry-After when the server sends it"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        return random.uniform(0, settings.VEXA_RETRY_BACKOFF_SECONDS * (2 ** attempt))
+
+    def _record(self, endpoint: str, elapsed: float, success: bool, retries: int):
+        stats = self._metrics.setdefault(endpoint, {
+            "count": 0, "errors": 0, "retries": 0, "total_seconds": 0.0, "max_seconds": 0.0
+        })
+        stats["count"] += 1
+        stats["errors"] += 0 if success else 1
+        stats["retries"] += retries
+        stats["total_seconds"] += elapsed
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Per-endpoint request latency metrics"""
+        return {
+            endpoint: {**stats, "mean_seconds": stats["total_seconds"] / stats["count"] if stats["count"] else 0.0}
+            for endpoint, stats in self._metrics.items()
+        }
+
+    async def _request(self, endpoint: str, method: str, path: str, timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+        """Send a request on the shared client, retrying on 429/5xx and connection failures"""
+        # A POST that may have reached the server is only retried on an explicit retryable status
+        retryable_errors = (httpx.ConnectError, httpx.ConnectTimeout) if method == "POST" else (httpx.TransportError,)
+        attempt = 0
+        success = False
+        start = time.perf_counter()
+        try:
+            while True:
+                response = None
+                try:
+                    response = await self.client.request(
+                        method,
+                        path,
+                        timeout=timeout if timeout is not None else settings.VEXA_TIMEOUT_SECONDS,
+                        **kwargs
+                    )
+                except retryable_errors:
+                    if attempt >= settings.VEXA_MAX_RETRIES:
+                        raise
+                else:
+                    if response.status_code not in RETRY_STATUS_CODES or attempt >= settings.VEXA_MAX_RETRIES:
+                        response.raise_for_status()
+                        success = True
+                        return response
+                
+                await asyncio.sleep(self._retry_delay(attempt, response))
+                attempt += 1
+        finally:
+            self._record(endpoint, time.perf_counter() - start, success, attempt)
 
     def extract_meeting_id_from_url(self, meeting_url: str) -> str:
         """Extract meeting ID from Google Meet URL"""
@@ -21,7 +116,7 @@ class VexaService:
         else:
             raise ValueError("Invalid Google Meet URL format")
 
-    async def start_bot(self, meeting_url: str, bot_name: str = "MeetingBot") -> Dict[str, Any]:
+    async def start_bot(self, meeting_url: str, bot_name: str = "MeetingBot", timeout: Optional[float] = None) -> Dict[str, Any]:
         """Start a bot for the given Google Meet URL"""
         try:
             meeting_id = self.extract_meeting_id_from_url(meeting_url)
@@ -32,62 +127,68 @@ class VexaService:
                 "bot_name": bot_name
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/bots",
-                    headers=self.headers,
-                    json=payload
-                )
-                response.raise_for_status()
-                return {
-                    "success": True,
-                    "meeting_id": meeting_id,
-                    "data": response.json()
-                }
+            response = await self._request("start_bot", "POST", "/bots", timeout=timeout, json=payload)
+            return {
+                "success": True,
+                "meeting_id": meeting_id,
+                "data": response.json()
+            }
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e)
             }
 
-    async def get_transcript(self, meeting_id: str) -> Dict[str, Any]:
+    async def get_transcript(self, meeting_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
         """Get transcript for a completed meeting"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/transcripts/google_meet/{meeting_id}",
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                return {
-                    "success": True,
-                    "transcript": response.json()
-                }
+            response = await self._request(
+                "get_transcript", "GET", f"/transcripts/google_meet/{meeting_id}", timeout=timeout
+            )
+            return {
+                "success": True,
+                "transcript": response.json()
+            }
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e)
             }
 
-    async def delete_bot(self, meeting_id: str) -> Dict[str, Any]:
+    async def delete_bot(self, meeting_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
         """Delete/remove bot from meeting"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.delete(
-                    f"{self.base_url}/bots/google_meet/{meeting_id}",
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                return {
-                    "success": True,
-                    "message": "Bot removed successfully"
-                }
+            await self._request("delete_bot", "DELETE", f"/bots/google_meet/{meeting_id}", timeout=timeout)
+            return {
+                "success": True,
+                "message": "Bot removed successfully"
+            }
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e)
             }
 
+    def get_segments(self, raw_transcript: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Return the segment list from a Vexa transcript payload, or None if there isn't one"""
+        if not isinstance(raw_transcript, dict):
+            return None
+        
+        # Check for different possible structures
+        segments = None
+        if "data" in raw_transcript and "segments" in raw_transcript["data"]:
+            segments = raw_transcript["data"]["segments"]
+        elif "segments" in raw_transcript:
+            segments = raw_transcript["segments"]
+        elif "transcript" in raw_transcript and isinstance(raw_transcript["transcript"], list):
+            segments = raw_transcript["transcript"]
+        
+        return segments if isinstance(segments, list) else None
+
+    def get_speakers(self, segments: List[Dict[str, Any]]) -> List[str]:
+        """Distinct speaker names in order of first appearance"""
+        return list(dict.fromkeys(str(segment["speaker"]) for segment in segments if segment.get("speaker")))
+
     def process_transcript_data(self, raw_transcript: Dict[str, Any]) -> str:
         """
         Clean transcript data and extract only text and speaker information.
@@ -98,16 +199,9 @@ class VexaService:
             
             # Handle the structure you showed: data -> segments array with text and speaker
             if isinstance(raw_transcript, dict):
-                # Check for different possible structures
-                segments = None
-                if "data" in raw_transcript and "segments" in raw_transcript["data"]:
-                    segments = raw_transcript["data"]["segments"]
-                elif "segments" in raw_transcript:
-                    segments = raw_transcript["segments"]
-                elif "transcript" in raw_transcript and isinstance(raw_transcript["transcript"], list):
-                    segments = raw_transcript["transcript"]
+                segments = self.get_segments(raw_transcript)
                 
-                if segments and isinstance(segments, list):
+                if segments:
                     for segment in segments:
                         # Extract only text and speaker as requested
                         speaker = segment.get("speaker", "Unknown")
@@ -0,0 +1,33 @@
+"""
+Setup shared by the benchmark scripts.
+
+Importing this module makes the backend's packages importable. Settings are
+read when the app is imported, so scripts call set_placeholder_settings() (after
+any variables of their own) before importing from app or main.
+"""
+import math
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Settings without defaults; benchmarks only need them to be set
+REQUIRED_SETTINGS = ("VEXA_API_KEY", "OPENAI_API_KEY", "GEMINI_API_KEY", "SECRET_KEY")
+
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+def set_placeholder_settings(environ=None):
+    """Give required settings placeholder values, in os.environ or the given mapping"""
+    environ = os.environ if environ is None else environ
+    for key in REQUIRED_SETTINGS:
+        environ.setdefault(key, "benchmark")
+    return environ
+
+
+def percentile(samples, fraction: float) -> float:
+    """Nearest-rank percentile (fraction between 0 and 1) of the samples, 0.0 if there are none"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))]
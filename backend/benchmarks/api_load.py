@@ -0,0 +1,399 @@
+"""
+End-to-end load test of the API: main.app with Vexa and the LLM stubbed out.
+
+Boots main.app in-process (lifespan included: migrations, job workers, PDF
+render pool) against a throwaway SQLite database. Vexa is served by an httpx
+mock transport behind the real client, with seeded synthetic transcripts and
+a configurable latency. The LLM is the "fake" backend (app/services/fake_llm.py).
+So what's measured is the API's own work: routing, DB, job queue, parsing,
+dedup, search indexing and PDF rendering.
+
+Virtual users run concurrently, each repeatedly picking an operation from a
+weighted mix:
+    create   start a bot, complete the meeting, queue processing and wait for the job
+    list     list a meeting's tasks
+    modify   patch-modify a meeting's tasks
+    pdf      export a meeting's tasks as PDF
+    meetings list recent meetings
+    search   full-text search
+
+The database can be pre-seeded with meetings, transcripts and tasks so reads
+run against realistic table sizes. Latency is reported per route (p50/p95/p99)
+with throughput. Results are written as JSON (with the git commit) so runs can
+be compared; --compare prints the change against an earlier result file and
+--fail-on-regression exits non-zero when a route's p95 got worse by more than
+the given percentage.
+
+Client and server share one event loop, so latencies include a little
+client overhead; compare runs made with the same settings on the same machine.
+
+Usage (from the backend directory):
+    python benchmarks/api_load.py --concurrency 32 --duration 60 --seed-meetings 5000
+    python benchmarks/api_load.py --mix create=1,list=5,pdf=1 --compare benchmarks/results/baseline.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from _common import BACKEND_DIR, percentile, set_placeholder_settings
+
+RESULTS_DIR = os.path.join(BACKEND_DIR, "benchmarks", "results")
+DEFAULT_MIX = "create=1,list=5,modify=1,pdf=1,meetings=2,search=1"
+
+FIRST_NAMES = ["Alice", "Bob", "Carol", "Dan", "Erin", "Frank", "Grace", "Heidi", "Ivan", "Judy", "Mallory", "Niaj"]
+TOPICS = ["budget", "hiring plan", "launch", "roadmap", "onboarding docs", "pricing page", "Q3 report",
+          "customer survey", "security review", "release notes", "design mockups", "vendor contract"]
+CHATTER = ["I think that makes sense.", "Can everyone see my screen?", "Let's move on to the next item.",
+           "We discussed this last week.", "The numbers look better than expected.", "I'm not sure about that."]
+ACTIONS = ["I'll send the {topic} by Friday.", "I can review the {topic} tomorrow.",
+           "Let me draft the {topic} before the next sync.", "I'll follow up with legal about the {topic}.",
+           "I will update the {topic} and share it with the team."]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="End-to-end API load test")
+    parser.add_argument("--concurrency", type=int, default=16, help="Virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run after warm-up")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Seconds of load before measuring")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Operation weights")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--seed-meetings", type=int, default=1000, help="Meetings in the database before the run")
+    parser.add_argument("--tasks-per-meeting", type=int, default=12, help="Tasks per pre-seeded meeting")
+    parser.add_argument("--segments", default="80,400", help="Transcript segments per new meeting (MIN,MAX)")
+    parser.add_argument("--vexa-latency", type=float, default=0.05, help="Seconds per stubbed Vexa call")
+    parser.add_argument("--llm-latency", default="lognormal:0.3,0.5", help="FAKE_LLM_LATENCY for the stubbed LLM")
+    parser.add_argument("--job-workers", type=int, default=4, help="JOB_WORKER_CONCURRENCY")
+    parser.add_argument("--poll-interval", type=float, default=0.1, help="Job status polling interval")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/api_load-<commit>-<time>.json)")
+    parser.add_argument("--compare", help="Earlier result file to compare against")
+    parser.add_argument("--fail-on-regression", type=float, help="Exit 1 if a route's p95 is this many percent worse")
+    return parser.parse_args()
+
+
+def configure_environment(args):
+    """Settings are read at import, so this runs before the app is imported"""
+    db_dir = tempfile.mkdtemp(prefix="bench_api_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(db_dir, 'bench.db')}"
+    set_placeholder_settings()
+    os.environ.update({
+        "LLM_BACKEND": "fake",
+        "FAKE_LLM_SEED": str(args.seed),
+        "FAKE_LLM_LATENCY": args.llm_latency,
+        "LLM_REQUESTS_PER_MINUTE": "1000000",
+        "LLM_TOKENS_PER_MINUTE": "1000000000",
+        "LLM_MAX_CONCURRENCY": "256",
+        "JOB_WORKER_CONCURRENCY": str(args.job_workers),
+        "ARTIFACTS_ENABLED": "false",
+        "ARTIFACTS_DIR": os.path.join(db_dir, "outputs"),
+        "LIVE_INGESTION_ENABLED": "false",
+        "VEXA_HTTP2": "false"
+    })
+
+
+def parse_mix(spec: str):
+    mix = {}
+    for item in spec.split(","):
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    unknown = set(mix) - set(OPERATIONS)
+    if unknown:
+        raise SystemExit(f"Unknown operations in --mix: {', '.join(sorted(unknown))}")
+    return mix
+
+
+def make_segments(rng: random.Random, count: int):
+    speakers = rng.sample(FIRST_NAMES, rng.randint(3, 6))
+    segments = []
+    for index in range(count):
+        template = rng.choice(ACTIONS) if rng.random() < 0.15 else rng.choice(CHATTER)
+        segments.append({
+            "speaker": rng.choice(speakers),
+            "text": template.format(topic=rng.choice(TOPICS)),
+            "start": index * 4.0,
+            "end": index * 4.0 + 3.5
+        })
+    return segments
+
+
+class FakeVexa:
+    """Serves the Vexa endpoints the API calls, with a fixed latency and seeded transcripts"""
+
+    def __init__(self, latency: float, segments: tuple, seed: int):
+        self.latency = latency
+        self.segments = segments
+        self.seed = seed
+
+    async def __call__(self, request):
+        import httpx
+
+        await asyncio.sleep(self.latency)
+        path = request.url.path
+        if request.method == "POST" and path == "/bots":
+            return httpx.Response(201, json={"id": 1, "status": "requested"})
+        if request.method == "DELETE" and path.startswith("/bots/"):
+            return httpx.Response(200, json={"status": "stopping"})
+        if request.method == "GET" and path.startswith("/transcripts/"):
+            rng = random.Random(f"{self.seed}:{path}")
+            return httpx.Response(200, json={"segments": make_segments(rng, rng.randint(*self.segments))})
+        return httpx.Response(404, json={"detail": "Not found"})
+
+
+async def seed_database(args):
+    from sqlalchemy import insert
+    from app.models.database import engine, Meeting, Transcript, Task
+
+    rng = random.Random(args.seed)
+    start_date = datetime(2025, 1, 1)
+    batch_size = 500
+    async with engine.begin() as conn:
+        for offset in range(0, args.seed_meetings, batch_size):
+            ids = range(offset + 1, min(offset + batch_size, args.seed_meetings) + 1)
+            await conn.execute(insert(Meeting), [
+                {"id": i, "meeting_id": f"seed-{i:07d}", "meeting_url": f"https://meet.google.com/seed-{i:07d}",
+                 "status": "completed", "created_at": start_date + timedelta(minutes=i), "tasks_version": 0}
+                for i in ids
+            ])
+            await conn.execute(insert(Transcript.__table__), [
+                {"meeting_id": i, "processed_transcript": "\n".join(
+                    f"{segment['speaker']}: {segment['text']}" for segment in make_segments(rng, 40)
+                )} for i in ids
+            ])
+            await conn.execute(insert(Task.__table__), [
+                {"meeting_id": i, "assignee_name": rng.choice(FIRST_NAMES),
+                 "task_description": f"Follow up on the {rng.choice(TOPICS)} ({i}-{n})",
+                 "priority": rng.choice(["High", "Medium", "Low"]), "is_completed": rng.random() < 0.3,
+                 "created_at": start_date + timedelta(minutes=i)}
+                for i in ids for n in range(args.tasks_per_meeting)
+            ])
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.recording = False
+
+    async def request(self, client, route: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        elapsed = time.perf_counter() - started
+        if self.recording:
+            self.samples[route].append(elapsed)
+            if response.status_code >= 400:
+                self.errors[route] += 1
+        return response
+
+
+async def op_create(client, recorder: Recorder, state, rng: random.Random, args):
+    state["created"] += 1
+    n = state["created"]
+    meeting_id = f"{n % 1000:03d}-{(n // 1000) % 10000:04d}-{rng.randint(0, 999):03d}"
+    response = await recorder.request(client, "POST /api/meetings/start", "POST", "/api/meetings/start",
+                                      json={"meeting_url": f"https://meet.google.com/{meeting_id}"})
+    if response.status_code != 200:
+        return
+    await recorder.request(client, "POST /api/meetings/{meeting_id}/complete", "POST", f"/api/meetings/{meeting_id}/complete")
+
+    started = time.perf_counter()
+    response = await recorder.request(client, "POST /api/transcripts/{meeting_id}/process", "POST",
+                                      f"/api/transcripts/{meeting_id}/process", json={})
+    if response.status_code >= 400:
+        return
+    job_id = response.json()["job_id"]
+    while True:
+        await asyncio.sleep(args.poll_interval)
+        job = (await recorder.request(client, "GET /api/transcripts/jobs/{job_id}", "GET", f"/api/transcripts/jobs/{job_id}")).json()
+        if job["status"] in ("completed", "failed"):
+            break
+    # Time from queueing to extracted tasks being stored, as a user waiting on the job sees it
+    if recorder.recording:
+        recorder.samples["job: process transcript"].append(time.perf_counter() - started)
+        if job["status"] == "failed":
+            recorder.errors["job: process transcript"] += 1
+    if job["status"] == "completed":
+        state["meetings"].append(meeting_id)
+
+
+async def op_list(client, recorder, state, rng, args):
+    meeting_id = rng.choice(state["meetings"])
+    await recorder.request(client, "GET /api/tasks/{meeting_id}", "GET", f"/api/tasks/{meeting_id}")
+
+
+async def op_modify(client, recorder, state, rng, args):
+    meeting_id = rng.choice(state["meetings"])
+    await recorder.request(client, "POST /api/tasks/{meeting_id}/modify", "POST", f"/api/tasks/{meeting_id}/modify", json={
+        "modification_request": f"Move the {rng.choice(TOPICS)} follow-up to {rng.choice(FIRST_NAMES)} and make it high priority",
+        "meeting_id": 0,
+        "mode": "patch"
+    })
+
+
+async def op_pdf(client, recorder, state, rng, args):
+    meeting_id = rng.choice(state["meetings"])
+    await recorder.request(client, "GET /api/exports/{meeting_id}/pdf", "GET", f"/api/exports/{meeting_id}/pdf")
+
+
+async def op_meetings(client, recorder, state, rng, args):
+    await recorder.request(client, "GET /api/meetings/", "GET", "/api/meetings/", params={"limit": 20})
+
+
+async def op_search(client, recorder, state, rng, args):
+    await recorder.request(client, "GET /api/search/", "GET", "/api/search/", params={"q": rng.choice(TOPICS).split()[0]})
+
+
+OPERATIONS = {
+    "create": op_create,
+    "list": op_list,
+    "modify": op_modify,
+    "pdf": op_pdf,
+    "meetings": op_meetings,
+    "search": op_search
+}
+
+
+def summarize(recorder: Recorder, elapsed: float):
+    routes = {}
+    for route, samples in sorted(recorder.samples.items()):
+        ordered = sorted(samples)
+        routes[route] = {
+            "count": len(ordered),
+            "errors": recorder.errors[route],
+            "throughput_rps": round(len(ordered) / elapsed, 2),
+            "p50_ms": round(percentile(ordered, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(ordered, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(ordered, 0.99) * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2)
+        }
+    requests = sum(stats["count"] for route, stats in routes.items() if not route.startswith("job:"))
+    return routes, {"requests": requests, "throughput_rps": round(requests / elapsed, 2)}
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=BACKEND_DIR,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+async def run(args):
+    import httpx
+    from main import app
+    from app.services.vexa_service import vexa_service
+
+    mix = parse_mix(args.mix)
+    vexa_service._client = httpx.AsyncClient(
+        base_url=vexa_service.base_url,
+        headers=vexa_service.headers,
+        transport=httpx.MockTransport(FakeVexa(args.vexa_latency, tuple(int(n) for n in args.segments.split(",")), args.seed))
+    )
+
+    async with app.router.lifespan_context(app):
+        started = time.perf_counter()
+        await seed_database(args)
+        print(f"Seeded {args.seed_meetings} meetings with {args.tasks_per_meeting} tasks each "
+              f"in {time.perf_counter() - started:.1f}s")
+
+        state = {
+            "created": 0,
+            "meetings": [f"seed-{i:07d}" for i in range(1, args.seed_meetings + 1)]
+        }
+        recorder = Recorder()
+        names, weights = list(mix), list(mix.values())
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120.0) as client:
+            if not state["meetings"]:
+                # Reads need at least one processed meeting
+                await op_create(client, recorder, state, random.Random(args.seed), args)
+
+            deadline = time.perf_counter() + args.warmup + args.duration
+
+            async def user(index: int):
+                rng = random.Random(args.seed * 1000 + index)
+                while time.perf_counter() < deadline:
+                    await OPERATIONS[rng.choices(names, weights)[0]](client, recorder, state, rng, args)
+
+            users = [asyncio.create_task(user(index)) for index in range(args.concurrency)]
+            await asyncio.sleep(args.warmup)
+            recorder.recording = True
+            measured_from = time.perf_counter()
+            await asyncio.gather(*users)
+            elapsed = time.perf_counter() - measured_from
+
+    return summarize(recorder, elapsed), elapsed
+
+
+def print_report(routes, total, elapsed):
+    print(f"\n{total['requests']} requests in {elapsed:.1f}s ({total['throughput_rps']} req/s)")
+    print(f"{'route':<46} {'count':>7} {'err':>5} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for route, stats in routes.items():
+        print(f"{route:<46} {stats['count']:>7} {stats['errors']:>5} {stats['throughput_rps']:>8} "
+              f"{stats['p50_ms']:>9} {stats['p95_ms']:>9} {stats['p99_ms']:>9}")
+
+
+def compare(routes, baseline_path: str, threshold):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\nCompared with {baseline_path} (commit {baseline['meta']['commit']}):")
+    regressed = []
+    for route, stats in routes.items():
+        before = baseline["routes"].get(route)
+        if before is None or not before["p95_ms"]:
+            continue
+        change = (stats["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100
+        print(f"  {route:<46} p50 {before['p50_ms']:>8} -> {stats['p50_ms']:<8} p95 {before['p95_ms']:>8} -> "
+              f"{stats['p95_ms']:<8} ({change:+.0f}%)")
+        if threshold is not None and change > threshold:
+            regressed.append(route)
+    if regressed:
+        print(f"❌ p95 regressed more than {threshold}% on: {', '.join(regressed)}")
+    return regressed
+
+
+def main():
+    args = parse_args()
+    configure_environment(args)
+    (routes, total), elapsed = asyncio.run(run(args))
+    print_report(routes, total, elapsed)
+
+    commit, dirty = git_commit()
+    result = {
+        "meta": {
+            "commit": commit,
+            "dirty": dirty,
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "args": vars(args)
+        },
+        "elapsed_seconds": round(elapsed, 2),
+        "total": total,
+        "routes": routes
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"api_load-{commit}{'-dirty' if dirty else ''}-{datetime.utcnow():%Y%m%dT%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare and compare(routes, args.compare, args.fail_on_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Concurrency benchmark for the async database layer.
+
+Boots the FastAPI app in-process, seeds a throwaway SQLite database and keeps
+200 clients in flight against a mix of read and write endpoints while a
+separate probe hammers /health. Reports p50/p95/p99 latency for each so you
+can check that DB work no longer stalls the event loop.
+
+Usage (from the backend directory):
+    python benchmarks/db_concurrency.py --clients 200 --requests 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from _common import set_placeholder_settings, percentile
+
+# Settings are read at import time, so configure the environment first
+_db_dir = tempfile.mkdtemp(prefix="bench_db_")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_db_dir, 'bench.db')}")
+set_placeholder_settings()
+
+import httpx  # noqa: E402
+from main import app  # noqa: E402
+from app.models.database import SessionLocal, Meeting, Task, init_db  # noqa: E402
+
+
+def summarize(name, samples):
+    return (
+        f"{name:<12} n={len(samples):<6} "
+        f"p50={percentile(samples, 0.50) * 1000:7.2f}ms "
+        f"p95={percentile(samples, 0.95) * 1000:7.2f}ms "
+        f"p99={percentile(samples, 0.99) * 1000:7.2f}ms "
+        f"mean={statistics.mean(samples) * 1000 if samples else 0:7.2f}ms"
+    )
+
+
+async def seed(meetings: int, tasks_per_meeting: int):
+    async with SessionLocal() as db:
+        for i in range(meetings):
+            meeting = Meeting(
+                meeting_id=f"bench-{i:05d}",
+                meeting_url=f"https://meet.google.com/bench-{i:05d}",
+                status="completed"
+            )
+            db.add(meeting)
+            await db.flush()
+            for j in range(tasks_per_meeting):
+                db.add(Task(
+                    meeting_id=meeting.id,
+                    assignee_name=f"Person {j % 7}",
+                    task_description=f"Benchmark task {j} for meeting {i}",
+                    priority="Medium"
+                ))
+        await db.commit()
+
+
+async def client_worker(client, worker_id, requests, meetings, samples):
+    for n in range(requests):
+        meeting_id = f"bench-{(worker_id * requests + n) % meetings:05d}"
+        if n % 4 == 3:
+            # Writes go through the same session layer as reads
+            url, method = f"/api/tasks/{(worker_id + n) % (meetings * 5) + 1}/complete", "PATCH"
+        elif n % 2:
+            url, method = f"/api/tasks/{meeting_id}", "GET"
+        else:
+            url, method = f"/api/meetings/{meeting_id}", "GET"
+        start = time.perf_counter()
+        await client.request(method, url)
+        samples.append(time.perf_counter() - start)
+
+
+async def health_probe(client, stop, samples):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/health")
+        samples.append(time.perf_counter() - start)
+        await asyncio.sleep(0.005)
+
+
+async def run(clients: int, requests: int, meetings: int):
+    await init_db()
+    await seed(meetings, 5)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Idle baseline for the health probe
+        idle = []
+        for _ in range(200):
+            start = time.perf_counter()
+            await client.get("/health")
+            idle.append(time.perf_counter() - start)
+
+        api_samples, health_samples = [], []
+        stop = asyncio.Event()
+        probe = asyncio.create_task(health_probe(client, stop, health_samples))
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            client_worker(client, i, requests, meetings, api_samples) for i in range(clients)
+        ))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe
+
+    print(f"{clients} clients x {requests} requests in {elapsed:.2f}s "
+          f"({len(api_samples) / elapsed:.0f} req/s)")
+    print(summarize("api", api_samples))
+    print(summarize("health/idle", idle))
+    print(summarize("health/load", health_samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Async DB layer concurrency benchmark")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--meetings", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run(args.clients, args.requests, args.meetings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Import-time cost of the API and its heavy modules, measured with `python -X importtime`.
+
+Each target is imported in a fresh interpreter (several times; the median is
+reported), and the import log is grouped by top-level package so it's clear
+where cold-start time goes. Packages that should load lazily (the Gemini SDK,
+LangChain, ReportLab) are flagged if importing the app pulls them in.
+
+Usage (from the backend directory):
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --target app.services.pdf_service --repeat 10
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from _common import BACKEND_DIR, set_placeholder_settings
+
+LAZY_PACKAGES = ["langchain_google_genai", "google.genai", "langchain_core", "reportlab"]
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_log(target: str):
+    env = set_placeholder_settings(dict(os.environ))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    # (self us, cumulative us, depth, module)
+    return [
+        (int(match.group(1)), int(match.group(2)), len(match.group(3)) // 2, match.group(4))
+        for match in map(LINE.match, result.stderr.splitlines()) if match
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark")
+    parser.add_argument("--target", action="append", help="Module to import (default: main and the heavy services)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=12, help="Packages listed per target")
+    args = parser.parse_args()
+    targets = args.target or ["main", "app.services.llm_service", "app.services.pdf_service", "app.models.database"]
+
+    for target in targets:
+        logs = [import_log(target) for _ in range(args.repeat)]
+        totals = [next(cumulative for _, cumulative, depth, module in log if module == target and depth == 0) for log in logs]
+        print(f"{target}: {statistics.median(totals) / 1000:.0f}ms median over {args.repeat} runs "
+              f"(min {min(totals) / 1000:.0f}ms)")
+
+        by_package = defaultdict(int)
+        for self_us, _, _, module in logs[totals.index(sorted(totals)[len(totals) // 2])]:
+            by_package[module.split(".")[0]] += self_us
+        for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"  {package:<28} {self_us / 1000:7.1f}ms")
+
+        modules = {module for _, _, _, module in logs[0]}
+        loaded = [name for name in LAZY_PACKAGES if name in modules]
+        if loaded and target == "main":
+            print(f"  ! imported eagerly: {', '.join(loaded)}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
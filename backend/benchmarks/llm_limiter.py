@@ -0,0 +1,117 @@
+"""
+A burst of LLM calls against a rate-limited stand-in for Gemini, with and without llm_limiter.
+
+The stand-in enforces a requests-per-second quota and answers calls over it
+with a 429, like Gemini does per minute (time is compressed so the run takes
+seconds). A burst of batch extractions arrives at once and interactive
+modify calls trickle in while it drains. Without the limiter every call
+fires immediately and retries 429s with fixed exponential backoff, the way
+the SDK does; with it, calls are admitted by the shared limiter, which is
+deliberately configured 20% above the quota so AIMD has to find the real rate.
+
+Usage (from the backend directory):
+    python benchmarks/llm_limiter.py --batch 300 --interactive 20 --quota 10
+"""
+import argparse
+import asyncio
+import random
+import time
+from collections import deque
+
+from _common import percentile, set_placeholder_settings
+
+set_placeholder_settings()
+
+from app.services.rate_limit_service import LLMRateLimiter, is_rate_limited  # noqa: E402
+
+
+class QuotaServer:
+    """Answers calls after 0.2-0.5s, or with a 429 when more than `quota` started in the last second"""
+
+    def __init__(self, quota: int, seed: int):
+        self.quota = quota
+        self.started = deque()
+        self.rng = random.Random(seed)
+        self.rate_limited = 0
+
+    async def call(self):
+        now = time.monotonic()
+        while self.started and now - self.started[0] > 1.0:
+            self.started.popleft()
+        if len(self.started) >= self.quota:
+            self.rate_limited += 1
+            await asyncio.sleep(0.02)
+            raise RuntimeError("429 RESOURCE_EXHAUSTED: Quota exceeded for generate_content requests per minute")
+        self.started.append(now)
+        await asyncio.sleep(self.rng.uniform(0.2, 0.5))
+        return "ok"
+
+
+async def call_with_sdk_retries(server: QuotaServer, attempts: int = 6, base: float = 1.0):
+    for attempt in range(attempts):
+        try:
+            return await server.call()
+        except RuntimeError as e:
+            if not is_rate_limited(e) or attempt == attempts - 1:
+                raise
+            await asyncio.sleep(base * 2 ** attempt)
+
+
+async def scenario(args, use_limiter: bool):
+    server = QuotaServer(args.quota, seed=1)
+    limiter = LLMRateLimiter(
+        max_concurrency=args.quota,
+        requests_per_minute=int(args.quota * 60 * 1.2),  # Time is compressed 60x: one "minute" is a second
+        tokens_per_minute=10 ** 9,
+        max_retries=8,
+        backoff_seconds=0.25,
+        min_scale=0.1,
+        scale_increase=0.02
+    )
+    latencies = {"batch": [], "interactive": []}
+    failures = {"batch": 0, "interactive": 0}
+
+    async def one(lane: str, delay: float):
+        await asyncio.sleep(delay)
+        started = time.perf_counter()
+        try:
+            if use_limiter:
+                await limiter.run(server.call, tokens=2000, priority=lane)
+            else:
+                await call_with_sdk_retries(server)
+            latencies[lane].append(time.perf_counter() - started)
+        except RuntimeError:
+            failures[lane] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(one("batch", 0) for _ in range(args.batch)),
+        *(one("interactive", 1 + i * 0.5) for i in range(args.interactive))
+    )
+    elapsed = time.perf_counter() - started
+
+    label = "limiter" if use_limiter else "no limiter"
+    print(f"{label}: {elapsed:.1f}s to drain, {server.rate_limited} 429s from the API")
+    for lane, samples in latencies.items():
+        print(f"  {lane:<12} ok {len(samples):4d}  failed {failures[lane]:3d}  "
+              f"p50 {percentile(samples, 0.50):6.2f}s  p95 {percentile(samples, 0.95):6.2f}s")
+    if use_limiter:
+        stats = limiter.stats()
+        print(f"  limiter: scale {stats['scale']}, {stats['retries']} retries, "
+              f"batch wait p95 {stats['wait']['batch']['p95_ms']:.0f}ms, "
+              f"interactive wait p95 {stats['wait']['interactive']['p95_ms']:.0f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM rate limiter benchmark")
+    parser.add_argument("--batch", type=int, default=300)
+    parser.add_argument("--interactive", type=int, default=20)
+    parser.add_argument("--quota", type=int, default=10, help="Calls per second the stand-in API accepts")
+    args = parser.parse_args()
+
+    asyncio.run(scenario(args, use_limiter=False))
+    asyncio.run(scenario(args, use_limiter=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Search latency over a large seeded database.
+
+Seeds a throwaway SQLite database (100k meetings by default, each with a
+transcript and a few tasks) and times search_service queries through the
+FTS5 index or the in-process index.
+
+Usage (from the backend directory):
+    python benchmarks/search.py --meetings 100000
+    python benchmarks/search.py --meetings 20000 --backend memory
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from _common import percentile, set_placeholder_settings
+
+_db_dir = tempfile.mkdtemp(prefix="bench_search_")
+_args = argparse.ArgumentParser(add_help=False)
+_args.add_argument("--backend", default="fts5")
+_known, _ = _args.parse_known_args()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+os.environ["SEARCH_BACKEND"] = _known.backend
+set_placeholder_settings()
+
+from alembic import command  # noqa: E402
+from sqlalchemy import create_engine, insert  # noqa: E402
+from app.models.database import get_alembic_config, SessionLocal, engine, Meeting, Transcript, Task  # noqa: E402
+from app.services.search_service import search_service  # noqa: E402
+
+SPEAKERS = [f"Speaker{i}" for i in range(500)]
+VOCABULARY = [f"word{i}" for i in range(20000)]
+TOPICS = ["budget", "roadmap", "hiring", "migration", "launch", "security", "pricing", "onboarding"]
+BATCH_SIZE = 5000
+
+
+def seed(sync_engine, meetings: int, turns: int):
+    rng = random.Random(42)
+    start_date = datetime(2024, 1, 1)
+    with sync_engine.begin() as conn:
+        for offset in range(0, meetings, BATCH_SIZE):
+            batch = range(offset, min(offset + BATCH_SIZE, meetings))
+            conn.execute(insert(Meeting), [
+                {
+                    "id": i + 1,
+                    "meeting_id": f"bench-{i:07d}",
+                    "meeting_url": f"https://meet.google.com/bench-{i:07d}",
+                    "status": "completed",
+                    "created_at": start_date + timedelta(minutes=i)
+                } for i in batch
+            ])
+            transcripts, tasks = [], []
+            for i in batch:
+                speakers = rng.sample(SPEAKERS, 4)
+                lines = [
+                    f"{rng.choice(speakers)}: " + " ".join(
+                        rng.choice(TOPICS) if rng.random() < 0.05 else rng.choice(VOCABULARY) for _ in range(12)
+                    ) for _ in range(turns)
+                ]
+                transcripts.append({
+                    "meeting_id": i + 1,
+                    "processed_transcript": "\n".join(lines),
+                    "speakers": ", ".join(speakers)
+                })
+                tasks.extend({
+                    "meeting_id": i + 1,
+                    "assignee_name": rng.choice(speakers),
+                    "task_description": f"Follow up on {rng.choice(TOPICS)} {rng.choice(VOCABULARY)}",
+                    "priority": "Medium"
+                } for _ in range(3))
+            conn.execute(insert(Transcript), transcripts)
+            conn.execute(insert(Task), tasks)
+
+
+async def time_queries(repeat: int):
+    rng = random.Random(7)
+    queries = {
+        "rare word": lambda: rng.choice(VOCABULARY),
+        "two rare words": lambda: f"{rng.choice(VOCABULARY)} {rng.choice(VOCABULARY)}",
+        "speaker": lambda: rng.choice(SPEAKERS),
+        "topic + speaker": lambda: f"{rng.choice(TOPICS)} {rng.choice(SPEAKERS)}",
+        "common topic": lambda: rng.choice(TOPICS),
+    }
+    async with SessionLocal() as db:
+        # First query builds the in-process index; keep it out of the timings
+        started = time.perf_counter()
+        await search_service.search(db, "warmup")
+        print(f"Warm-up query: {(time.perf_counter() - started) * 1000:.0f}ms")
+
+        print(f"{'query':<18} {'p50':>9} {'p95':>9}")
+        for name, make_query in queries.items():
+            samples = []
+            for _ in range(repeat):
+                query = make_query()
+                started = time.perf_counter()
+                await search_service.search(db, query, limit=20)
+                samples.append(time.perf_counter() - started)
+            print(f"{name:<18} {statistics.median(samples) * 1000:7.2f}ms "
+                  f"{percentile(samples, 0.95) * 1000:7.2f}ms")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text search benchmark")
+    parser.add_argument("--meetings", type=int, default=100000)
+    parser.add_argument("--turns", type=int, default=20, help="Speaker turns per transcript")
+    parser.add_argument("--backend", choices=["fts5", "memory"], default="fts5")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    command.upgrade(get_alembic_config(), "head")
+    started = time.perf_counter()
+    seed(create_engine(os.environ["DATABASE_URL"]), args.meetings, args.turns)
+    print(f"Seeded {args.meetings} meetings in {time.perf_counter() - started:.1f}s ({args.backend} backend)")
+
+    asyncio.run(time_queries(args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Time to first task with streamed extraction vs. waiting for the whole response.
+
+Runs extract_tasks_from_transcript against a stand-in model that emits a
+response of N tasks at a fixed output rate (Gemini 2.5 Flash streams roughly
+150-250 tokens per second after a short first-token delay). Reports when
+each task reached the on_task callback compared with when the complete
+result was available, which is all the non-streaming path can show.
+
+Usage (from the backend directory):
+    python benchmarks/streaming_extraction.py --tasks 20 --tokens-per-second 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from _common import set_placeholder_settings
+
+set_placeholder_settings()
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+os.environ.setdefault("ARTIFACTS_ENABLED", "false")
+
+from langchain_core.runnables import RunnableGenerator  # noqa: E402
+from app.services.llm_service import llm_service  # noqa: E402
+
+
+def make_response(tasks: int) -> str:
+    return json.dumps({"tasks": [
+        {
+            "title": f"Follow-up item {i}",
+            "description": f"Prepare the follow-up material for item {i} discussed in the planning meeting",
+            "assignee": ["Alice", "Bob", "Carol"][i % 3],
+            "priority": "Medium",
+            "status": "pending",
+            "deadline": None,
+            "category": "action_item"
+        } for i in range(tasks)
+    ]}, indent=2)
+
+
+def make_model(response: str, tokens_per_second: float, first_token_delay: float):
+    async def generate(inputs):
+        async for _ in inputs:
+            pass
+        await asyncio.sleep(first_token_delay)
+        step = 4 * 8  # Eight tokens of about four characters per chunk
+        for offset in range(0, len(response), step):
+            await asyncio.sleep(8 / tokens_per_second)
+            yield response[offset:offset + step]
+    return RunnableGenerator(generate)
+
+
+async def measure(args):
+    response = make_response(args.tasks)
+    llm_service.llm = make_model(response, args.tokens_per_second, args.first_token_delay)
+    transcript = "Alice: Let's go through the follow-up items for the planning meeting."
+    arrivals = []
+
+    started = time.perf_counter()
+    result = await llm_service.extract_tasks_from_transcript(
+        transcript, use_cache=False, on_task=lambda task: arrivals.append(time.perf_counter() - started)
+    )
+    total = time.perf_counter() - started
+    assert result["success"] and len(result["tasks"]) == args.tasks, result
+    return len(response) // 4, arrivals, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming extraction benchmark")
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--tokens-per-second", type=float, default=200)
+    parser.add_argument("--first-token-delay", type=float, default=0.5)
+    args = parser.parse_args()
+
+    response_tokens, arrivals, total = asyncio.run(measure(args))
+    print(f"Response: ~{response_tokens} tokens, {args.tasks} tasks at {args.tokens_per_second:.0f} tokens/s")
+    print(f"Whole result (what a non-streaming call waits for): {total:.2f}s")
+    print(f"First task streamed: {arrivals[0]:.2f}s; median task: {arrivals[len(arrivals) // 2]:.2f}s; "
+          f"last task: {arrivals[-1]:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
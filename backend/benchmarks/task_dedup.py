@@ -0,0 +1,106 @@
+"""
+Near-duplicate task lookup cost against a large index of open tasks.
+
+Fills the dedup index with synthetic open tasks (1M by default, spread over
+assignees), then times find() for meetings of new tasks. Half of each
+meeting's tasks are light rewordings of indexed tasks; the report shows how
+many of those were linked and how many unrelated tasks were wrongly linked.
+
+Usage (from the backend directory):
+    python benchmarks/task_dedup.py --tasks 1000000 --assignees 500
+"""
+import argparse
+import random
+import statistics
+import time
+
+from _common import percentile, set_placeholder_settings
+
+set_placeholder_settings()
+
+from app.core.config import settings  # noqa: E402
+from app.services.dedup_service import TaskDedupIndex  # noqa: E402
+
+VERBS = ["Prepare", "Review", "Send", "Update", "Schedule", "Draft", "Fix", "Write", "Share", "Finalize"]
+SYLLABLES = ["ka", "lo", "mi", "ra", "ten", "vo", "shi", "bel", "dor", "qu", "ex", "pan", "sim", "tur", "zen"]
+
+
+def make_vocabulary(rng: random.Random, size: int):
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def make_description(rng: random.Random, vocabulary) -> str:
+    return f"{rng.choice(VERBS)} the " + " ".join(rng.choice(vocabulary) for _ in range(rng.randint(4, 7)))
+
+
+def reword(description: str, rng: random.Random) -> str:
+    """A near-duplicate: the same item phrased slightly differently"""
+    words = description.split()
+    variants = [
+        lambda w: ["Please", w[0].lower()] + w[1:],
+        lambda w: w + ["asap"],
+        lambda w: w[:-1] + [w[-1].upper() + "."],
+        lambda w: [w[0]] + ["our" if x == "the" else x for x in w[1:]],
+    ]
+    return " ".join(rng.choice(variants)(words))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Task dedup benchmark")
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--assignees", type=int, default=500)
+    parser.add_argument("--meetings", type=int, default=200)
+    parser.add_argument("--tasks-per-meeting", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    assignees = [f"Person {i}" for i in range(args.assignees)]
+    vocabulary = make_vocabulary(rng, 20000)
+    index = TaskDedupIndex("link", settings.TASK_DEDUP_THRESHOLD, settings.TASK_DEDUP_DIMENSIONS)
+
+    rows = [
+        (task_id, task_id // 10, rng.choice(assignees), make_description(rng, vocabulary))
+        for task_id in range(1, args.tasks + 1)
+    ]
+    started = time.perf_counter()
+    index.add(rows)
+    print(f"Indexed {args.tasks} open tasks in {time.perf_counter() - started:.1f}s "
+          f"({args.tasks * settings.TASK_DEDUP_DIMENSIONS * 4 / 2 ** 20:.0f} MiB of vectors)")
+
+    samples = []
+    found = planted = false_links = unrelated = 0
+    for _ in range(args.meetings):
+        batch_assignees, descriptions, expected = [], [], []
+        for i in range(args.tasks_per_meeting):
+            if i % 2 == 0:
+                task_id, _, assignee, description = rows[rng.randrange(len(rows))]
+                batch_assignees.append(assignee)
+                descriptions.append(reword(description, rng))
+                expected.append(task_id)
+            else:
+                batch_assignees.append(rng.choice(assignees))
+                descriptions.append(make_description(rng, vocabulary))
+                expected.append(None)
+
+        started = time.perf_counter()
+        matches = index.find(batch_assignees, descriptions)
+        samples.append(time.perf_counter() - started)
+
+        for match, want in zip(matches, expected):
+            if want is None:
+                unrelated += 1
+                false_links += match is not None
+            else:
+                planted += 1
+                found += match == want
+
+    print(f"Per meeting ({args.tasks_per_meeting} tasks): p50 {statistics.median(samples) * 1000:.2f}ms, "
+          f"p95 {percentile(samples, 0.95) * 1000:.2f}ms")
+    print(f"Rewordings linked: {found}/{planted}; unrelated tasks wrongly linked: {false_links}/{unrelated}")
+
+
+if __name__ == "__main__":
+    main()
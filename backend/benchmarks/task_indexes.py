@@ -0,0 +1,146 @@
+"""
+Lookup latency before and after the task/transcript index migration.
+
+Migrates a throwaway SQLite database to the revision just before
+0003_task_lookup_indexes, seeds it (1M tasks by default), times the lookups
+the API performs, then upgrades to head and times them again.
+
+Usage (from the backend directory):
+    python benchmarks/task_indexes.py --tasks 1000000 --meetings 20000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from _common import set_placeholder_settings
+
+_db_dir = tempfile.mkdtemp(prefix="bench_idx_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+set_placeholder_settings()
+
+from alembic import command  # noqa: E402
+from sqlalchemy import create_engine, insert, select, table, column, Boolean, DateTime, Integer, String, Text  # noqa: E402
+from app.models.database import get_alembic_config  # noqa: E402
+
+ASSIGNEES = [f"Person {i}" for i in range(200)]
+BATCH_SIZE = 50000
+
+# The columns that exist at 0002_cache_jobs_live_ingestion; the ORM models carry later ones
+meetings_table = table(
+    "meetings",
+    column("id", Integer),
+    column("meeting_id", String),
+    column("meeting_url", String),
+    column("status", String),
+    column("created_at", DateTime),
+)
+transcripts_table = table(
+    "transcripts",
+    column("id", Integer),
+    column("meeting_id", Integer),
+    column("processed_transcript", Text),
+)
+tasks_table = table(
+    "tasks",
+    column("id", Integer),
+    column("meeting_id", Integer),
+    column("assignee_name", String),
+    column("task_description", Text),
+    column("deadline", String),
+    column("priority", String),
+    column("is_completed", Boolean),
+)
+
+
+def alembic_upgrade(revision: str):
+    command.upgrade(get_alembic_config(), revision)
+
+
+def seed(engine, meetings: int, tasks: int):
+    start_date = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(meetings_table), [
+            {
+                "id": i + 1,
+                "meeting_id": f"bench-{i:07d}",
+                "meeting_url": f"https://meet.google.com/bench-{i:07d}",
+                "status": "completed",
+                "created_at": start_date + timedelta(minutes=i)
+            } for i in range(meetings)
+        ])
+        conn.execute(insert(transcripts_table), [
+            {"meeting_id": i + 1, "processed_transcript": f"Transcript {i}"} for i in range(meetings)
+        ])
+        for offset in range(0, tasks, BATCH_SIZE):
+            conn.execute(insert(tasks_table), [
+                {
+                    "meeting_id": (i % meetings) + 1,
+                    "assignee_name": ASSIGNEES[i % len(ASSIGNEES)],
+                    "task_description": f"Benchmark task {i}",
+                    "deadline": (start_date + timedelta(days=i % 700)).strftime("%Y-%m-%d"),
+                    "priority": "Medium",
+                    "is_completed": i % 3 == 0
+                } for i in range(offset, min(offset + BATCH_SIZE, tasks))
+            ])
+
+
+def week_range(rng: random.Random):
+    start = datetime(2024, 1, 1) + timedelta(days=rng.randint(0, 690))
+    return start.strftime("%Y-%m-%d"), (start + timedelta(days=7)).strftime("%Y-%m-%d")
+
+
+def time_queries(engine, meetings: int, repeat: int):
+    rng = random.Random(42)
+    queries = {
+        "tasks by meeting": lambda: select(tasks_table).where(tasks_table.c.meeting_id == rng.randint(1, meetings)),
+        "open tasks by assignee": lambda: select(tasks_table).where(
+            tasks_table.c.assignee_name == rng.choice(ASSIGNEES), tasks_table.c.is_completed.is_(False)
+        ),
+        "tasks due in a week": lambda: select(tasks_table).where(tasks_table.c.deadline.between(*week_range(rng))),
+        "transcript by meeting": lambda: select(transcripts_table).where(transcripts_table.c.meeting_id == rng.randint(1, meetings)),
+    }
+    results = {}
+    with engine.connect() as conn:
+        for name, make_query in queries.items():
+            samples = []
+            for _ in range(repeat):
+                query = make_query()
+                start = time.perf_counter()
+                conn.execute(query).fetchall()
+                samples.append(time.perf_counter() - start)
+            results[name] = statistics.median(samples)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Task lookup index benchmark")
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--meetings", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine(os.environ["DATABASE_URL"])
+
+    alembic_upgrade("0002_cache_jobs_live_ingestion")
+    started = time.perf_counter()
+    seed(engine, args.meetings, args.tasks)
+    print(f"Seeded {args.tasks} tasks across {args.meetings} meetings in {time.perf_counter() - started:.1f}s")
+
+    before = time_queries(engine, args.meetings, args.repeat)
+    started = time.perf_counter()
+    alembic_upgrade("head")
+    print(f"Index migration took {time.perf_counter() - started:.1f}s")
+    after = time_queries(engine, args.meetings, args.repeat)
+
+    print(f"{'query':<24} {'before':>12} {'after':>12} {'speedup':>9}")
+    for name in before:
+        print(f"{name:<24} {before[name] * 1000:10.2f}ms {after[name] * 1000:10.2f}ms "
+              f"{before[name] / after[name] if after[name] else float('inf'):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
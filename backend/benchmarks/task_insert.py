@@ -0,0 +1,140 @@
+"""
+Cost of persisting extracted tasks: one ORM object per task vs. the bulk insert path.
+
+The "orm" path is how tasks used to be saved: the transcript is committed on
+its own, then a Task object is added per extracted task and committed. The
+"bulk" path is process_meeting_transcript's current write: the transcript and
+every task go out in one transaction, the tasks as a single batched
+INSERT ... RETURNING (insert_tasks). Two workloads run against a migrated
+throwaway SQLite database (FTS triggers included):
+
+  * large meetings: meetings with 500 extracted tasks each
+  * backfill: re-processing 10k meetings with a typical number of tasks
+
+The tasks table is emptied between runs so both paths start from the same state.
+
+Usage (from the backend directory):
+    python benchmarks/task_insert.py --large-meetings 20 --large-tasks 500 --backfill-meetings 10000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from _common import percentile, set_placeholder_settings
+
+_db_dir = tempfile.mkdtemp(prefix="bench_insert_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+set_placeholder_settings()
+os.environ.setdefault("SEARCH_BACKEND", "fts5")
+
+from sqlalchemy import delete, insert, select  # noqa: E402
+from app.models.database import init_db, engine, SessionLocal, Meeting, Task, Transcript  # noqa: E402
+from app.services.cache_service import mark_tasks_changed  # noqa: E402
+from app.services.task_service import insert_tasks  # noqa: E402
+
+ASSIGNEES = ["Alice", "Bob", "Carol", "Dan", "Erin", "Frank"]
+
+
+def make_tasks(count: int, seed: int):
+    return [
+        {
+            "assignee_name": ASSIGNEES[(seed + i) % len(ASSIGNEES)],
+            "task_description": f"Follow up on item {i} from meeting {seed}: prepare the notes and share them with the team",
+            "deadline": "2026-03-01" if i % 3 == 0 else None,
+            "priority": ["High", "Medium", "Low"][i % 3],
+            "duplicate_of_id": None
+        } for i in range(count)
+    ]
+
+
+async def save_orm(meeting_pk: int, tasks_data):
+    async with SessionLocal() as db:
+        transcript = await db.scalar(select(Transcript).where(Transcript.meeting_id == meeting_pk))
+        transcript.processed_transcript = f"Reprocessed transcript {meeting_pk}"
+        await db.commit()
+        await db.refresh(transcript)
+
+        for task_data in tasks_data:
+            db.add(Task(
+                meeting_id=meeting_pk,
+                assignee_name=task_data["assignee_name"],
+                task_description=task_data["task_description"],
+                deadline=task_data.get("deadline"),
+                priority=task_data.get("priority"),
+                duplicate_of_id=task_data["duplicate_of_id"]
+            ))
+        await mark_tasks_changed(db, meeting_pk)
+        await db.commit()
+
+
+async def save_bulk(meeting_pk: int, tasks_data):
+    async with SessionLocal() as db:
+        transcript = await db.scalar(select(Transcript).where(Transcript.meeting_id == meeting_pk))
+        transcript.processed_transcript = f"Reprocessed transcript {meeting_pk}"
+        await insert_tasks(db, meeting_pk, tasks_data)
+        await mark_tasks_changed(db, meeting_pk)
+        await db.commit()
+
+
+async def seed(meetings: int):
+    await init_db()
+    async with engine.begin() as conn:
+        await conn.execute(insert(Meeting), [
+            {"id": i, "meeting_id": f"bench-{i:06d}", "meeting_url": f"https://meet.google.com/bench-{i:06d}",
+             "status": "completed", "tasks_version": 0}
+            for i in range(1, meetings + 1)
+        ])
+        await conn.execute(insert(Transcript), [
+            {"meeting_id": i, "processed_transcript": f"Transcript {i}"} for i in range(1, meetings + 1)
+        ])
+
+
+async def run(label: str, save, meetings: int, tasks_per_meeting: int):
+    async with engine.begin() as conn:
+        await conn.execute(delete(Task))
+    tasks_data = [make_tasks(tasks_per_meeting, meeting_pk) for meeting_pk in range(1, meetings + 1)]
+
+    samples = []
+    started = time.perf_counter()
+    for meeting_pk, meeting_tasks in enumerate(tasks_data, start=1):
+        call_started = time.perf_counter()
+        await save(meeting_pk, meeting_tasks)
+        samples.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+
+    print(f"  {label:<5} {elapsed:7.2f}s total  {meetings / elapsed:8.1f} meetings/s  "
+          f"{meetings * tasks_per_meeting / elapsed:9.0f} tasks/s  "
+          f"p50 {statistics.median(samples) * 1000:7.1f}ms  p95 {percentile(samples, 0.95) * 1000:7.1f}ms")
+    return elapsed
+
+
+async def main_async(args):
+    await seed(max(args.large_meetings, args.backfill_meetings))
+
+    print(f"Large meetings: {args.large_meetings} meetings x {args.large_tasks} tasks")
+    orm = await run("orm", save_orm, args.large_meetings, args.large_tasks)
+    bulk = await run("bulk", save_bulk, args.large_meetings, args.large_tasks)
+    print(f"  speedup {orm / bulk:.1f}x")
+
+    print(f"Backfill: {args.backfill_meetings} meetings x {args.backfill_tasks} tasks")
+    orm = await run("orm", save_orm, args.backfill_meetings, args.backfill_tasks)
+    bulk = await run("bulk", save_bulk, args.backfill_meetings, args.backfill_tasks)
+    print(f"  speedup {orm / bulk:.1f}x")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Task insert benchmark")
+    parser.add_argument("--large-meetings", type=int, default=20)
+    parser.add_argument("--large-tasks", type=int, default=500)
+    parser.add_argument("--backfill-meetings", type=int, default=10000)
+    parser.add_argument("--backfill-tasks", type=int, default=12)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Prompt and response size of patch vs. replace task modification.
+
+Builds a long synthetic meeting (900 speaker turns, 30 tasks by default) and
+runs small edit requests through both modification modes with a stand-in
+LLM. The stand-in answers the way Gemini would: the full task list for
+replace mode, only the changes for patch mode. Tokens are estimated at four
+characters each. Latency is estimated as 0.3s + 0.02ms per prompt token +
+8ms per response token, roughly what Gemini 2.5 Flash shows.
+
+Usage (from the backend directory):
+    python benchmarks/task_modification.py --turns 900 --tasks 30
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+
+from _common import set_placeholder_settings
+
+set_placeholder_settings()
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+os.environ.setdefault("ARTIFACTS_ENABLED", "false")
+
+from langchain_core.runnables import RunnableLambda  # noqa: E402
+from app.services.llm_service import llm_service  # noqa: E402
+
+SPEAKERS = ["Alice", "Bob", "Carol", "Dan", "Erin", "Frank"]
+TOPICS = ["budget", "roadmap", "hiring", "migration", "launch", "security", "pricing", "onboarding", "vendor", "audit"]
+FILLER = "we talked through the numbers and agreed the plan looks reasonable for now overall".split()
+
+REQUESTS = [
+    "Move the vendor task to Carol",
+    "The security audit deadline is 2026-03-01",
+    "Remove the pricing follow-up, it was cancelled",
+    "Add a task for Dan to book the launch venue",
+]
+
+
+def make_meeting(rng: random.Random, turns: int, tasks: int):
+    lines = []
+    for _ in range(turns):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(8, 25))]
+        words.insert(rng.randrange(len(words)), rng.choice(TOPICS))
+        lines.append(f"{rng.choice(SPEAKERS)}: {' '.join(words)}")
+    task_list = [
+        {
+            "id": i + 1,
+            "assignee_name": rng.choice(SPEAKERS),
+            "task_description": f"Follow up on the {TOPICS[i % len(TOPICS)]} item {i} discussed in the meeting",
+            "deadline": None,
+            "priority": "Medium",
+            "is_completed": False
+        } for i in range(tasks)
+    ]
+    return "\n".join(lines), task_list
+
+
+def tokens(text: str) -> int:
+    return len(text) // 4
+
+
+def latency(prompt_tokens: int, response_tokens: int) -> float:
+    return 0.3 + prompt_tokens * 0.00002 + response_tokens * 0.008
+
+
+async def measure(transcript, task_list):
+    sizes = {}
+
+    def replace_llm(prompt):
+        text = prompt.to_string()
+        response = json.dumps({"tasks": [
+            {
+                "title": task["task_description"][:40],
+                "description": task["task_description"],
+                "assignee": task["assignee_name"],
+                "priority": task["priority"],
+                "deadline": task["deadline"]
+            } for task in task_list
+        ]})
+        sizes["replace"] = (tokens(text), tokens(response))
+        return response
+
+    def patch_llm(prompt):
+        text = prompt.to_string()
+        response = json.dumps({"add": [], "update": [{"id": task_list[0]["id"], "assignee": "Carol"}], "remove": []})
+        sizes["patch"] = (tokens(text), tokens(response))
+        return response
+
+    replace_data = [{k: task[k] for k in ("assignee_name", "task_description", "deadline", "priority")} for task in task_list]
+    llm_service.llm = RunnableLambda(replace_llm)
+    await llm_service.modify_task_assignments(transcript, replace_data, REQUESTS[0], use_cache=False)
+    results = {}
+    for request in REQUESTS:
+        llm_service.llm = RunnableLambda(patch_llm)
+        await llm_service.modify_tasks_with_patch(transcript, task_list, request, use_cache=False)
+        results[request] = sizes["patch"]
+    return sizes["replace"], results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Task modification prompt size benchmark")
+    parser.add_argument("--turns", type=int, default=900)
+    parser.add_argument("--tasks", type=int, default=30)
+    args = parser.parse_args()
+
+    transcript, task_list = make_meeting(random.Random(42), args.turns, args.tasks)
+    (replace_in, replace_out), patches = asyncio.run(measure(transcript, task_list))
+
+    print(f"Transcript: {len(transcript)} chars, {args.tasks} tasks")
+    print(f"{'mode / request':<48} {'prompt tok':>10} {'reply tok':>10} {'est. latency':>13}")
+    print(f"{'replace (any request)':<48} {replace_in:10d} {replace_out:10d} {latency(replace_in, replace_out):12.2f}s")
+    for request, (patch_in, patch_out) in patches.items():
+        print(f"{'patch: ' + request:<48} {patch_in:10d} {patch_out:10d} {latency(patch_in, patch_out):12.2f}s")
+
+
+if __name__ == "__main__":
+    main()
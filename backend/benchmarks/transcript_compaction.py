@@ -0,0 +1,134 @@
+"""
+Prompt tokens saved by transcript compaction, and whether action items survive it.
+
+Generates a seeded corpus of meetings in the shape Vexa produces: speech split
+into short same-speaker segments, back-channel ("yeah", "mm-hmm"), inline
+fillers and stutters, with action items planted among the discussion. Each
+transcript is compacted with the configured settings, then a rule-based
+reference extractor runs over both versions. Quality holds if it finds the
+same (assignee, action, deadline) items in the compacted transcript as in the
+original. A second pass repeats this under a tight token budget.
+
+Usage (from the backend directory):
+    python benchmarks/transcript_compaction.py --meetings 200 --turns 400
+"""
+import argparse
+import random
+import re
+import statistics
+import time
+
+from _common import set_placeholder_settings
+
+set_placeholder_settings()
+
+from app.core.config import settings  # noqa: E402
+from app.services.compaction_service import TranscriptCompactor  # noqa: E402
+
+SPEAKERS = ["Alice", "Bob", "Carol", "Dan", "Erin", "Frank"]
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+ACTIONS = ["update the roadmap", "send the invoice", "review the pull request", "book the venue",
+           "draft the announcement", "fix the login bug", "prepare the budget", "call the vendor"]
+DISCUSSION = [
+    "I think the numbers from last quarter look a bit better than expected",
+    "so the main concern is still the onboarding flow for new customers",
+    "we looked at the metrics and the churn is roughly flat this month",
+    "the team agreed the design direction makes sense for the next release",
+    "there was some feedback about the pricing page being confusing",
+    "honestly the migration went smoother than I thought it would",
+]
+BACKCHANNEL = ["yeah", "mm-hmm", "right", "okay", "yeah yeah", "uh-huh", "got it", "hmm", "okay, cool", "Yep."]
+FILLERS = ["um,", "uh", "you know,", "I mean"]
+
+
+def noisy(text: str, rng: random.Random) -> str:
+    words = text.split()
+    for _ in range(rng.randint(0, 2)):
+        words.insert(rng.randrange(len(words) + 1), rng.choice(FILLERS))
+    if rng.random() < 0.2:
+        i = rng.randrange(len(words))
+        words.insert(i, words[i])
+    return " ".join(words) + ("  " if rng.random() < 0.3 else "")
+
+
+def make_meeting(rng: random.Random, turns: int):
+    """Transcript lines plus the action items planted in them"""
+    lines, planted = [], []
+    while len(lines) < turns:
+        speaker = rng.choice(SPEAKERS)
+        roll = rng.random()
+        if roll < 0.05:
+            action, day = rng.choice(ACTIONS), rng.choice(DAYS)
+            lines.append(f"{speaker}: {noisy(f'I will {action}', rng)} by {day}.")
+            planted.append((speaker, action, day))
+        elif roll < 0.08:
+            other = rng.choice([name for name in SPEAKERS if name != speaker])
+            action, day = rng.choice(ACTIONS), rng.choice(DAYS)
+            lines.append(f"{speaker}: {other}, can you {action} by {day}?")
+            lines.append(f"{other}: {rng.choice(['yeah', 'Sure.', 'okay'])}")
+            planted.append((other, action, day))
+        elif roll < 0.4:
+            lines.append(f"{speaker}: {rng.choice(BACKCHANNEL)}")
+        else:
+            # Long speech arrives as several short segments from the same speaker
+            sentence = noisy(rng.choice(DISCUSSION), rng).split()
+            cut = rng.randint(1, len(sentence) - 1)
+            lines.append(f"{speaker}: {' '.join(sentence[:cut])}")
+            lines.append(f"{speaker}: {' '.join(sentence[cut:])}")
+    return "\n".join(lines), planted
+
+
+SELF_ASSIGNED = re.compile(r"\bI will (" + "|".join(ACTIONS) + r") by (\w+)")
+REQUESTED = re.compile(r"\b(\w+), can you (" + "|".join(ACTIONS) + r") by (\w+)\?")
+
+
+def reference_extract(transcript: str):
+    """Stand-in for the LLM: (assignee, action, deadline) for each planted phrasing it can read"""
+    found = []
+    for line in transcript.split("\n"):
+        speaker, _, text = line.partition(": ")
+        found.extend((speaker, *match.groups()) for match in SELF_ASSIGNED.finditer(text))
+        found.extend(match.groups() for match in REQUESTED.finditer(text))
+    return sorted(found)
+
+
+def run(compactor: TranscriptCompactor, corpus, label: str):
+    ratios, recalls, lost = [], [], 0
+    started = time.perf_counter()
+    for transcript, _ in corpus:
+        compaction = compactor.compact(transcript)
+        ratios.append(compaction["ratio"])
+        before = reference_extract(transcript)
+        after = reference_extract(compaction["transcript"])
+        missing = [item for item in before if item not in after]
+        lost += len(missing)
+        recalls.append(1 - len(missing) / len(before) if before else 1.0)
+    elapsed = time.perf_counter() - started
+    stats = compactor.stats()
+    print(f"{label}: {stats['original_tokens']} -> {stats['compacted_tokens']} tokens "
+          f"(ratio {stats['ratio']}, median per meeting {statistics.median(ratios):.3f}), "
+          f"{stats['dropped_turns']} turns dropped, {elapsed / len(corpus) * 1000:.2f}ms per meeting")
+    print(f"{'':{len(label)}}  action items recalled: {statistics.mean(recalls):.1%} ({lost} lost)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcript compaction benchmark")
+    parser.add_argument("--meetings", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=400)
+    parser.add_argument("--budget", type=int, default=2500, help="Tight token budget for the second pass")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    corpus = [make_meeting(rng, args.turns) for _ in range(args.meetings)]
+    planted = sum(len(items) for _, items in corpus)
+    print(f"Corpus: {args.meetings} meetings, {args.turns} segments each, {planted} planted action items")
+
+    def compactor(budget: int) -> TranscriptCompactor:
+        return TranscriptCompactor(True, settings.TRANSCRIPT_BACKCHANNEL_PHRASES, settings.TRANSCRIPT_INLINE_FILLERS, budget)
+
+    run(compactor(0), corpus, "compaction")
+    run(compactor(args.budget), corpus, f"budget {args.budget}")
+
+
+if __name__ == "__main__":
+    main()
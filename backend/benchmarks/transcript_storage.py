@@ -0,0 +1,125 @@
+"""
+Bytes saved per meeting by storing raw transcripts as compressed JSON.
+
+Without --database-url, seeds a throwaway SQLite database at revision
+0005_meeting_tasks_version with str()-formatted Vexa payloads (the old
+storage), runs the 0006_compressed_raw_transcripts migration and reports.
+With --database-url, reports on an existing, already-migrated database.
+
+Usage (from the backend directory):
+    python benchmarks/transcript_storage.py --meetings 200 --segments 2000
+    python benchmarks/transcript_storage.py --database-url sqlite:///./meeting_notes.db
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from _common import set_placeholder_settings
+
+_db_dir = tempfile.mkdtemp(prefix="bench_raw_")
+_args = argparse.ArgumentParser(add_help=False)
+_args.add_argument("--database-url")
+_known, _ = _args.parse_known_args()
+os.environ["DATABASE_URL"] = _known.database_url or f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+set_placeholder_settings()
+
+from alembic import command  # noqa: E402
+from sqlalchemy import create_engine, insert, select, table, column, Text, Integer  # noqa: E402
+from app.models.database import get_alembic_config, decode_raw_transcript, Meeting, Transcript  # noqa: E402
+
+SPEAKERS = ["Alice", "Bob", "Carol", "Dan"]
+WORDS = "we should ship the report by friday and review the budget numbers with finance next week".split()
+
+legacy_transcripts = table(
+    "transcripts",
+    column("meeting_id", Integer),
+    column("raw_transcript", Text),
+)
+
+
+def vexa_payload(rng: random.Random, segments: int) -> dict:
+    start = datetime(2026, 1, 1, 9, 0)
+    return {
+        "id": rng.randint(1, 10 ** 6),
+        "platform": "google_meet",
+        "status": "completed",
+        "segments": [
+            {
+                "start": i * 4.0,
+                "end": i * 4.0 + 3.5,
+                "text": " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 20))),
+                "language": "en",
+                "speaker": rng.choice(SPEAKERS),
+                "absolute_start_time": (start + timedelta(seconds=i * 4)).isoformat(),
+                "absolute_end_time": (start + timedelta(seconds=i * 4 + 3.5)).isoformat(),
+                "completed": True
+            } for i in range(segments)
+        ]
+    }
+
+
+def seed_legacy(engine, meetings: int, segments: int):
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(insert(Meeting), [
+            {
+                "id": i + 1,
+                "meeting_id": f"bench-{i:05d}",
+                "meeting_url": f"https://meet.google.com/bench-{i:05d}",
+                "status": "completed",
+                "created_at": datetime(2026, 1, 1) + timedelta(hours=i)
+            } for i in range(meetings)
+        ])
+        conn.execute(insert(legacy_transcripts), [
+            {"meeting_id": i + 1, "raw_transcript": str(vexa_payload(rng, rng.randint(segments // 2, segments)))}
+            for i in range(meetings)
+        ])
+
+
+def report(engine):
+    query = (
+        select(Meeting.meeting_id, Transcript.raw_transcript_data)
+        .join(Transcript, Transcript.meeting_id == Meeting.id)
+        .where(Transcript.raw_transcript_data.isnot(None))
+        .order_by(Meeting.id)
+    )
+    total_legacy = total_stored = 0
+    print(f"{'meeting':<24} {'str() bytes':>12} {'stored':>10} {'saved':>10} {'ratio':>7}")
+    with engine.connect() as conn:
+        for meeting_id, data in conn.execute(query):
+            # What the old str(raw_transcript) column held for the same payload
+            legacy = len(str(decode_raw_transcript(data)).encode("utf-8"))
+            stored = len(data)
+            total_legacy += legacy
+            total_stored += stored
+            print(f"{meeting_id:<24} {legacy:12d} {stored:10d} {legacy - stored:10d} {legacy / stored:6.1f}x")
+
+    if total_stored:
+        print(f"{'total':<24} {total_legacy:12d} {total_stored:10d} {total_legacy - total_stored:10d} "
+              f"{total_legacy / total_stored:6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Raw transcript storage report")
+    parser.add_argument("--database-url", help="Report on an existing database instead of seeding one")
+    parser.add_argument("--meetings", type=int, default=200)
+    parser.add_argument("--segments", type=int, default=2000, help="Maximum segments per transcript")
+    args = parser.parse_args()
+
+    engine = create_engine(os.environ["DATABASE_URL"])
+
+    if not args.database_url:
+        command.upgrade(get_alembic_config(), "0005_meeting_tasks_version")
+        seed_legacy(engine, args.meetings, args.segments)
+        started = time.perf_counter()
+        command.upgrade(get_alembic_config(), "head")
+        print(f"Migration took {time.perf_counter() - started:.1f}s")
+
+    report(engine)
+
+
+if __name__ == "__main__":
+    main()
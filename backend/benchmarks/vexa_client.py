@@ -0,0 +1,125 @@
+"""
+Per-call latency of VexaService against a local mock Vexa server.
+
+Starts a small mock of the Vexa API on localhost and compares the old
+behaviour (a fresh httpx.AsyncClient per call) with the shared, pooled
+client, sequentially and with concurrent callers. A fraction of mock
+responses can be made to fail with 503 to exercise the retry path.
+
+Usage (from the backend directory):
+    python benchmarks/vexa_client.py --calls 500 --concurrency 20 --fail-rate 0.02
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import time
+
+from _common import percentile, set_placeholder_settings
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+set_placeholder_settings()
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Response  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.services.vexa_service import VexaService  # noqa: E402
+
+SEGMENTS = [{"speaker": f"Speaker {i % 4}", "text": f"Segment number {i} of the meeting"} for i in range(200)]
+
+
+def create_mock_vexa(fail_rate: float) -> FastAPI:
+    mock = FastAPI()
+
+    def maybe_fail():
+        if random.random() < fail_rate:
+            return Response(status_code=503, headers={"Retry-After": "0"})
+        return None
+
+    @mock.post("/bots")
+    async def start_bot(payload: dict):
+        return maybe_fail() or {"id": 1, "native_meeting_id": payload.get("native_meeting_id")}
+
+    @mock.get("/transcripts/google_meet/{meeting_id}")
+    async def transcript(meeting_id: str):
+        return maybe_fail() or {"segments": SEGMENTS}
+
+    @mock.delete("/bots/google_meet/{meeting_id}")
+    async def delete_bot(meeting_id: str):
+        return maybe_fail() or {"status": "stopping"}
+
+    return mock
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def fresh_client_call(base_url: str, headers: dict, meeting_id: str):
+    """What get_transcript used to do: one client (and connection) per call, no retries"""
+    async with httpx.AsyncClient() as client:
+        response = await client.get(f"{base_url}/transcripts/google_meet/{meeting_id}", headers=headers)
+        return response.json() if response.is_success else None
+
+
+async def timed(calls: int, concurrency: int, make_call):
+    semaphore = asyncio.Semaphore(concurrency)
+    samples = []
+
+    async def one(i):
+        async with semaphore:
+            start = time.perf_counter()
+            await make_call(i)
+            samples.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one(i) for i in range(calls)))
+    return samples
+
+
+def report(name, samples):
+    print(f"{name:<28} mean={statistics.mean(samples) * 1000:7.2f}ms "
+          f"p50={statistics.median(samples) * 1000:7.2f}ms p99={percentile(samples, 0.99) * 1000:7.2f}ms")
+
+
+async def run(calls: int, concurrency: int, fail_rate: float):
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = uvicorn.Server(uvicorn.Config(create_mock_vexa(fail_rate), port=port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    settings.VEXA_RETRY_BACKOFF_SECONDS = 0.01
+    service = VexaService()
+    service.base_url = base_url
+    await service.start()
+
+    try:
+        for level in (1, concurrency):
+            fresh = await timed(calls, level, lambda i: fresh_client_call(base_url, service.headers, f"m-{i}"))
+            pooled = await timed(calls, level, lambda i: service.get_transcript(f"m-{i}"))
+            report(f"fresh client  (c={level})", fresh)
+            report(f"pooled client (c={level})", pooled)
+        print("per-endpoint metrics:", service.get_metrics())
+    finally:
+        await service.close()
+        server.should_exit = True
+        await server_task
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VexaService client latency benchmark")
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of mock responses returning 503")
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.concurrency, args.fail_rate))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,55 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from app.core.config import settings
-from app.api.routes import meetings, tasks, transcripts, exports
+from app.models.database import init_db, engine
+from app.services.job_service import job_queue
+from app.services.vexa_service import vexa_service
+from app.services.live_ingestion_service import live_ingestion
+from app.services.pdf_service import pdf_service
+from app.services.artifact_service import artifact_sink
+from app.services.cache_service import extraction_cache
+from app.services.dedup_service import task_dedup
+from app.services.llm_service import llm_service
+from app.services.metrics_service import MetricsMiddleware
+from app.api.routes import meetings, tasks, transcripts, exports, search
+from app.api.pagination import NEXT_CURSOR_HEADER
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup
+    if settings.DB_MIGRATE_ON_STARTUP:
+        await init_db()
+    # LangChain and the Gemini SDK are imported lazily; load them off the event loop once we're serving
+    llm_warm_up = asyncio.create_task(asyncio.to_thread(llm_service.warm_up)) if settings.LLM_PRELOAD else None
+    await vexa_service.start()
+    await artifact_sink.start()
+    await extraction_cache.start()
+    await task_dedup.start()
+    await job_queue.start()
+    await live_ingestion.start()
+    yield
+    # Shutdown
+    await live_ingestion.stop()
+    if llm_warm_up is not None:
+        await asyncio.gather(llm_warm_up, return_exceptions=True)
+    await job_queue.stop()
+    await task_dedup.stop()
+    await extraction_cache.stop()
+    await vexa_service.close()
+    pdf_service.shutdown()
+    await artifact_sink.stop()
+    await engine.dispose()
+
 
 app = FastAPI(
     title="Meeting Notes Processor",
     description="API for processing meeting transcripts and extracting action items",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -16,13 +59,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+# Request latency by route (outermost, so it includes the other middleware)
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(meetings.router, prefix="/api/meetings", tags=["meetings"])
 app.include_router(tasks.router, prefix="/api/tasks", tags=["tasks"])
 app.include_router(transcripts.router, prefix="/api/transcripts", tags=["transcripts"])
 app.include_router(exports.router, prefix="/api/exports", tags=["exports"])
+app.include_router(search.router, prefix="/api/search", tags=["search"])
 
 @app.get("/")
 async def root():
@@ -30,4 +78,8 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
\ No newline at end of file
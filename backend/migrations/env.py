@@ -0,0 +1,81 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from app.core.config import settings
+from app.models.database import Base
+
+config = context.config
+
+# When run from init_db the app passes its own connection and logging is already set up
+connection = config.attributes.get("connection")
+
+if connection is None and config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# FTS5 search tables (and their shadow tables) are created with raw SQL in 0007_search_index
+FTS_TABLE_PREFIXES = ("transcripts_fts", "tasks_fts")
+
+
+def include_name(name, type_, parent_names) -> bool:
+    return not (type_ == "table" and name.startswith(FTS_TABLE_PREFIXES))
+
+
+def get_sync_database_url() -> str:
+    """Alembic runs synchronously, so strip any async driver from DATABASE_URL"""
+    url = settings.DATABASE_URL
+    for async_driver, sync_driver in (
+        ("sqlite+aiosqlite://", "sqlite://"),
+        ("postgresql+asyncpg://", "postgresql://"),
+        ("mysql+aiomysql://", "mysql://"),
+    ):
+        if url.startswith(async_driver):
+            return url.replace(async_driver, sync_driver, 1)
+    return url
+
+
+def run_migrations_offline() -> None:
+    """Emit SQL to stdout instead of running against a database."""
+    context.configure(
+        url=get_sync_database_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+        include_name=include_name,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection) -> None:
+    # Batch mode lets ALTER-style operations work on SQLite
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=True,
+        include_name=include_name,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    connectable = create_engine(get_sync_database_url(), poolclass=pool.NullPool)
+    with connectable.connect() as conn:
+        do_run_migrations(conn)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,72 @@
+"""Baseline schema: meetings, transcripts and tasks
+
+Revision ID: 0001_baseline_schema
+Revises:
+Create Date: 2026-10-17 00:00:00.000000
+
+Databases created by the old import-time create_all already have these
+tables, so each one is only created when it is missing.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_baseline_schema'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "meetings" not in existing:
+        op.create_table(
+            "meetings",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("meeting_id", sa.String()),
+            sa.Column("meeting_url", sa.String()),
+            sa.Column("bot_name", sa.String()),
+            sa.Column("status", sa.String()),
+            sa.Column("created_at", sa.DateTime()),
+            sa.Column("completed_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_meetings_id", "meetings", ["id"])
+        op.create_index("ix_meetings_meeting_id", "meetings", ["meeting_id"], unique=True)
+
+    if "transcripts" not in existing:
+        op.create_table(
+            "transcripts",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("meeting_id", sa.Integer(), sa.ForeignKey("meetings.id")),
+            sa.Column("raw_transcript", sa.Text()),
+            sa.Column("processed_transcript", sa.Text()),
+            sa.Column("additional_context", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime()),
+        )
+        op.create_index("ix_transcripts_id", "transcripts", ["id"])
+
+    if "tasks" not in existing:
+        op.create_table(
+            "tasks",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("meeting_id", sa.Integer(), sa.ForeignKey("meetings.id")),
+            sa.Column("assignee_name", sa.String()),
+            sa.Column("task_description", sa.Text()),
+            sa.Column("deadline", sa.String(), nullable=True),
+            sa.Column("priority", sa.String(), nullable=True),
+            sa.Column("is_completed", sa.Boolean()),
+            sa.Column("created_at", sa.DateTime()),
+        )
+        op.create_index("ix_tasks_id", "tasks", ["id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("tasks")
+    op.drop_table("transcripts")
+    op.drop_table("meetings")
@@ -0,0 +1,70 @@
+"""LLM cache, processing jobs and live-ingestion columns
+
+Revision ID: 0002_cache_jobs_live_ingestion
+Revises: 0001_baseline_schema
+Create Date: 2026-10-17 00:00:01.000000
+
+These were previously created by create_all, so existing objects are skipped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_cache_jobs_live_ingestion'
+down_revision: Union[str, Sequence[str], None] = '0001_baseline_schema'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    existing = set(inspector.get_table_names())
+
+    if "llm_cache" not in existing:
+        op.create_table(
+            "llm_cache",
+            sa.Column("key", sa.String(64), primary_key=True),
+            sa.Column("value", sa.Text()),
+            sa.Column("created_at", sa.DateTime()),
+        )
+        op.create_index("ix_llm_cache_created_at", "llm_cache", ["created_at"])
+
+    if "processing_jobs" not in existing:
+        op.create_table(
+            "processing_jobs",
+            sa.Column("id", sa.String(32), primary_key=True),
+            sa.Column("job_type", sa.String()),
+            sa.Column("meeting_id", sa.Integer(), sa.ForeignKey("meetings.id")),
+            sa.Column("status", sa.String()),
+            sa.Column("payload", sa.Text(), nullable=True),
+            sa.Column("result", sa.Text(), nullable=True),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime()),
+            sa.Column("started_at", sa.DateTime(), nullable=True),
+            sa.Column("finished_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_processing_jobs_meeting_id", "processing_jobs", ["meeting_id"])
+        op.create_index("ix_processing_jobs_status", "processing_jobs", ["status"])
+
+    transcript_columns = {column["name"] for column in inspector.get_columns("transcripts")}
+    with op.batch_alter_table("transcripts") as batch_op:
+        if "segments_ingested" not in transcript_columns:
+            batch_op.add_column(sa.Column("segments_ingested", sa.Integer(), server_default="0"))
+        if "extracted_chars" not in transcript_columns:
+            batch_op.add_column(sa.Column("extracted_chars", sa.Integer(), server_default="0"))
+        if "rolling_tasks" not in transcript_columns:
+            batch_op.add_column(sa.Column("rolling_tasks", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("transcripts") as batch_op:
+        batch_op.drop_column("rolling_tasks")
+        batch_op.drop_column("extracted_chars")
+        batch_op.drop_column("segments_ingested")
+    op.drop_table("processing_jobs")
+    op.drop_table("llm_cache")
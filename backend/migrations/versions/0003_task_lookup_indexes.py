@@ -0,0 +1,42 @@
+"""Indexes for task and transcript lookups
+
+Revision ID: 0003_task_lookup_indexes
+Revises: 0002_cache_jobs_live_ingestion
+Create Date: 2026-10-17 00:00:02.000000
+
+Adds indexes on tasks(meeting_id), tasks(assignee_name, is_completed) and
+tasks(deadline), and makes transcripts(meeting_id) unique. Older versions
+inserted a new transcript row on every re-process, so duplicates are
+collapsed to the most recent row first.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_task_lookup_indexes'
+down_revision: Union[str, Sequence[str], None] = '0002_cache_jobs_live_ingestion'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_tasks_meeting_id", "tasks", ["meeting_id"])
+    op.create_index("ix_tasks_assignee_name_is_completed", "tasks", ["assignee_name", "is_completed"])
+    op.create_index("ix_tasks_deadline", "tasks", ["deadline"])
+
+    op.execute(
+        "DELETE FROM transcripts WHERE meeting_id IS NOT NULL AND id NOT IN "
+        "(SELECT MAX(id) FROM transcripts WHERE meeting_id IS NOT NULL GROUP BY meeting_id)"
+    )
+    op.create_index("ix_transcripts_meeting_id", "transcripts", ["meeting_id"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_transcripts_meeting_id", table_name="transcripts")
+    op.drop_index("ix_tasks_deadline", table_name="tasks")
+    op.drop_index("ix_tasks_assignee_name_is_completed", table_name="tasks")
+    op.drop_index("ix_tasks_meeting_id", table_name="tasks")
@@ -0,0 +1,31 @@
+"""Indexes for keyset pagination of meetings and tasks
+
+Revision ID: 0004_keyset_pagination_indexes
+Revises: 0003_task_lookup_indexes
+Create Date: 2026-10-17 00:00:03.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_keyset_pagination_indexes'
+down_revision: Union[str, Sequence[str], None] = '0003_task_lookup_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_meetings_created_at_id", "meetings", ["created_at", "id"])
+    op.create_index("ix_meetings_status_created_at_id", "meetings", ["status", "created_at", "id"])
+    op.create_index("ix_tasks_meeting_id_created_at_id", "tasks", ["meeting_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tasks_meeting_id_created_at_id", table_name="tasks")
+    op.drop_index("ix_meetings_status_created_at_id", table_name="meetings")
+    op.drop_index("ix_meetings_created_at_id", table_name="meetings")
@@ -0,0 +1,30 @@
+"""Task-set version on meetings for export caching
+
+Revision ID: 0005_meeting_tasks_version
+Revises: 0004_keyset_pagination_indexes
+Create Date: 2026-10-17 00:00:04.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_meeting_tasks_version'
+down_revision: Union[str, Sequence[str], None] = '0004_keyset_pagination_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("meetings") as batch_op:
+        batch_op.add_column(sa.Column("tasks_version", sa.Integer(), server_default="0"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("meetings") as batch_op:
+        batch_op.drop_column("tasks_version")
@@ -0,0 +1,111 @@
+"""Store raw transcripts as compressed canonical JSON
+
+Revision ID: 0006_compressed_raw_transcripts
+Revises: 0005_meeting_tasks_version
+Create Date: 2026-10-17 00:00:05.000000
+
+"""
+import ast
+import json
+import zlib
+from typing import Any, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_compressed_raw_transcripts'
+down_revision: Union[str, Sequence[str], None] = '0005_meeting_tasks_version'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+transcripts = sa.table(
+    "transcripts",
+    sa.column("id", sa.Integer),
+    sa.column("raw_transcript", sa.Text),
+    sa.column("raw_transcript_data", sa.LargeBinary),
+)
+
+
+def _parse_legacy(text: str) -> Any:
+    """Old rows hold str() of the Vexa payload (a Python repr), or occasionally JSON"""
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        # Not recoverable as structured data; keep the text itself
+        return text
+
+
+def _encode(raw: Any) -> bytes:
+    # Frozen copy of encode_raw_transcript so the migration doesn't change with the app
+    canonical = json.dumps(raw, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return zlib.compress(canonical.encode("utf-8"))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("transcripts") as batch_op:
+        batch_op.add_column(sa.Column("raw_transcript_data", sa.LargeBinary(), nullable=True))
+
+    conn = op.get_bind()
+    before = after = converted = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(transcripts.c.id, transcripts.c.raw_transcript)
+            .where(transcripts.c.id > last_id, transcripts.c.raw_transcript.isnot(None))
+            .order_by(transcripts.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        updates = []
+        for row_id, text in rows:
+            data = _encode(_parse_legacy(text))
+            before += len(text.encode("utf-8"))
+            after += len(data)
+            updates.append({"row_id": row_id, "data": data})
+        conn.execute(
+            transcripts.update()
+            .where(transcripts.c.id == sa.bindparam("row_id"))
+            .values(raw_transcript_data=sa.bindparam("data")),
+            updates
+        )
+        converted += len(rows)
+        last_id = rows[-1][0]
+
+    with op.batch_alter_table("transcripts") as batch_op:
+        batch_op.drop_column("raw_transcript")
+
+    if converted:
+        print(f"Compressed {converted} raw transcripts: {before} -> {after} bytes "
+              f"(run VACUUM to return the space to the filesystem on SQLite)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("transcripts") as batch_op:
+        batch_op.add_column(sa.Column("raw_transcript", sa.Text(), nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.select(transcripts.c.id, transcripts.c.raw_transcript_data)
+        .where(transcripts.c.raw_transcript_data.isnot(None))
+    ).all()
+    for row_id, data in rows:
+        # Restored as JSON text rather than the original Python repr
+        conn.execute(
+            transcripts.update()
+            .where(transcripts.c.id == row_id)
+            .values(raw_transcript=zlib.decompress(data).decode("utf-8"))
+        )
+
+    with op.batch_alter_table("transcripts") as batch_op:
+        batch_op.drop_column("raw_transcript_data")
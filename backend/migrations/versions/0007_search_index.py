@@ -0,0 +1,94 @@
+"""Full-text search: transcript speakers and FTS5 indexes
+
+Revision ID: 0007_search_index
+Revises: 0006_compressed_raw_transcripts
+Create Date: 2026-10-17 00:00:06.000000
+
+On SQLite, transcripts_fts and tasks_fts are external-content FTS5 tables
+kept in sync by triggers. A later batch migration that recreates the
+transcripts or tasks table drops those triggers and must create them again.
+Other databases use the in-process index in search_service instead.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_search_index'
+down_revision: Union[str, Sequence[str], None] = '0006_compressed_raw_transcripts'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+transcripts = sa.table(
+    "transcripts",
+    sa.column("id", sa.Integer),
+    sa.column("processed_transcript", sa.Text),
+    sa.column("speakers", sa.Text),
+)
+
+# (fts table, content table, indexed columns)
+FTS_TABLES = [
+    ("transcripts_fts", "transcripts", ("processed_transcript", "speakers")),
+    ("tasks_fts", "tasks", ("task_description", "assignee_name")),
+]
+
+
+def _speakers_from_text(processed: str) -> str:
+    """Speaker names from 'Speaker: text' lines, for rows written before the speakers column"""
+    names = []
+    for line in (processed or "").split("\n"):
+        speaker, sep, _ = line.partition(": ")
+        if sep and speaker.strip():
+            names.append(speaker.strip())
+    return ", ".join(dict.fromkeys(names))
+
+
+def _fts_statements(fts: str, content: str, columns: Sequence[str]) -> Sequence[str]:
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_values});"
+    insert_new = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{content}', content_rowid='id', "
+        f"tokenize='porter unicode61')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {content} BEGIN {insert_new} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {content} BEGIN {delete_old} END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {content} BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("transcripts") as batch_op:
+        batch_op.add_column(sa.Column("speakers", sa.Text(), nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.select(transcripts.c.id, transcripts.c.processed_transcript)).all()
+    if rows:
+        conn.execute(
+            transcripts.update()
+            .where(transcripts.c.id == sa.bindparam("row_id"))
+            .values(speakers=sa.bindparam("names")),
+            [{"row_id": row_id, "names": _speakers_from_text(processed)} for row_id, processed in rows]
+        )
+
+    if conn.dialect.name == "sqlite":
+        for fts, content, columns in FTS_TABLES:
+            for statement in _fts_statements(fts, content, columns):
+                op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        for fts, _, _ in FTS_TABLES:
+            for suffix in ("ai", "ad", "au"):
+                op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {fts}")
+
+    with op.batch_alter_table("transcripts") as batch_op:
+        batch_op.drop_column("speakers")
@@ -0,0 +1,43 @@
+"""Link near-duplicate tasks to the open task they repeat
+
+Revision ID: 0008_task_duplicate_links
+Revises: 0007_search_index
+Create Date: 2026-10-17 00:00:07.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_task_duplicate_links'
+down_revision: Union[str, Sequence[str], None] = '0007_search_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Plain ADD COLUMN (no foreign key) so SQLite doesn't rebuild tasks and drop the search triggers
+    op.add_column("tasks", sa.Column("duplicate_of_id", sa.Integer(), nullable=True))
+    op.create_index(op.f("ix_tasks_duplicate_of_id"), "tasks", ["duplicate_of_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_tasks_duplicate_of_id"), table_name="tasks")
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("duplicate_of_id")
+
+    if op.get_bind().dialect.name == "sqlite":
+        # The batch rebuild dropped the tasks_fts triggers from 0007_search_index
+        delete_old = ("INSERT INTO tasks_fts(tasks_fts, rowid, task_description, assignee_name) "
+                      "VALUES ('delete', old.id, old.task_description, old.assignee_name);")
+        insert_new = ("INSERT INTO tasks_fts(rowid, task_description, assignee_name) "
+                      "VALUES (new.id, new.task_description, new.assignee_name);")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN {insert_new} END")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN {delete_old} END")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF task_description, assignee_name "
+                   f"ON tasks BEGIN {delete_old} {insert_new} END")
@@ -0,0 +1,49 @@
+"""Job ownership and heartbeats, and one unfinished job per meeting
+
+Revision ID: 0009_job_ownership
+Revises: 0008_task_duplicate_links
+Create Date: 2026-10-17 00:00:08.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_job_ownership'
+down_revision: Union[str, Sequence[str], None] = '0008_task_duplicate_links'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UNFINISHED = sa.text("status IN ('queued', 'running')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("processing_jobs", sa.Column("owner", sa.String(), nullable=True))
+    op.add_column("processing_jobs", sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+
+    # Enqueueing could race and leave two unfinished jobs for a meeting; keep the oldest
+    op.execute(
+        "UPDATE processing_jobs SET status = 'failed', error = 'Superseded by an earlier job for the same meeting' "
+        "WHERE status IN ('queued', 'running') AND EXISTS ("
+        "SELECT 1 FROM processing_jobs AS earlier "
+        "WHERE earlier.meeting_id = processing_jobs.meeting_id AND earlier.job_type = processing_jobs.job_type "
+        "AND earlier.status IN ('queued', 'running') "
+        "AND (earlier.created_at < processing_jobs.created_at "
+        "OR (earlier.created_at = processing_jobs.created_at AND earlier.id < processing_jobs.id)))"
+    )
+    op.create_index(
+        "uq_processing_jobs_unfinished", "processing_jobs", ["meeting_id", "job_type"], unique=True,
+        sqlite_where=UNFINISHED, postgresql_where=UNFINISHED
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_processing_jobs_unfinished", table_name="processing_jobs")
+    with op.batch_alter_table("processing_jobs") as batch_op:
+        batch_op.drop_column("heartbeat_at")
+        batch_op.drop_column("owner")
@@ -0,0 +1,79 @@
+"""
+Re-run task extraction over stored transcripts, e.g. after changing the extraction prompt.
+
+Progress is checkpointed after every written batch, so an interrupted run
+resumes where it stopped. With --dry-run nothing is written; the new tasks
+are diffed against the stored ones instead (LLM results are still cached,
+so a real run afterwards reuses them).
+
+Usage (from the backend directory):
+    python reprocess.py --dry-run --limit 20
+    python reprocess.py --concurrency 16 --batch-size 100
+    python reprocess.py --retry-failed
+"""
+import argparse
+import asyncio
+import json
+from app.core.config import settings
+from app.models.database import engine
+from app.services.artifact_service import artifact_sink
+from app.services.backfill_service import Backfill
+
+
+def print_diff(meeting_id: str, diff):
+    print(f"{meeting_id}: +{len(diff['added'])} -{len(diff['removed'])} ={len(diff['unchanged'])}")
+    for sign, kind in (("+", "added"), ("-", "removed")):
+        for task in diff[kind]:
+            print(f"  {sign} {task['assignee_name']}: {task['task_description']}")
+
+
+async def run(args):
+    backfill = Backfill(
+        checkpoint_path=args.checkpoint,
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        flush_seconds=args.flush_seconds,
+        dry_run=args.dry_run,
+        use_cache=not args.no_cache,
+        meeting_ids=args.meeting,
+        limit=args.limit,
+        report_seconds=args.report_seconds,
+        on_diff=print_diff if args.dry_run else None
+    )
+    backfill.resume(restart=args.restart, retry_failed=args.retry_failed)
+    try:
+        stats = await backfill.run()
+    finally:
+        # Artifacts are written in the background; flush the ones still queued
+        await artifact_sink.stop()
+        await engine.dispose()
+
+    print(f"✅ {backfill.format_report()}")
+    if backfill.checkpoint.failed:
+        print(f"❌ {len(backfill.checkpoint.failed)} meetings failed; rerun with --retry-failed")
+    if not args.dry_run and stats["meetings"]:
+        print("Restart running API processes: their duplicate-detection (and in-memory search) indexes don't see these changes")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(stats, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-run task extraction over stored transcripts")
+    parser.add_argument("--concurrency", type=int, default=settings.BACKFILL_CONCURRENCY, help="Meetings extracted at once")
+    parser.add_argument("--batch-size", type=int, default=settings.BACKFILL_BATCH_SIZE, help="Meetings written per transaction")
+    parser.add_argument("--flush-seconds", type=float, default=30.0, help="Write a partial batch after this long")
+    parser.add_argument("--checkpoint", default=settings.BACKFILL_CHECKPOINT_PATH)
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start from the first meeting")
+    parser.add_argument("--retry-failed", action="store_true", help="Only re-run meetings that failed in earlier runs")
+    parser.add_argument("--dry-run", action="store_true", help="Diff new tasks against stored ones without writing")
+    parser.add_argument("--no-cache", action="store_true", help="Don't reuse cached LLM results")
+    parser.add_argument("--meeting", action="append", help="Only this meeting id (repeatable)")
+    parser.add_argument("--limit", type=int, help="Stop after this many meetings")
+    parser.add_argument("--report-seconds", type=float, default=10.0, help="Progress report interval")
+    parser.add_argument("--report", help="Write the final throughput stats to this JSON file")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
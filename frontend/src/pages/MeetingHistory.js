@@ -13,7 +13,9 @@ import {
 
 const MeetingHistory = () => {
   const [meetings, setMeetings] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState('');
 
   useEffect(() => {
@@ -22,8 +24,9 @@ const MeetingHistory = () => {
 
   const fetchMeetings = async () => {
     try {
-      const data = await meetingsAPI.getAllMeetings();
-      setMeetings(data);
+      const page = await meetingsAPI.getMeetingsPage();
+      setMeetings(page.meetings);
+      setNextCursor(page.nextCursor);
     } catch (err) {
       setError('Failed to load meeting history. Please try again.');
       console.error('Error fetching meetings:', err);
@@ -32,6 +35,21 @@ const MeetingHistory = () => {
     }
   };
 
+  const fetchMoreMeetings = async () => {
+    if (!nextCursor) return;
+
+    setLoadingMore(true);
+    try {
+      const page = await meetingsAPI.getMeetingsPage(nextCursor);
+      setMeetings((current) => [...current, ...page.meetings]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error('Error fetching more meetings:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const getStatusIcon = (status) => {
     switch (status) {
       case 'completed':
@@ -189,6 +207,19 @@ const MeetingHistory = () => {
               </div>
             </div>
           ))}
+
+          {nextCursor && (
+            <div className="text-center pt-4">
+              <button
+                onClick={fetchMoreMeetings}
+                disabled={loadingMore}
+                className="btn-secondary inline-flex items-center"
+              >
+                {loadingMore && <Loader2 className="h-4 w-4 mr-2 animate-spin" />}
+                Load More
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
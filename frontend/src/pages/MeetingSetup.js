@@ -11,6 +11,7 @@ const MeetingSetup = () => {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
   const [meetingData, setMeetingData] = useState(null);
+  const [streamedTasks, setStreamedTasks] = useState([]);
   const navigate = useNavigate();
 
   const validateMeetingUrl = (url) => {
@@ -42,11 +43,13 @@ const MeetingSetup = () => {
 
     setLoading(true);
     setError('');
+    setStreamedTasks([]);
 
     try {
       await transcriptsAPI.processTranscript(
         meetingData.meeting_id, 
-        additionalContext
+        additionalContext,
+        (task) => setStreamedTasks((tasks) => [...tasks, task])
       );
       
       // Navigate to dashboard
@@ -235,6 +238,17 @@ const MeetingSetup = () => {
             </button>
           </div>
 
+          {loading && streamedTasks.length > 0 && (
+            <div className="bg-green-50 border border-green-200 rounded-lg p-4">
+              <h3 className="font-medium text-green-900 mb-2">Tasks found so far ({streamedTasks.length}):</h3>
+              <ul className="text-sm text-green-800 space-y-1">
+                {streamedTasks.map((task, index) => (
+                  <li key={index}>• <span className="font-medium">{task.assignee_name}</span>: {task.task_description}</li>
+                ))}
+              </ul>
+            </div>
+          )}
+
           <div className="bg-amber-50 border border-amber-200 rounded-lg p-4">
             <h3 className="font-medium text-amber-900 mb-2">Instructions:</h3>
             <ol className="text-sm text-amber-800 space-y-1 list-decimal list-inside">
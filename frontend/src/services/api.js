@@ -2,6 +2,9 @@ import axios from 'axios';
 
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000/api';
 
+// Paginated list endpoints return the next page's cursor in this header
+const NEXT_CURSOR_HEADER = 'x-next-cursor';
+
 const api = axios.create({
   baseURL: API_BASE_URL,
   headers: {
@@ -34,18 +37,90 @@ export const meetingsAPI = {
     return response.data;
   },
 
+  getMeetingsPage: async (cursor = null, limit = 50) => {
+    const response = await api.get('/meetings/', {
+      params: { limit, ...(cursor ? { cursor } : {}) },
+    });
+    return {
+      meetings: response.data,
+      nextCursor: response.headers[NEXT_CURSOR_HEADER] || null,
+    };
+  },
+
   getMeeting: async (meetingId) => {
     const response = await api.get(`/meetings/${meetingId}`);
     return response.data;
   },
 };
 
+const JOB_POLL_INTERVAL_MS = 2000;
+
+const jobError = (message) => {
+  const error = new Error(message);
+  error.response = { data: { detail: message } };
+  return error;
+};
+
 // Transcripts API
 export const transcriptsAPI = {
-  processTranscript: async (meetingId, additionalContext = '') => {
+  processTranscript: async (meetingId, additionalContext = '', onTask = null) => {
     const response = await api.post(`/transcripts/${meetingId}/process`, {
       additional_context: additionalContext,
     });
+
+    // Processing runs as a background job; follow its events, or poll if they aren't available
+    const { job_id: jobId } = response.data;
+    if (typeof EventSource !== 'undefined') {
+      try {
+        return await transcriptsAPI.followJob(jobId, onTask);
+      } catch (err) {
+        if (err.response) {
+          throw err;
+        }
+      }
+    }
+    return transcriptsAPI.waitForJob(jobId);
+  },
+
+  // Resolves with the job result; onTask receives each task as the LLM generates it
+  followJob: (jobId, onTask) => new Promise((resolve, reject) => {
+    const events = new EventSource(`${API_BASE_URL}/transcripts/jobs/${jobId}/events`);
+    events.addEventListener('task', (event) => {
+      if (onTask) {
+        onTask(JSON.parse(event.data));
+      }
+    });
+    events.addEventListener('status', (event) => {
+      const job = JSON.parse(event.data);
+      if (job.status === 'completed') {
+        events.close();
+        resolve(job.result);
+      } else if (job.status === 'failed') {
+        events.close();
+        reject(jobError(job.error));
+      }
+    });
+    events.onerror = () => {
+      events.close();
+      reject(new Error('Job event stream unavailable'));
+    };
+  }),
+
+  waitForJob: async (jobId) => {
+    for (;;) {
+      const job = await transcriptsAPI.getJob(jobId);
+      if (job.status === 'completed') {
+        return job.result;
+      }
+      if (job.status === 'failed') {
+        throw jobError(job.error);
+      }
+      await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    }
+  },
+
+  getJob: async (jobId) => {
+    const response = await api.get(`/transcripts/jobs/${jobId}`);
     return response.data;
   },
 
@@ -58,8 +133,17 @@ export const transcriptsAPI = {
 // Tasks API
 export const tasksAPI = {
   getTasksForMeeting: async (meetingId) => {
-    const response = await api.get(`/tasks/${meetingId}`);
-    return response.data;
+    // The dashboard shows every task, so follow the pagination cursor to the end
+    const tasks = [];
+    let cursor = null;
+    do {
+      const response = await api.get(`/tasks/${meetingId}`, {
+        params: { limit: 500, ...(cursor ? { cursor } : {}) },
+      });
+      tasks.push(...response.data);
+      cursor = response.headers[NEXT_CURSOR_HEADER] || null;
+    } while (cursor);
+    return tasks;
   },
 
   modifyTasks: async (meetingId, modificationRequest) => {